@@ -0,0 +1,141 @@
+"""Memory benchmarks over synthetic LastFM histories.
+
+Run with `python -m benchmarks.memory [scrobbles]`. Each benchmark decodes
+the same synthetic `user.getRecentTracks` pages through a different path of
+the package and reports the memory retained by the final result. The full
+items of a long history do not fit in memory, so they are only decoded for
+the first `FULL_SCROBBLES` scrobbles.
+"""
+
+import json
+import sys
+import tracemalloc
+import zlib
+from typing import Callable
+
+from pylastfmapi.models import Scrobble, T_Model, parse_result
+
+LIMIT = 500
+ARTISTS = 2_000
+TRACKS_PER_ARTIST = 20
+FULL_SCROBBLES = 100_000
+
+
+def synthetic_page(page: int, limit: int = LIMIT) -> bytes:
+    """Builds a `user.getRecentTracks` page with `extended=True` shape."""
+    tracks = []
+    for index in range((page - 1) * limit, page * limit):
+        artist = index * 7919 % ARTISTS
+        track = index * 104729 % TRACKS_PER_ARTIST
+        images = [
+            {
+                'size': size,
+                '#text': f'https://lastfm.freetls.fastly.net/i/u/{size}/'
+                f'{artist:032x}.png',
+            }
+            for size in ('small', 'medium', 'large', 'extralarge')
+        ]
+        tracks.append({
+            'artist': {
+                'url': f'https://www.last.fm/music/Artist+{artist}',
+                'name': f'Artist {artist}',
+                'image': images,
+                'mbid': f'{artist:08x}-0000-0000-0000-000000000000',
+            },
+            'date': {
+                'uts': str(1_700_000_000 - index * 180),
+                '#text': '14 Nov 2023, 22:13',
+            },
+            'mbid': '',
+            'name': f'Track {track} of {artist}',
+            'image': images,
+            'streamable': '0',
+            'album': {'mbid': '', '#text': f'Album {artist % 300}'},
+            'loved': '0',
+            'url': f'https://www.last.fm/music/Artist+{artist}/_/{track}',
+        })
+    return json.dumps({
+        'recenttracks': {'track': tracks, '@attr': {'totalPages': '1'}}
+    }).encode()
+
+
+def measure(name: str, build: Callable[[], object]) -> int:
+    """Reports the memory retained by the object returned by `build`."""
+    tracemalloc.start()
+    result = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f'{name:<40} retained {current / 2**20:8.1f} MiB'
+        f'   peak {peak / 2**20:8.1f} MiB'
+    )
+    del result
+    return current
+
+
+def decode_pages(
+    pages: list[bytes],
+    fields: list[str] | None = None,
+    model: T_Model | None = None,
+    intern: bool = False,
+) -> list:
+    """Decodes the compressed pages the way `get_paginated_data` does."""
+    strings: dict[str, str] | None = {} if intern else None
+    items = []
+    for page in pages:
+        content = json.loads(zlib.decompress(page))
+        items.extend(
+            parse_result(
+                content['recenttracks']['track'], fields, model, strings
+            )
+        )
+    return items
+
+
+def main(scrobbles: int) -> None:
+    print(f'Synthetic history with {scrobbles} scrobbles\n')
+    pages = [
+        zlib.compress(synthetic_page(page))
+        for page in range(1, scrobbles // LIMIT + 1)
+    ]
+    full_pages = pages[: FULL_SCROBBLES // LIMIT]
+    fields = ['name', 'mbid', 'artist.name', 'album.#text', 'date.uts']
+
+    full = measure(
+        f'full items ({len(full_pages) * LIMIT})',
+        lambda: decode_pages(full_pages),
+    )
+    full_interned = measure(
+        f'full items ({len(full_pages) * LIMIT}), intern=True',
+        lambda: decode_pages(full_pages, intern=True),
+    )
+    projected = measure(
+        f'fields=[{len(fields)} fields]',
+        lambda: decode_pages(pages, fields),
+    )
+    projected_interned = measure(
+        f'fields=[{len(fields)} fields], intern=True',
+        lambda: decode_pages(pages, fields, intern=True),
+    )
+    typed = measure(
+        'typed=True (Scrobble)', lambda: decode_pages(pages, model=Scrobble)
+    )
+    typed_interned = measure(
+        'typed=True (Scrobble), intern=True',
+        lambda: decode_pages(pages, model=Scrobble, intern=True),
+    )
+
+    per_full_item = full / (len(full_pages) * LIMIT)
+    per_item = len(pages) * LIMIT * per_full_item
+    print(f'\nprojection saves {1 - projected / per_item:.0%} per item')
+    print(f'typed models save {1 - typed / per_item:.0%} per item')
+    print(f'interning saves {1 - full_interned / full:.0%} of full items')
+    print(
+        f'interning saves {1 - projected_interned / projected:.0%} '
+        'of projected items'
+    )
+    print(f'interning saves {1 - typed_interned / typed:.0%} of models')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,116 @@
+"""Speed benchmarks of the listening statistics over synthetic histories.
+
+Run with `python -m benchmarks.stats [scrobbles]`. Each statistic of
+`pylastfmapi.stats` is timed over the columns of a synthetic history and
+compared with the same statistic computed with a loop over the items of
+`user.getRecentTracks`, the way it's done without the columns.
+"""
+
+import sys
+import time
+from datetime import datetime
+from typing import Callable
+from zoneinfo import ZoneInfo
+
+from pylastfmapi import stats
+from pylastfmapi.columnar import ScrobbleColumns
+
+ARTISTS = 2_000
+TRACKS_PER_ARTIST = 20
+TIMEZONE = 'America/Sao_Paulo'
+
+
+def synthetic_items(scrobbles: int) -> list[dict]:
+    """Builds the items of a history, from the latest, every 3 minutes with
+    a pause of a few hours every 40 scrobbles."""
+    items = []
+    for index in range(scrobbles):
+        artist = index * 7919 % ARTISTS
+        track = index * 104729 % TRACKS_PER_ARTIST
+        items.append({
+            'artist': {'#text': f'Artist {artist}'},
+            'album': {'#text': f'Album {artist % 300}'},
+            'name': f'Track {track} of {artist}',
+            'date': {
+                'uts': str(
+                    1_700_000_000 - index * 180 - index // 40 * 4 * 3600
+                )
+            },
+        })
+    return items
+
+
+def measure(name: str, function: Callable[[], object]) -> float:
+    """Reports the time taken by `function`."""
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f'{name:<40} {elapsed * 1000:10.1f} ms')
+    return elapsed
+
+
+def loop_hour_of_day(items: list[dict]) -> list[int]:
+    zone = ZoneInfo(TIMEZONE)
+    hours = [0] * 24
+    for item in items:
+        hours[datetime.fromtimestamp(int(item['date']['uts']), zone).hour] += 1
+    return hours
+
+
+def loop_sessions(items: list[dict]) -> list[tuple[int, int, int]]:
+    timestamps = sorted(int(item['date']['uts']) for item in items)
+    found = []
+    start = previous = timestamps[0]
+    count = 0
+    for timestamp in timestamps:
+        if timestamp - previous > stats.SESSION_GAP:
+            found.append((start, previous, count))
+            start, count = timestamp, 0
+        previous = timestamp
+        count += 1
+    found.append((start, previous, count))
+    return found
+
+
+def loop_distinct_growth(items: list[dict]) -> list[int]:
+    seen = set()
+    growth = []
+    for item in sorted(items, key=lambda item: int(item['date']['uts'])):
+        seen.add(item['artist']['#text'])
+        growth.append(len(seen))
+    return growth
+
+
+def main(scrobbles: int) -> None:
+    print(f'Synthetic history with {scrobbles} scrobbles\n')
+    items = synthetic_items(scrobbles)
+    columns = ScrobbleColumns()
+    columns.extend(items)
+
+    comparisons = [
+        (
+            'hour_of_day',
+            lambda: stats.hour_of_day(columns, TIMEZONE),
+            lambda: loop_hour_of_day(items),
+        ),
+        (
+            'sessions',
+            lambda: stats.sessions(columns),
+            lambda: loop_sessions(items),
+        ),
+        (
+            'distinct_growth',
+            lambda: stats.distinct_growth(columns),
+            lambda: loop_distinct_growth(items),
+        ),
+    ]
+    for name, vectorized, loop in comparisons:
+        columns_time = measure(f'{name} (columns)', vectorized)
+        loop_time = measure(f'{name} (loop over items)', loop)
+        print(f'{name} is {loop_time / columns_time:.0f}x faster\n')
+    measure('day_of_week (columns)', lambda: stats.day_of_week(columns))
+    measure('streaks (columns)', lambda: stats.streaks(columns, TIMEZONE))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
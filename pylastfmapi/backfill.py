@@ -0,0 +1,219 @@
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from math import ceil
+from typing import Iterator
+
+from pylastfmapi.checkpoint import T_Checkpoint
+from pylastfmapi.constants import (
+    BACKFILL_WINDOW_PAGES,
+    LIMIT,
+    USER_GETINFO,
+    USER_GETRECENTTRACKS,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.utils import is_now_playing, scrobble_key
+
+# T_Window is a type alias for a time window of a backfill, as the UNIX
+# timestamps sent in the `from` and `to` parameters.
+T_Window = tuple[int, int]
+
+
+class Backfill:
+    """Fetches the full scrobble history of a user, window by window.
+
+    The range of the history is split into time windows with the `from`
+    and `to` parameters of `user.getRecentTracks`, sized from the number of
+    scrobbles of the user. A window with more than `window_pages` pages is
+    split again once its first page is read. The windows are fetched
+    concurrently under the rate limit of the `RequestController`, and each
+    completed window is saved in the checkpoint, so a rerun only fetches
+    the missing windows.
+
+    Iterating over the backfill yields the scrobbles from the oldest to the
+    latest, without duplicates and without the track that is playing now.
+    """
+
+    def __init__(  # noqa PLR0917
+        self,
+        request_controller: RequestController,
+        user: str,
+        timestamp_from: int | None = None,
+        timestamp_to: int | None = None,
+        workers: int = WORKERS,
+        checkpoint: T_Checkpoint | None = None,
+        window_pages: int = BACKFILL_WINDOW_PAGES,
+    ) -> None:
+        """Initializes the backfill of a user.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            user (str): The username of the user whose history is fetched.
+            timestamp_from (int, optional): The start of the range. If None,
+                the registration time of the user. Defaults to None.
+            timestamp_to (int, optional): The end of the range. If None, the
+                time of the first run. Defaults to None.
+            workers (int, optional): The number of windows fetched
+                concurrently. Defaults to `WORKERS`.
+            checkpoint (T_Checkpoint, optional): Where the range and the
+                completed windows are saved. Defaults to None.
+            window_pages (int, optional): The maximum number of pages of a
+                window. Defaults to `BACKFILL_WINDOW_PAGES`.
+        """
+        self.request_controller = request_controller
+        self.user = user
+        self.timestamp_from = timestamp_from
+        self.timestamp_to = timestamp_to
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.window_pages = window_pages
+
+    def __iter__(self) -> Iterator[dict]:
+        windows = deque(self.plan())
+        futures: dict[T_Window, Future] = {}
+        last_timestamp = None
+        last_keys: set[tuple[int, str, str]] = set()
+
+        with ThreadPoolExecutor(self.workers) as executor:
+            while windows:
+                # Keep a few windows ahead of the one being yielded, so the
+                # workers are busy without holding the whole history.
+                for window in islice(windows, 2 * self.workers):
+                    if window not in futures:
+                        futures[window] = executor.submit(
+                            self.fetch_window, window
+                        )
+
+                window = windows.popleft()
+                result = futures.pop(window).result()
+                if 'split' in result:
+                    windows.extendleft(
+                        tuple(split) for split in reversed(result['split'])
+                    )
+                    continue
+
+                # The API sends the latest scrobbles first, and both ends of
+                # a window are inclusive, so a scrobble at the boundary of
+                # two windows is sent twice.
+                for item in reversed(result['items']):
+                    key = scrobble_key(item)
+                    if key[0] != last_timestamp:
+                        last_timestamp = key[0]
+                        last_keys.clear()
+                    elif key in last_keys:
+                        continue
+                    last_keys.add(key)
+                    yield item
+
+    def _key(self, window: T_Window | None = None) -> str:
+        if window is None:
+            return f'backfill:{self.user}'
+        return f'backfill:{self.user}:{window[0]}:{window[1]}'
+
+    def _request_page(self, window: T_Window, page: int, limit: int) -> dict:
+        response = self.request_controller.request({
+            'method': USER_GETRECENTTRACKS,
+            'user': self.user,
+            'from': window[0],
+            'to': window[1],
+            'limit': limit,
+            'page': page,
+        })
+        content = response.json()['recenttracks']
+        # A page with a single scrobble sends it without a list.
+        if isinstance(content.get('track'), dict):
+            content['track'] = [content['track']]
+        return content
+
+    def plan(self) -> list[T_Window]:
+        """Splits the range of the backfill into windows of similar size.
+
+        The range and the number of windows are saved in the checkpoint,
+        so a rerun plans the same windows.
+
+        Returns:
+            list[T_Window]: The windows, from the oldest to the latest.
+        """
+        saved = None
+        if self.checkpoint is not None:
+            saved = self.checkpoint.get(self._key())
+        if saved:
+            start, end, count = saved
+        else:
+            start = self.timestamp_from
+            if start is None:
+                response = self.request_controller.request({
+                    'method': USER_GETINFO,
+                    'user': self.user,
+                })
+                start = int(response.json()['user']['registered']['unixtime'])
+            end = self.timestamp_to or int(time.time())
+            total = int(
+                self._request_page((start, end), 1, 1)['@attr']['total']
+            )
+            count = max(1, ceil(total / (LIMIT * self.window_pages)))
+            if self.checkpoint is not None:
+                self.checkpoint.set(self._key(), [start, end, count])
+        return split_window((start, end), count)
+
+    def fetch_window(self, window: T_Window) -> dict:
+        """Fetches all the scrobbles of a window.
+
+        If the window has more than `window_pages` pages, it is not fetched
+        but split into smaller windows. The result is saved in the
+        checkpoint, and a window found in the checkpoint is not requested.
+
+        Args:
+            window (T_Window): The window to fetch.
+
+        Returns:
+            dict: The scrobbles of the window in `items`, from the latest to
+                the oldest, or the smaller windows in `split`.
+        """
+        if (
+            self.checkpoint is not None
+            and self._key(window) in self.checkpoint
+        ):
+            return self.checkpoint.get(self._key(window))
+
+        content = self._request_page(window, 1, LIMIT)
+        total_pages = int(content['@attr']['totalPages'])
+        if total_pages > self.window_pages and window[1] - window[0] > 1:
+            result: dict = {
+                'split': split_window(
+                    window, ceil(total_pages / self.window_pages)
+                )
+            }
+        else:
+            items = content['track']
+            for page in range(2, total_pages + 1):
+                items.extend(self._request_page(window, page, LIMIT)['track'])
+            result = {
+                'items': [item for item in items if not is_now_playing(item)]
+            }
+
+        if self.checkpoint is not None:
+            self.checkpoint.set(self._key(window), result)
+        return result
+
+
+def split_window(window: T_Window, count: int) -> list[T_Window]:
+    """Splits a time window into windows of the same duration.
+
+    Consecutive windows share their boundary, because both ends of a
+    window are inclusive in the LastFM API.
+
+    Args:
+        window (T_Window): The window to split.
+        count (int): The number of windows.
+
+    Returns:
+        list[T_Window]: The windows, from the oldest to the latest.
+    """
+    start, end = window
+    count = max(1, min(count, end - start))
+    bounds = [start + (end - start) * index // count for index in range(count)]
+    return list(zip(bounds, [*bounds[1:], end]))
@@ -0,0 +1,158 @@
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+
+from pylastfmapi.constants import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL
+from pylastfmapi.utils import normalize_name
+
+
+class SearchCache:
+    """An in-memory cache of search results that answers longer prefixes.
+
+    The results are keyed by the normalized query, so 'Rad' and 'rad' share
+    an entry. When the cached results of a query were complete, every
+    result of the API for a longer query starting with it is among them,
+    so a type-ahead sending 'rad', 'radi' and 'radio' is answered by
+    filtering the results of 'rad' to the names containing the longer
+    query, keeping their order. The entries expire after `ttl` seconds,
+    and the least recently used ones are dropped when the cache holds more
+    than `size` results. The results are copied in and out of the cache,
+    so the caller can modify them. The cache can be shared between threads.
+    """
+
+    def __init__(
+        self, ttl: float = SEARCH_CACHE_TTL, size: int = SEARCH_CACHE_SIZE
+    ) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            ttl (float, optional): The seconds an entry is kept. Defaults to
+                `SEARCH_CACHE_TTL`.
+            size (int, optional): The maximum number of results kept, over
+                all the entries. Defaults to `SEARCH_CACHE_SIZE`.
+        """
+        self.ttl = ttl
+        self.size = size
+        self._entries: OrderedDict[tuple, tuple[list[dict], bool, float]] = (
+            OrderedDict()
+        )
+        self._count = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, payload: dict, query_key: str, amount: int | None
+    ) -> list[dict] | None:
+        """Gets the results of a search from the cache.
+
+        Args:
+            payload (dict): The parameters of the search request.
+            query_key (str): The parameter of the payload with the query,
+                like 'artist' for `artist.search`.
+            amount (int, optional): The number of results wanted. If None,
+                all of them.
+
+        Returns:
+            list[dict] | None: The raw results of the search, up to
+                `amount`, or None if the cache can't answer it.
+        """
+        query = normalize_name(payload[query_key] or '')
+        with self._lock:
+            items = self._lookup(_cache_key(payload, query_key, query), amount)
+            if items is not None:
+                return deepcopy(items)
+            for end in range(len(query) - 1, 0, -1):
+                entry = self._entry(
+                    _cache_key(payload, query_key, query[:end])
+                )
+                if entry is not None and entry[1]:
+                    matches = [
+                        item
+                        for item in entry[0]
+                        if query in normalize_name(item.get('name', ''))
+                    ]
+                    return deepcopy(matches[:amount])
+        return None
+
+    def set(
+        self,
+        payload: dict,
+        query_key: str,
+        items: list[dict],
+        complete: bool,
+    ) -> None:
+        """Keeps the results of a search in the cache.
+
+        Args:
+            payload (dict): The parameters of the search request.
+            query_key (str): The parameter of the payload with the query.
+            items (list[dict]): The raw results of the search, in order.
+            complete (bool): If the results are all the results of the
+                query, and not only its first ones, so they answer the
+                longer queries.
+        """
+        if len(items) > self.size:
+            return
+        key = _cache_key(
+            payload, query_key, normalize_name(payload[query_key] or '')
+        )
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (
+                deepcopy(items),
+                complete,
+                time.monotonic() + self.ttl,
+            )
+            self._count += len(items)
+            while self._count > self.size:
+                self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drops all the entries of the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._count = 0
+
+    def _entry(self, key: tuple) -> tuple[list[dict], bool, float] | None:
+        """Gets an entry that has not expired, marking it as recently
+        used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= time.monotonic():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _lookup(self, key: tuple, amount: int | None) -> list[dict] | None:
+        """Gets the results of the exact query, if the entry has enough."""
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        items, complete, _ = entry
+        if complete or (amount and len(items) >= amount):
+            return items[:amount]
+        return None
+
+    def _drop(self, key: tuple) -> None:
+        """Drops an entry, if it is cached."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._count -= len(entry[0])
+
+
+def _cache_key(payload: dict, query_key: str, query: str) -> tuple:
+    """Gets the key of a search, with its normalized query and the other
+    parameters sent."""
+    return (
+        query,
+        *sorted(
+            (key, value)
+            for key, value in payload.items()
+            if key != query_key and value is not None
+        ),
+    )
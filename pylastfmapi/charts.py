@@ -0,0 +1,200 @@
+from array import array
+from typing import Any
+
+from pylastfmapi.backfill import T_Window
+from pylastfmapi.columnar import StringDictionary
+from pylastfmapi.constants import (
+    USER_GETWEEKLYALBUMCHART,
+    USER_GETWEEKLYARTISTCHART,
+    USER_GETWEEKLYTRACKCHART,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.typehints import T_TopChart
+from pylastfmapi.utils import (
+    entity_key,
+    import_optional,
+    iter_concurrently,
+    parse_entity_key,
+)
+
+WEEK = 7 * 24 * 60 * 60
+
+# The endpoint and the keys of the list of items of each weekly chart.
+CHARTS: dict[str, tuple[str, str, str]] = {
+    'artists': (USER_GETWEEKLYARTISTCHART, 'weeklyartistchart', 'artist'),
+    'albums': (USER_GETWEEKLYALBUMCHART, 'weeklyalbumchart', 'album'),
+    'tracks': (USER_GETWEEKLYTRACKCHART, 'weeklytrackchart', 'track'),
+}
+
+
+class ChartHistory:
+    """The weekly charts of a user over a range of weeks.
+
+    Each entry of a weekly chart is stored as one row across typed column
+    buffers: the index of the week and the entity as `int32` IDs, and the
+    playcount as `int32`. The rows are a sparse week by entity matrix of
+    playcounts, which `to_numpy` exposes as a dense matrix.
+    """
+
+    def __init__(
+        self, windows: list[T_Window], chart: T_TopChart = 'artists'
+    ) -> None:
+        """Initializes an empty history.
+
+        Args:
+            windows (list[T_Window]): The weeks of the history, from the
+                oldest to the latest.
+            chart (T_TopChart, optional): The chart of the history.
+                Defaults to 'artists'.
+        """
+        self.windows = windows
+        self.chart = chart
+        self.entities = StringDictionary()
+        self.week_ids = array('i')
+        self.entity_ids = array('i')
+        self.playcounts = array('i')
+        self.failed: list[T_Window] = []
+
+    def __len__(self) -> int:
+        return len(self.playcounts)
+
+    def add(self, week: int, items: list[dict]) -> None:
+        """Appends the chart of a week to the history.
+
+        Args:
+            week (int): The index of the week in `windows`.
+            items (list[dict]): The items of the chart, as sent by the
+                LastFM API.
+        """
+        for item in items:
+            self.week_ids.append(week)
+            self.entity_ids.append(self.entities.encode(entity_key(item)))
+            self.playcounts.append(int(item.get('playcount') or 0))
+
+    def get(self, week: int) -> list[dict]:
+        """Gets the chart of a week.
+
+        Args:
+            week (int): The index of the week in `windows`.
+
+        Returns:
+            list[dict]: The `name` of each entity, with the `artist` of
+                albums and tracks, and its `playcount`.
+        """
+        return [
+            {
+                **parse_entity_key(self.entities.decode(entity_id)),
+                'playcount': playcount,
+            }
+            for week_id, entity_id, playcount in zip(
+                self.week_ids, self.entity_ids, self.playcounts
+            )
+            if week_id == week
+        ]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Exposes the history as a week by entity matrix of playcounts.
+
+        Requires the optional `numpy` dependency.
+
+        Returns:
+            dict[str, numpy.ndarray]: The `matrix` of playcounts (`int32`),
+                with one row per week and one column per entity, the
+                `weeks` as the UNIX timestamps of their start and end
+                (`int64`), and the keys of the `entities`, as in
+                `entity_key`.
+        """
+        np = import_optional('numpy')
+        matrix = np.zeros(
+            (len(self.windows), len(self.entities)), dtype=np.int32
+        )
+        np.add.at(
+            matrix,
+            (
+                np.array(self.week_ids, dtype=np.int32),
+                np.array(self.entity_ids, dtype=np.int32),
+            ),
+            np.array(self.playcounts, dtype=np.int32),
+        )
+        return {
+            'matrix': matrix,
+            'weeks': np.array(self.windows, dtype=np.int64).reshape(-1, 2),
+            'entities': np.array(self.entities.values, dtype=np.str_),
+        }
+
+    @classmethod
+    def fetch(  # noqa PLR0917
+        cls,
+        request_controller: RequestController,
+        user: str,
+        windows: list[T_Window],
+        chart: T_TopChart = 'artists',
+        amount: int | None = None,
+        workers: int = WORKERS,
+    ) -> 'ChartHistory':
+        """Fetches the weekly charts of a user concurrently.
+
+        The weeks are fetched under the rate limit of the
+        `RequestController`. A week whose request fails is kept in
+        `failed`, and it has no rows.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            user (str): The username.
+            windows (list[T_Window]): The weeks, as in `week_windows`.
+            chart (T_TopChart, optional): The chart to fetch. Defaults to
+                'artists'.
+            amount (int, optional): The number of items of each week. If
+                not provided, defaults to the API default. Defaults to None.
+            workers (int, optional): The number of weeks fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            ChartHistory: The history.
+        """
+        method, parent_key, list_key = CHARTS[chart]
+
+        def _request(week: int) -> list[dict]:
+            response = request_controller.request({
+                'method': method,
+                'user': user,
+                'limit': amount,
+                'from': windows[week][0],
+                'to': windows[week][1],
+            })
+            items = response.json()[parent_key][list_key]
+            # A week with a single item sends it without a list.
+            return [items] if isinstance(items, dict) else items
+
+        history = cls(windows, chart)
+        for week, items in iter_concurrently(
+            _request, range(len(windows)), workers
+        ):
+            if isinstance(items, Exception):
+                history.failed.append(windows[week])
+            else:
+                history.add(week, items)
+        history.failed.sort()
+        return history
+
+
+def week_windows(timestamp_from: int, timestamp_to: int) -> list[T_Window]:
+    """Splits a range of time into weeks.
+
+    Each week starts one second after the end of the previous one, since
+    both ends of a window are inclusive in the LastFM API. The last week
+    ends at the end of the range, so it may be shorter.
+
+    Args:
+        timestamp_from (int): The UNIX timestamp of the start of the range.
+        timestamp_to (int): The UNIX timestamp of the end of the range.
+
+    Returns:
+        list[T_Window]: The weeks, from the oldest to the latest.
+    """
+    return [
+        (start, min(start + WEEK - 1, timestamp_to))
+        for start in range(timestamp_from, timestamp_to, WEEK)
+    ]
@@ -0,0 +1,192 @@
+import json
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator
+
+
+class FileCheckpoint:
+    """Keeps the progress of long jobs in a JSON lines file.
+
+    Each value is appended to the file as one line with its key, so the
+    progress saved before a crash is kept. Only the offsets of the lines are
+    kept in memory, the values are read back from the file when needed.
+    A key set twice keeps its latest value.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the checkpoint, loading the keys of an existing file.
+
+        Args:
+            path (str | Path): The path of the checkpoint file. It is
+                created if it does not exist.
+        """
+        self.path = Path(path)
+        self._offsets: dict[str, int] = {}
+        self._lock = Lock()
+        for offset, data in iter_json_lines(self.path):
+            self._offsets[data['key']] = offset
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Gets the value saved for a key.
+
+        Args:
+            key (str): The key of the value.
+            default (Any, optional): The value returned if the key is not
+                saved. Defaults to None.
+
+        Returns:
+            Any: The saved value, or `default`.
+        """
+        offset = self._offsets.get(key)
+        if offset is None:
+            return default
+        with self._lock, self.path.open('rb') as file:
+            file.seek(offset)
+            return json.loads(file.readline())['value']
+
+    def set(self, key: str, value: Any) -> None:
+        """Saves the value of a key.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): A JSON serializable value.
+        """
+        line = json.dumps({'key': key, 'value': value}).encode() + b'\n'
+        with self._lock, self.path.open('ab') as file:
+            file.seek(0, 2)
+            self._offsets[key] = file.tell()
+            file.write(line)
+
+
+class SQLiteCheckpoint:
+    """Keeps the progress of long jobs in a SQLite database.
+
+    It has the same interface as `FileCheckpoint`, and it's better suited
+    to jobs with many keys or values set many times, since each key is
+    stored only once.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the checkpoint, creating its table if needed.
+
+        Args:
+            path (str | Path): The path of the database file. Use
+                `':memory:'` to keep the checkpoint in memory.
+        """
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS checkpoint'
+                ' (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+            )
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT 1 FROM checkpoint WHERE key = ?', (key,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM checkpoint'
+            ).fetchone()[0]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Gets the value saved for a key.
+
+        Args:
+            key (str): The key of the value.
+            default (Any, optional): The value returned if the key is not
+                saved. Defaults to None.
+
+        Returns:
+            Any: The saved value, or `default`.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value FROM checkpoint WHERE key = ?', (key,)
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Saves the value of a key.
+
+        Args:
+            key (str): The key of the value.
+            value (Any): A JSON serializable value.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO checkpoint (key, value) VALUES (?, ?)',
+                (key, json.dumps(value)),
+            )
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._connection.close()
+
+
+# T_Checkpoint is a type alias for any checkpoint where the progress of long
+# jobs can be saved.
+T_Checkpoint = FileCheckpoint | SQLiteCheckpoint
+
+
+def checkpoint_key(payload: dict) -> str:
+    """
+    Get the key of a request to the LastFM API in a checkpoint.
+
+    The key has every parameter of the request, sorted by name, so the
+    same query always gets the same key.
+
+    Args:
+        payload (dict): The query parameters of the request.
+
+    Returns:
+        str: The key of the request.
+
+    """
+    return json.dumps(
+        {key: value for key, value in payload.items() if value is not None},
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+
+
+def iter_json_lines(path: Path) -> Iterator[tuple[int, Any]]:
+    """
+    Read the complete lines of a JSON lines file, creating it if missing.
+
+    The last line is incomplete if the process died while writing it, so
+    it is dropped from the file, and the next lines are appended after the
+    last complete one.
+
+    Args:
+        path (Path): The path of the file.
+
+    Yields:
+        tuple[int, Any]: The offset of each line in the file, and its
+            decoded value.
+
+    """
+    path.touch()
+    with path.open('r+b') as file:
+        offset = 0
+        for line in file:
+            try:
+                data = json.loads(line)
+            except ValueError:
+                file.truncate(offset)
+                return
+            yield offset, data
+            offset += len(line)
@@ -1,5 +1,12 @@
-from typing import Literal
-
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Literal
+
+from pylastfmapi.backfill import Backfill
+from pylastfmapi.cache import SearchCache
+from pylastfmapi.charts import ChartHistory, week_windows
+from pylastfmapi.checkpoint import T_Checkpoint
+from pylastfmapi.columnar import ScrobbleColumns
 from pylastfmapi.constants import (
     ALBUM_GETINFO,
     ALBUM_GETTAGS,
@@ -16,15 +23,22 @@ from pylastfmapi.constants import (
     CHART_GETTOPARTISTS,
     CHART_GETTOPTAGS,
     CHART_GETTOPTRACKS,
+    CRAWL_MAX_DEPTH,
+    CRAWL_MAX_NODES,
     GEO_GETOPTRACKS,
     GEO_GETTOPARTISTS,
+    GEO_SNAPSHOT_AMOUNT,
     LIBRARY_GETARTISTS,
     MAX_WEEKLY_CHART,
+    SEARCH_INDEX_AMOUNT,
+    TAG_COOCCURRENCE_AMOUNT,
     TAG_GETINFO,
     TAG_GETSIMILAR,
     TAG_GETTOPALBUMS,
     TAG_GETTOPARTISTS,
     TAG_GETTOPTRACKS,
+    TAG_INDEX_AMOUNT,
+    TASTE_AMOUNT,
     TRACK_GETCORRECTION,
     TRACK_GETINFO,
     TRACK_GETSIMILAR,
@@ -43,15 +57,40 @@ from pylastfmapi.constants import (
     USER_GETWEEKLYALBUMCHART,
     USER_GETWEEKLYARTISTCHART,
     USER_GETWEEKLYTRACKCHART,
+    WORKERS,
 )
+from pylastfmapi.cooccurrence import TagCooccurrence
+from pylastfmapi.corrections import CorrectionIndex
+from pylastfmapi.crawler import FriendsCrawler
 from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.geo import GeoSnapshot
+from pylastfmapi.graph import ArtistGraph, build_artist_graph
+from pylastfmapi.models import (
+    Album,
+    Artist,
+    Scrobble,
+    Tag,
+    Track,
+    User,
+    parse_result,
+)
 from pylastfmapi.request import RequestController
+from pylastfmapi.search import SearchIndex
+from pylastfmapi.sink import JSONLinesSink
+from pylastfmapi.store import T_ScrobbleStore
+from pylastfmapi.tags import TagIndex
+from pylastfmapi.taste import TasteMatrix
 from pylastfmapi.typehints import (
     T_ISO639Alpha2Code,
     T_ISO3166CountryNames,
     T_Period,
+    T_TopChart,
+)
+from pylastfmapi.utils import (
+    get_timestamp,
+    iter_concurrently,
+    unique_scrobbles,
 )
-from pylastfmapi.utils import get_timestamp
 
 
 class LastFM:  # noqa PLR0904
@@ -62,13 +101,14 @@ class LastFM:  # noqa PLR0904
     tracks, and users.
     """
 
-    def __init__(
+    def __init__(  # noqa PLR0917
         self,
         user_agent: str,
         api_key: str,
         api_secret: str | None = None,
         password_hash: str | None = None,
         reset_cache: bool = False,
+        search_cache: SearchCache | None = None,
     ) -> None:
         """Initializes the LastFM client with the necessary
         credentials and settings.
@@ -84,20 +124,31 @@ class LastFM:  # noqa PLR0904
                 (if needed). Defaults to None.
             reset_cache (bool, optional): If True, clears the existing cache
                 of responses. Defaults to False.
+            search_cache (SearchCache, optional): A cache of the results of
+                the search methods, answering the longer prefixes of a query
+                already searched without the API. Defaults to None.
         """
         self.user_agent = user_agent
         self.api_key = api_key
         self.api_secret = api_secret
         self.password_hash = password_hash
         self.request_controller = RequestController(
-            self.user_agent, self.api_key, reset_cache
+            self.user_agent,
+            self.api_key,
+            reset_cache,
+            search_cache=search_cache,
         )
 
     #########################################################################
     # CHARTS
     #########################################################################
 
-    def get_top_artists(self, amount: int | None = None) -> list[dict]:
+    def get_top_artists(
+        self,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist]:
         """Fetches the top artists from the LastFM charts.
 
         This method retrieves the top artists based on the LastFM charts
@@ -106,16 +157,31 @@ class LastFM:  # noqa PLR0904
         Args:
             amount (int, optional): The total number of artists to retrieve.
                 If None, retrieves all available artists. Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing requested data.
         """
         payload = {'method': CHART_GETTOPARTISTS}
         return self.request_controller.get_paginated_data(
-            payload, 'artists', 'artist', amount
+            payload,
+            'artists',
+            'artist',
+            amount,
+            fields=fields,
+            model=Artist if typed else None,
         )
 
-    def get_top_tags(self, amount: int | None = None) -> list[dict]:
+    def get_top_tags(
+        self,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches the top tags from the LastFM charts.
 
         This method retrieves the top tags based on the LastFM charts
@@ -124,16 +190,31 @@ class LastFM:  # noqa PLR0904
         Args:
             amount (int, optional): The total number of tags to retrieve.
                 If None, retrieves all available tags. Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing requested data.
         """
         payload = {'method': CHART_GETTOPTAGS}
         return self.request_controller.get_paginated_data(
-            payload, 'tags', 'tag', amount
+            payload,
+            'tags',
+            'tag',
+            amount,
+            fields=fields,
+            model=Tag if typed else None,
         )
 
-    def get_top_tracks(self, amount: int | None = None) -> list[dict]:
+    def get_top_tracks(
+        self,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Track]:
         """Fetches the top tracks from the LastFM charts.
 
         This method retrieves the top tracks based on the LastFM charts
@@ -142,13 +223,23 @@ class LastFM:  # noqa PLR0904
         Args:
             amount (int, optional): The total number of tracks to retrieve.
                 If None, retrieves all available tracks. Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing requested data.
         """
         payload = {'method': CHART_GETTOPTRACKS}
         return self.request_controller.get_paginated_data(
-            payload, 'tracks', 'track', amount
+            payload,
+            'tracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Track if typed else None,
         )
 
     #########################################################################
@@ -163,7 +254,9 @@ class LastFM:  # noqa PLR0904
         autocorrect: bool = False,
         lang: T_ISO639Alpha2Code = 'en',
         username: str | None = None,
-    ) -> dict:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Album:
         """Fetches information about an album from the LastFM API.
 
         This method retrieves detailed information about an album,
@@ -182,6 +275,11 @@ class LastFM:  # noqa PLR0904
                 response. Defaults to 'en'.
             username (str, optional): The LastFM username to fetch
                 personalized data for. Defaults to None.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns an `Album` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing the album information.
@@ -205,7 +303,55 @@ class LastFM:  # noqa PLR0904
             'lang': lang,
             'username': username,
         }
-        return self.request_controller.request(payload).json()['album']
+        return parse_result(
+            self.request_controller.request(payload).json()['album'],
+            fields,
+            Album if typed else None,
+        )
+
+    def get_album_info_many(
+        self,
+        albums: Iterable[tuple[str, str] | str],
+        workers: int = WORKERS,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> Iterator[tuple[tuple[str, str] | str, dict | Album | Exception]]:
+        """Fetches information about many albums concurrently.
+
+        Each distinct album is fetched once with `get_album_info`, in a
+        pool of threads sharing the rate limit of the client. Albums with
+        cached responses don't wait for the rate limit.
+
+        Args:
+            albums (Iterable[tuple[str, str] | str]): The albums, as
+                `(artist, album)` tuples or as MusicBrainz IDs.
+            workers (int, optional): The number of albums fetched
+                concurrently. Defaults to `WORKERS`.
+            fields (list[str], optional): The keys to keep in each response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns `Album` models instead
+                of dictionaries. Defaults to False.
+
+        Returns:
+            Iterator[tuple[tuple[str, str] | str, dict | Album | Exception]]:
+                Each album with its information, as soon as it is fetched.
+                If the request of an album fails, the exception is returned
+                in place of its information, and the other albums are still
+                fetched.
+        """
+
+        def _get_album_info(key: tuple[str, str] | str) -> dict | Album:
+            if isinstance(key, str):
+                return self.get_album_info(
+                    mbid=key, fields=fields, typed=typed
+                )
+            artist, album = key
+            return self.get_album_info(
+                album=album, artist=artist, fields=fields, typed=typed
+            )
+
+        return iter_concurrently(_get_album_info, albums, workers)
 
     def get_album_tags(  # noqa PLR0917
         self,
@@ -214,7 +360,9 @@ class LastFM:  # noqa PLR0904
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches user-assigned tags for an album from the LastFM API.
 
         This method retrieves the tags a specific user has assigned
@@ -229,6 +377,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to None.
             autocorrect (bool, optional): If set to True, corrects
                 misspelled artist or album names. Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the user's tags
@@ -253,7 +406,9 @@ class LastFM:  # noqa PLR0904
         }
         response = self.request_controller.request(payload).json()['tags']
         if 'tag' in response:
-            return response['tag']
+            return parse_result(
+                response['tag'], fields, Tag if typed else None
+            )
         else:
             return []
 
@@ -263,7 +418,9 @@ class LastFM:  # noqa PLR0904
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches the top tags for an album from the LastFM API.
 
         This method retrieves the most popular tags associated with an album,
@@ -277,6 +434,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to None.
             autocorrect (bool, optional): If set to True, corrects misspelled
                 artist or album names. Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top tags
@@ -300,13 +462,20 @@ class LastFM:  # noqa PLR0904
             'autocorrect': autocorrect,
         }
 
-        return self.request_controller.request(payload).json()['toptags'][
-            'tag'
-        ]
+        return parse_result(
+            self.request_controller.request(payload).json()['toptags']['tag'],
+            fields,
+            Tag if typed else None,
+        )
 
     def search_album(
-        self, album: str, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        album: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+        index: SearchIndex | None = None,
+    ) -> list[dict] | list[Album]:
         """Searches for albums on LastFM matching the given name.
 
         This method searches the LastFM database for albums that match the
@@ -317,13 +486,37 @@ class LastFM:  # noqa PLR0904
             album (str): The name of the album to search for.
             amount (int, optional): The total number of results to retrieve.
                 If None, retrieves all available results. Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Album`
+                models instead of dictionaries. Defaults to False.
+            index (SearchIndex, optional): A local index answering the
+                search without the API when its confident results fill
+                `amount`, and keeping the results of the API otherwise, as
+                in `SearchIndex.find`. With an index, a None `amount` is
+                `SEARCH_INDEX_AMOUNT`, since the index never answers a
+                search for all the results. Defaults to None.
 
         Returns:
             list[dict]: A list of dictionaries containing the search results.
         """
+        if index is not None:
+            if amount is None:
+                amount = SEARCH_INDEX_AMOUNT
+            return parse_result(
+                index.find(self.request_controller, 'albums', album, amount),
+                fields,
+                Album if typed else None,
+            )
         payload = {'method': ALBUM_SEARCH, 'album': album}
         return self.request_controller.get_search_data(
-            payload, 'albummatches', 'album', amount
+            payload,
+            'albummatches',
+            'album',
+            amount,
+            fields=fields,
+            model=Album if typed else None,
         )
 
     #########################################################################
@@ -337,7 +530,9 @@ class LastFM:  # noqa PLR0904
         autocorrect: bool = False,
         lang: str = 'en',
         username: str | None = None,
-    ) -> dict:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Artist:
         """Fetches information about an artist from the LastFM API.
 
         This method retrieves detailed information about an artist.
@@ -353,6 +548,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to 'en'.
             username (str, optional): The LastFM username to fetch
                 personalized data for. Defaults to None.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns an `Artist` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing the artist information.
@@ -373,7 +573,54 @@ class LastFM:  # noqa PLR0904
             'lang': lang,
             'username': username,
         }
-        return self.request_controller.request(payload).json()['artist']
+        return parse_result(
+            self.request_controller.request(payload).json()['artist'],
+            fields,
+            Artist if typed else None,
+        )
+
+    def get_artist_info_many(  # noqa PLR0917
+        self,
+        artists: Iterable[str],
+        mbid: bool = False,
+        workers: int = WORKERS,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> Iterator[tuple[str, dict | Artist | Exception]]:
+        """Fetches information about many artists concurrently.
+
+        Each distinct artist is fetched once with `get_artist_info`, in a
+        pool of threads sharing the rate limit of the client. Artists with
+        cached responses don't wait for the rate limit.
+
+        Args:
+            artists (Iterable[str]): The names of the artists.
+            mbid (bool, optional): If True, `artists` are MusicBrainz IDs
+                instead of names. Defaults to False.
+            workers (int, optional): The number of artists fetched
+                concurrently. Defaults to `WORKERS`.
+            fields (list[str], optional): The keys to keep in each response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns `Artist` models instead
+                of dictionaries. Defaults to False.
+
+        Returns:
+            Iterator[tuple[str, dict | Artist | Exception]]: Each artist
+                with its information, as soon as it is fetched. If the
+                request of an artist fails, the exception is returned in
+                place of its information, and the other artists are still
+                fetched.
+        """
+
+        def _get_artist_info(key: str) -> dict | Artist:
+            if mbid:
+                return self.get_artist_info(
+                    mbid=key, fields=fields, typed=typed
+                )
+            return self.get_artist_info(artist=key, fields=fields, typed=typed)
+
+        return iter_concurrently(_get_artist_info, artists, workers)
 
     def get_artist_tags(  # noqa PLR0917
         self,
@@ -381,7 +628,9 @@ class LastFM:  # noqa PLR0904
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches user-assigned tags for an artist from the LastFM API.
 
         This method retrieves the tags a specific user has assigned to
@@ -395,6 +644,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to None.
             autocorrect (bool, optional): If set to True, corrects misspelled
                 artist names. Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the user's tags for
@@ -416,7 +670,9 @@ class LastFM:  # noqa PLR0904
         }
         response = self.request_controller.request(payload).json()['tags']
         if 'tag' in response:
-            return response['tag']
+            return parse_result(
+                response['tag'], fields, Tag if typed else None
+            )
         else:
             return []
 
@@ -425,7 +681,9 @@ class LastFM:  # noqa PLR0904
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches the top tags for an artist from the LastFM API.
 
         This method retrieves the most popular tags associated with an artist,
@@ -438,6 +696,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to None.
             autocorrect (bool, optional): If set to True, corrects misspelled
                 artist names. Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top tags
@@ -457,17 +720,21 @@ class LastFM:  # noqa PLR0904
             'mbid': mbid,
             'autocorrect': autocorrect,
         }
-        return self.request_controller.request(payload).json()['toptags'][
-            'tag'
-        ]
+        return parse_result(
+            self.request_controller.request(payload).json()['toptags']['tag'],
+            fields,
+            Tag if typed else None,
+        )
 
-    def get_artist_top_albums(
+    def get_artist_top_albums(  # noqa PLR0917
         self,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Album]:
         """Fetches the top albums for an artist from the LastFM API.
 
         This method retrieves the most popular albums associated with an
@@ -482,6 +749,11 @@ class LastFM:  # noqa PLR0904
                 artist names. Defaults to False.
             amount (int, optional): The total number of albums to retrieve.
                 Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Album`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the artist's
@@ -501,16 +773,23 @@ class LastFM:  # noqa PLR0904
             'autocorrect': autocorrect,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'topalbums', 'album', amount
+            payload,
+            'topalbums',
+            'album',
+            amount,
+            fields=fields,
+            model=Album if typed else None,
         )
 
-    def get_artist_top_tracks(
+    def get_artist_top_tracks(  # noqa PLR0917
         self,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Track]:
         """Fetches the top tracks for an artist from the LastFM API.
 
         This method retrieves the most popular tracks associated with an
@@ -525,6 +804,11 @@ class LastFM:  # noqa PLR0904
                 artist names. Defaults to False.
             amount (int, optional): The total number of tracks to retrieve.
                 Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the artist's
@@ -545,16 +829,23 @@ class LastFM:  # noqa PLR0904
             'autocorrect': autocorrect,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'toptracks', 'track', amount
+            payload,
+            'toptracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Track if typed else None,
         )
 
-    def get_artist_similar(
+    def get_artist_similar(  # noqa PLR0917
         self,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
         amount: int = 30,
-    ) -> dict:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Artist:
         """Fetches similar artists for a given artist from the LastFM API.
 
         This method retrieves a list of artists similar to the specified
@@ -569,6 +860,11 @@ class LastFM:  # noqa PLR0904
                 artist names. Defaults to False.
             amount (int, optional): The number of similar artists to retrieve.
                 Defaults to 30.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns an `Artist` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing a list of similar artists.
@@ -588,13 +884,61 @@ class LastFM:  # noqa PLR0904
             'autocorrect': autocorrect,
             'limit': amount,
         }
-        return self.request_controller.request(payload).json()[
-            'similarartists'
-        ]['artist']
+        return parse_result(
+            self.request_controller.request(payload).json()['similarartists'][
+                'artist'
+            ],
+            fields,
+            Artist if typed else None,
+        )
+
+    def get_artist_similar_graph(  # noqa PLR0917
+        self,
+        artists: Iterable[str],
+        max_depth: int = CRAWL_MAX_DEPTH,
+        max_nodes: int = CRAWL_MAX_NODES,
+        amount: int = 30,
+        workers: int = WORKERS,
+    ) -> ArtistGraph:
+        """Builds the graph of similar artists around some seed artists.
+
+        The similar artists are fetched with `get_artist_similar` for up to
+        `max_depth` hops from the seeds, concurrently under the rate limit
+        of the client, and kept as a weighted sparse graph. See
+        `build_artist_graph` for the details.
+
+        Args:
+            artists (Iterable[str]): The names of the seed artists.
+            max_depth (int, optional): The number of hops from the seeds.
+                Defaults to `CRAWL_MAX_DEPTH`.
+            max_nodes (int, optional): The maximum number of artists whose
+                similar artists are fetched. Defaults to `CRAWL_MAX_NODES`.
+            amount (int, optional): The number of similar artists fetched
+                for each artist. Defaults to 30.
+            workers (int, optional): The number of artists fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            ArtistGraph: The graph, with the `match` of each similar artist
+                as the weight of its edge.
+        """
+        return build_artist_graph(
+            self.request_controller,
+            artists,
+            max_depth,
+            max_nodes,
+            amount,
+            workers,
+        )
 
     def search_artist(
-        self, artist: str, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        artist: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+        index: SearchIndex | None = None,
+    ) -> list[dict] | list[Artist]:
         """Searches for artists on LastFM that match the given name.
 
         This method queries the LastFM database for artists that match
@@ -607,17 +951,43 @@ class LastFM:  # noqa PLR0904
             amount (int, optional): The total number of search results
                 to retrieve. If None, retrieves all available results.
                 Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
+            index (SearchIndex, optional): A local index answering the
+                search without the API when its confident results fill
+                `amount`, and keeping the results of the API otherwise, as
+                in `SearchIndex.find`. With an index, a None `amount` is
+                `SEARCH_INDEX_AMOUNT`, since the index never answers a
+                search for all the results. Defaults to None.
 
         Returns:
             list[dict]: A list of dictionaries containing the search results.
                 Each dictionary represents an artist.
         """
+        if index is not None:
+            if amount is None:
+                amount = SEARCH_INDEX_AMOUNT
+            return parse_result(
+                index.find(self.request_controller, 'artists', artist, amount),
+                fields,
+                Artist if typed else None,
+            )
         payload = {'method': ARTIST_SEARCH, 'artist': artist}
         return self.request_controller.get_search_data(
-            payload, 'artistmatches', 'artist', amount
+            payload,
+            'artistmatches',
+            'artist',
+            amount,
+            fields=fields,
+            model=Artist if typed else None,
         )
 
-    def get_artist_correction(self, artist: str) -> dict:
+    def get_artist_correction(
+        self, artist: str, fields: list[str] | None = None, typed: bool = False
+    ) -> dict | Artist:
         """Checks if the supplied artist name has a correction to a
         canonical artist.
 
@@ -627,6 +997,11 @@ class LastFM:  # noqa PLR0904
 
         Args:
             artist (str): The artist name to check for corrections.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns an `Artist` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: The corrected canonical artist name.
@@ -635,22 +1010,28 @@ class LastFM:  # noqa PLR0904
             'method': ARTIST_GETCORRECTION,
             'artist': artist,
         }
-        return self.request_controller.request(payload).json()['corrections'][
-            'correction'
-        ]['artist']
+        return parse_result(
+            self.request_controller.request(payload).json()['corrections'][
+                'correction'
+            ]['artist'],
+            fields,
+            Artist if typed else None,
+        )
 
     #########################################################################
     # TRACK
     #########################################################################
 
-    def get_track_info(
+    def get_track_info(  # noqa PLR0917
         self,
         track: str | None = None,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
         username: str | None = None,
-    ) -> dict:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Track:
         """Retrieves detailed information about a track.
 
         This method fetches detailed information about a track from the
@@ -671,6 +1052,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to False.
             username (str, optional): The username to retrieve user-specific
                 data. Defaults to None.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a `Track` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing detailed information about the track.
@@ -693,16 +1079,66 @@ class LastFM:  # noqa PLR0904
             'autocorrect': autocorrect,
             'username': username,
         }
-        return self.request_controller.request(payload).json()['track']
+        return parse_result(
+            self.request_controller.request(payload).json()['track'],
+            fields,
+            Track if typed else None,
+        )
+
+    def get_track_info_many(
+        self,
+        tracks: Iterable[tuple[str, str] | str],
+        workers: int = WORKERS,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> Iterator[tuple[tuple[str, str] | str, dict | Track | Exception]]:
+        """Fetches information about many tracks concurrently.
+
+        Each distinct track is fetched once with `get_track_info`, in a
+        pool of threads sharing the rate limit of the client. Tracks with
+        cached responses don't wait for the rate limit.
+
+        Args:
+            tracks (Iterable[tuple[str, str] | str]): The tracks, as
+                `(artist, track)` tuples or as MusicBrainz IDs.
+            workers (int, optional): The number of tracks fetched
+                concurrently. Defaults to `WORKERS`.
+            fields (list[str], optional): The keys to keep in each response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns `Track` models instead
+                of dictionaries. Defaults to False.
+
+        Returns:
+            Iterator[tuple[tuple[str, str] | str, dict | Track | Exception]]:
+                Each track with its information, as soon as it is fetched.
+                If the request of a track fails, the exception is returned
+                in place of its information, and the other tracks are still
+                fetched.
+        """
 
-    def get_track_tags(
+        def _get_track_info(key: tuple[str, str] | str) -> dict | Track:
+            if isinstance(key, str):
+                return self.get_track_info(
+                    mbid=key, fields=fields, typed=typed
+                )
+            artist, track = key
+            return self.get_track_info(
+                track=track, artist=artist, fields=fields, typed=typed
+            )
+
+        return iter_concurrently(_get_track_info, tracks, workers)
+
+    def get_track_tags(  # noqa PLR0917
         self,
         user: str,
         track: str | None = None,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches tags assigned to a track by a specific user.
 
         This method retrieves tags that a user has assigned to a track from
@@ -720,6 +1156,11 @@ class LastFM:  # noqa PLR0904
                 `track` and `artist` are not provided.
             autocorrect (bool, optional): Whether to autocorrect misspellings.
                 Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing tags assigned to
@@ -744,17 +1185,21 @@ class LastFM:  # noqa PLR0904
         }
         response = self.request_controller.request(payload).json()['tags']
         if 'tag' in response:
-            return response['tag']
+            return parse_result(
+                response['tag'], fields, Tag if typed else None
+            )
         else:
             return []
 
-    def get_track_top_tags(
+    def get_track_top_tags(  # noqa PLR0917
         self,
         track: str | None = None,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Retrieves the top tags for a track.
 
         This method fetches the top tags assigned to a track based on user
@@ -772,6 +1217,11 @@ class LastFM:  # noqa PLR0904
                 Required if `track` and `artist` are not provided.
             autocorrect (bool, optional): Whether to autocorrect misspellings.
                 Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top tags for
@@ -794,18 +1244,22 @@ class LastFM:  # noqa PLR0904
             'mbid': mbid,
             'autocorrect': autocorrect,
         }
-        return self.request_controller.request(payload).json()['toptags'][
-            'tag'
-        ]
+        return parse_result(
+            self.request_controller.request(payload).json()['toptags']['tag'],
+            fields,
+            Tag if typed else None,
+        )
 
-    def get_track_similar(
+    def get_track_similar(  # noqa PLR0917
         self,
         track: str | None = None,
         artist: str | None = None,
         mbid: str | None = None,
         autocorrect: bool = False,
         amount: int = 100,
-    ) -> dict:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Track:
         """Retrieves a list of tracks similar to the specified track.
 
         This method fetches a list of tracks similar to the given track
@@ -826,6 +1280,11 @@ class LastFM:  # noqa PLR0904
                 Defaults to False.
             amount (int, optional): The number of similar tracks to retrieve.
                 Defaults to 100.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a `Track` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing similar tracks to the specified
@@ -850,13 +1309,23 @@ class LastFM:  # noqa PLR0904
             'autocorrect': autocorrect,
             'limit': amount,
         }
-        return self.request_controller.request(payload).json()[
-            'similartracks'
-        ]['track']
+        return parse_result(
+            self.request_controller.request(payload).json()['similartracks'][
+                'track'
+            ],
+            fields,
+            Track if typed else None,
+        )
 
-    def search_track(
-        self, track: str, artist: str | None = None, amount: int | None = None
-    ) -> list[dict]:
+    def search_track(  # noqa PLR0917
+        self,
+        track: str,
+        artist: str | None = None,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+        index: SearchIndex | None = None,
+    ) -> list[dict] | list[Track]:
         """Searches for tracks that match the given track name and artist.
 
         This method searches for tracks from the LastFM API based on the
@@ -868,17 +1337,53 @@ class LastFM:  # noqa PLR0904
             artist (str, optional): The name of the artist. Optional.
             amount (int, optional): The number of search results to return.
                 Optional.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
+            index (SearchIndex, optional): A local index answering the
+                search without the API when its confident results fill
+                `amount`, and keeping the results of the API otherwise, as
+                in `SearchIndex.find`. With an index, a None `amount` is
+                `SEARCH_INDEX_AMOUNT`, since the index never answers a
+                search for all the results. Defaults to None.
 
         Returns:
             list[dict]: A list of dictionaries containing tracks that match
                 the search criteria.
         """
+        if index is not None:
+            if amount is None:
+                amount = SEARCH_INDEX_AMOUNT
+            return parse_result(
+                index.find(
+                    self.request_controller,
+                    'tracks',
+                    track,
+                    amount,
+                    artist,
+                ),
+                fields,
+                Track if typed else None,
+            )
         payload = {'method': TRACK_SEARCH, 'track': track, 'artist': artist}
         return self.request_controller.get_search_data(
-            payload, 'trackmatches', 'track', amount
+            payload,
+            'trackmatches',
+            'track',
+            amount,
+            fields=fields,
+            model=Track if typed else None,
         )
 
-    def get_track_correction(self, track: str, artist: str) -> dict:
+    def get_track_correction(
+        self,
+        track: str,
+        artist: str,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Track:
         """Uses LastFM corrections data to check whether the supplied track
         has a correction to a canonical track.
 
@@ -889,6 +1394,11 @@ class LastFM:  # noqa PLR0904
         Args:
             track (str): The name of the track to check for corrections.
             artist (str): The name of the artist.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a `Track` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing detailed information about the track.
@@ -901,17 +1411,59 @@ class LastFM:  # noqa PLR0904
             'track': track,
             'artist': artist,
         }
-        return self.request_controller.request(payload).json()['corrections'][
-            'correction'
-        ]['track']
+        return parse_result(
+            self.request_controller.request(payload).json()['corrections'][
+                'correction'
+            ]['track'],
+            fields,
+            Track if typed else None,
+        )
+
+    def build_correction_index(
+        self,
+        artists: Iterable[str] = (),
+        tracks: Iterable[tuple[str, str]] = (),
+        index: CorrectionIndex | None = None,
+        workers: int = WORKERS,
+    ) -> CorrectionIndex:
+        """Resolves the canonical names of many artists and tracks.
+
+        The corrections of the distinct names are fetched concurrently
+        under the rate limit of the client into an index, resolving the raw
+        names of the scrobbles without further requests. Given an existing
+        index, only the names missing from it are fetched. See
+        `CorrectionIndex` for the details.
+
+        Args:
+            artists (Iterable[str], optional): The raw names of the
+                artists. Defaults to no artists.
+            tracks (Iterable[tuple[str, str]], optional): The raw artist
+                and track names of the tracks. Defaults to no tracks.
+            index (CorrectionIndex, optional): The index to extend. If
+                None, a new index is built. Defaults to None.
+            workers (int, optional): The number of requests sent
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            CorrectionIndex: The index.
+        """
+        if index is None:
+            index = CorrectionIndex()
+        index.refresh(self.request_controller, artists, tracks, workers)
+        return index
 
     #########################################################################
     # USER
     #########################################################################
 
     def get_user_friends(
-        self, user: str, recenttracks: bool = False, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        user: str,
+        recenttracks: bool = False,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[User]:
         """Fetches a list of friends for a specific user.
 
         This method retrieves a list of friends for the given user from the
@@ -926,6 +1478,11 @@ class LastFM:  # noqa PLR0904
                 by friends. Defaults to False.
             amount (int, optional): The number of friends to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `User`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -937,10 +1494,70 @@ class LastFM:  # noqa PLR0904
             'recenttracks': recenttracks,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'friends', 'user', amount
+            payload,
+            'friends',
+            'user',
+            amount,
+            fields=fields,
+            model=User if typed else None,
         )
 
-    def get_user_info(self, user: str) -> dict:
+    def crawl_user_friends(  # noqa PLR0917
+        self,
+        seeds: Iterable[str],
+        edges_path: str | Path,
+        max_depth: int = CRAWL_MAX_DEPTH,
+        max_nodes: int = CRAWL_MAX_NODES,
+        workers: int = WORKERS,
+        checkpoint: T_Checkpoint | None = None,
+        priority: Callable[[dict], float] | None = None,
+    ) -> Iterator[tuple[str, int, list[dict] | Exception]]:
+        """Crawls the friends graph around some seed users.
+
+        The friends of the seeds are followed for up to `max_depth` hops,
+        fetched concurrently under the rate limit of the client, and the
+        edges are written to a file as soon as they are fetched. See
+        `FriendsCrawler` for the details.
+
+        Args:
+            seeds (Iterable[str]): The usernames where the crawl starts.
+            edges_path (str | Path): The path of the file where the edges
+                are written, one `user<TAB>friend` line per friend.
+            max_depth (int, optional): The number of hops from the seeds.
+                Defaults to `CRAWL_MAX_DEPTH`.
+            max_nodes (int, optional): The maximum number of users fetched.
+                Defaults to `CRAWL_MAX_NODES`.
+            workers (int, optional): The number of users fetched
+                concurrently. Defaults to `WORKERS`.
+            checkpoint (T_Checkpoint, optional): Where the frontier is
+                saved, so an interrupted crawl can be resumed by running it
+                again with the same checkpoint. Defaults to None.
+            priority (Callable[[dict], float], optional): A function giving
+                the priority of a friend. Lower values are fetched first. If
+                None, the crawl is breadth-first. Defaults to None.
+
+        Returns:
+            Iterator[tuple[str, int, list[dict] | Exception]]: Each fetched
+                user with its depth and its friends. If the request of a
+                user fails, the exception is returned in place of its
+                friends.
+        """
+        return iter(
+            FriendsCrawler(
+                self.request_controller,
+                seeds,
+                edges_path,
+                max_depth,
+                max_nodes,
+                workers,
+                checkpoint,
+                priority,
+            )
+        )
+
+    def get_user_info(
+        self, user: str, fields: list[str] | None = None, typed: bool = False
+    ) -> dict | User:
         """Fetches detailed information about a specific user.
 
         This method retrieves detailed information about the given user
@@ -949,6 +1566,11 @@ class LastFM:  # noqa PLR0904
         Args:
             user (str): The username of the user whose information is to
                 be retrieved.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns an `User` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing detailed information about the
@@ -956,11 +1578,21 @@ class LastFM:  # noqa PLR0904
 
         """
         payload = {'method': USER_GETINFO, 'user': user}
-        return self.request_controller.request(payload).json()['user']
+        return parse_result(
+            self.request_controller.request(payload).json()['user'],
+            fields,
+            User if typed else None,
+        )
 
-    def get_user_loved_tracks(
-        self, user: str, amount: int | None = None
-    ) -> list[dict]:
+    def get_user_loved_tracks(  # noqa PLR0917
+        self,
+        user: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+        intern: bool = False,
+        checkpoint: T_Checkpoint | None = None,
+    ) -> list[dict] | list[Scrobble]:
         """Fetches a list of tracks loved by a specific user.
 
         This method retrieves a list of tracks that the given user has marked
@@ -972,6 +1604,18 @@ class LastFM:  # noqa PLR0904
                 retrieved.
             amount (int, optional): The number of loved tracks to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Scrobble`
+                models instead of dictionaries. Defaults to False.
+            intern (bool, optional): If True, repeated strings like the
+                artist and album names share a single instance across the
+                items, reducing the memory of long results. Defaults to
+                False.
+            checkpoint (T_Checkpoint, optional): Where the completed pages
+                are saved, so an interrupted call continues from its first
+                missing page when run again. Defaults to None.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -982,12 +1626,25 @@ class LastFM:  # noqa PLR0904
             'user': user,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'lovedtracks', 'track', amount
+            payload,
+            'lovedtracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Scrobble if typed else None,
+            intern=intern,
+            checkpoint=checkpoint,
         )
 
-    def get_user_library_artists(
-        self, user: str, amount: int | None = None
-    ) -> list[dict]:
+    def get_user_library_artists(  # noqa PLR0917
+        self,
+        user: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+        intern: bool = False,
+        checkpoint: T_Checkpoint | None = None,
+    ) -> list[dict] | list[Artist]:
         """Fetches a list of artists from a user's library.
 
         This method retrieves a list of artists from the library of the given
@@ -999,6 +1656,18 @@ class LastFM:  # noqa PLR0904
                 be retrieved.
             amount (int, optional): The number of library artists to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
+            intern (bool, optional): If True, repeated strings like the
+                artist and album names share a single instance across the
+                items, reducing the memory of long results. Defaults to
+                False.
+            checkpoint (T_Checkpoint, optional): Where the completed pages
+                are saved, so an interrupted call continues from its first
+                missing page when run again. Defaults to None.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -1006,7 +1675,14 @@ class LastFM:  # noqa PLR0904
         """
         payload = {'method': LIBRARY_GETARTISTS, 'user': user}
         return self.request_controller.get_paginated_data(
-            payload, 'artists', 'artist', amount
+            payload,
+            'artists',
+            'artist',
+            amount,
+            fields=fields,
+            model=Artist if typed else None,
+            intern=intern,
+            checkpoint=checkpoint,
         )
 
     def get_user_personal_tags(  # noqa PLR0917
@@ -1015,7 +1691,9 @@ class LastFM:  # noqa PLR0904
         tag: str,
         taggingtype: Literal['artist', 'album', 'track'],
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist] | list[Album] | list[Track]:
         """Fetches a list of personal tags applied by a user to a specific
         tagging type.
 
@@ -1032,6 +1710,12 @@ class LastFM:  # noqa PLR0904
                 The type of items that are tagged.
             amount (int, optional): The number of tagged items to retrieve.
                 f not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns `Artist`, `Album` or
+                `Track` models (depending on `taggingtype`) instead of
+                dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -1046,15 +1730,30 @@ class LastFM:  # noqa PLR0904
         match taggingtype:
             case 'artist':
                 return self.request_controller.get_paginated_data(
-                    payload, 'artists', 'artist', amount
+                    payload,
+                    'artists',
+                    'artist',
+                    amount,
+                    fields=fields,
+                    model=Artist if typed else None,
                 )
             case 'album':
                 return self.request_controller.get_paginated_data(
-                    payload, 'albums', 'album', amount
+                    payload,
+                    'albums',
+                    'album',
+                    amount,
+                    fields=fields,
+                    model=Album if typed else None,
                 )
             case 'track':
                 return self.request_controller.get_paginated_data(
-                    payload, 'tracks', 'track', amount
+                    payload,
+                    'tracks',
+                    'track',
+                    amount,
+                    fields=fields,
+                    model=Track if typed else None,
                 )
 
     def get_user_top_albums(
@@ -1062,7 +1761,9 @@ class LastFM:  # noqa PLR0904
         user: str,
         period: T_Period = 'overall',
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Album]:
         """Fetches a list of top albums for a specific user.
 
         This method retrieves a list of the top albums listened to by the
@@ -1076,6 +1777,11 @@ class LastFM:  # noqa PLR0904
                 albums. Defaults to 'overall'.
             amount (int, optional): The number of top albums to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Album`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -1087,7 +1793,12 @@ class LastFM:  # noqa PLR0904
             'period': period,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'topalbums', 'album', amount
+            payload,
+            'topalbums',
+            'album',
+            amount,
+            fields=fields,
+            model=Album if typed else None,
         )
 
     def get_user_top_artists(
@@ -1095,7 +1806,9 @@ class LastFM:  # noqa PLR0904
         user: str,
         period: T_Period = 'overall',
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist]:
         """Fetches a list of top artists for a specific user.
 
         This method retrieves a list of the top artists listened to by the
@@ -1109,6 +1822,11 @@ class LastFM:  # noqa PLR0904
                 artists. Defaults to 'overall'.
             amount (int, optional): The number of top artists to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -1120,7 +1838,12 @@ class LastFM:  # noqa PLR0904
             'period': period,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'topartists', 'artist', amount
+            payload,
+            'topartists',
+            'artist',
+            amount,
+            fields=fields,
+            model=Artist if typed else None,
         )
 
     def get_user_top_tracks(
@@ -1128,7 +1851,9 @@ class LastFM:  # noqa PLR0904
         user: str,
         period: T_Period = 'overall',
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Track]:
         """Fetches a list of top tracks for a specific user.
 
         This method retrieves a list of the top tracks listened to by the
@@ -1142,6 +1867,11 @@ class LastFM:  # noqa PLR0904
                 top tracks. Defaults to 'overall'.
             amount (int, optional): The number of top tracks to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -1153,12 +1883,122 @@ class LastFM:  # noqa PLR0904
             'period': period,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'toptracks', 'track', amount
+            payload,
+            'toptracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Track if typed else None,
+        )
+
+    def get_users_top_charts(  # noqa PLR0917
+        self,
+        users: Iterable[str],
+        period: T_Period = 'overall',
+        charts: Iterable[T_TopChart] = ('artists', 'albums', 'tracks'),
+        amount: int | None = None,
+        workers: int = WORKERS,
+        sink: JSONLinesSink | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> Iterator[tuple[tuple[str, T_TopChart], list | Exception]]:
+        """Fetches the top charts of many users concurrently.
+
+        Each chart of each user is fetched with `get_user_top_artists`,
+        `get_user_top_albums` or `get_user_top_tracks`, in a pool of threads
+        sharing the rate limit of the client. The users are read lazily, so
+        large lists of users can be given as a generator.
+
+        Args:
+            users (Iterable[str]): The usernames.
+            period (T_Period, optional): The period of the charts. Defaults
+                to 'overall'.
+            charts (Iterable[T_TopChart], optional): The charts fetched for
+                each user. Defaults to all of them.
+            amount (int, optional): The number of items of each chart. If
+                not provided, defaults to all available.
+            workers (int, optional): The number of charts fetched
+                concurrently. Defaults to `WORKERS`.
+            sink (JSONLinesSink, optional): Where each chart is written as
+                soon as it is fetched. The charts already in the sink are
+                not fetched again. Defaults to None.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns lists of models instead
+                of dictionaries. Defaults to False.
+
+        Yields:
+            tuple[tuple[str, T_TopChart], list | Exception]: Each user and
+                chart with its items, as soon as they are fetched. If the
+                request of a chart fails, the exception is yielded in place
+                of its items, it is not written to the sink, and the other
+                charts are still fetched.
+        """
+        methods = {
+            'artists': self.get_user_top_artists,
+            'albums': self.get_user_top_albums,
+            'tracks': self.get_user_top_tracks,
+        }
+        charts = tuple(charts)
+
+        def _get_user_top_chart(key: tuple[str, T_TopChart]) -> list:
+            user, chart = key
+            return methods[chart](
+                user, period, amount, fields=fields, typed=typed
+            )
+
+        keys = (
+            (user, chart)
+            for user in users
+            for chart in charts
+            if sink is None or (user, period, chart) not in sink
+        )
+        for (user, chart), items in iter_concurrently(
+            _get_user_top_chart, keys, workers
+        ):
+            if sink is not None and not isinstance(items, Exception):
+                sink.write(user, period, chart, items)
+            yield (user, chart), items
+
+    def get_users_taste_matrix(
+        self,
+        users: Iterable[str],
+        period: T_Period = 'overall',
+        amount: int = TASTE_AMOUNT,
+        workers: int = WORKERS,
+    ) -> TasteMatrix:
+        """Fetches the top artists of many users into a taste matrix.
+
+        Each user is requested once, concurrently under the rate limit of
+        the client, and the compatibility of every pair of users is then
+        computed from the matrix without more requests. See `TasteMatrix`
+        for the details.
+
+        Args:
+            users (Iterable[str]): The usernames of the users.
+            period (T_Period, optional): The period of the top artists.
+                Defaults to 'overall'.
+            amount (int, optional): The number of top artists of each user.
+                Defaults to `TASTE_AMOUNT`.
+            workers (int, optional): The number of users fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            TasteMatrix: The user by artist matrix, with the users whose
+                request failed in `failed`.
+        """
+        return TasteMatrix.fetch(
+            self.request_controller, users, period, amount, workers
         )
 
     def get_user_top_tags(
-        self, user: str, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        user: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches a list of top tags used by a specific user.
 
         This method retrieves a list of the top tags applied by the given
@@ -1170,23 +2010,32 @@ class LastFM:  # noqa PLR0904
                 retrieved.
             amount (int, optional): The number of top tags to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
                 about a top tag of the specified user.
         """
         payload = {'method': USER_GETTOPTAGS, 'user': user, 'limit': amount}
-        return self.request_controller.request(payload).json()['toptags'][
-            'tag'
-        ]
+        return parse_result(
+            self.request_controller.request(payload).json()['toptags']['tag'],
+            fields,
+            Tag if typed else None,
+        )
 
-    def get_user_weekly_album_chart(
+    def get_user_weekly_album_chart(  # noqa PLR0917
         self,
         user: str,
         amount: int | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Album]:
         """Fetches a weekly chart of albums listened to by a specific user.
 
         This method retrieves a list of albums that the user has listened
@@ -1203,6 +2052,11 @@ class LastFM:  # noqa PLR0904
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
             date_to (str, optional): The end date of the range in
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Album`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing
@@ -1225,17 +2079,23 @@ class LastFM:  # noqa PLR0904
             'from': timestamp_from,
             'to': timestamp_to,
         }
-        return self.request_controller.request(payload).json()[
-            'weeklyalbumchart'
-        ]['album']
+        return parse_result(
+            self.request_controller.request(payload).json()[
+                'weeklyalbumchart'
+            ]['album'],
+            fields,
+            Album if typed else None,
+        )
 
-    def get_user_weekly_artist_chart(
+    def get_user_weekly_artist_chart(  # noqa PLR0917
         self,
         user: str,
         amount: int | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist]:
         """Fetches a weekly chart of artists listened to by a specific user.
 
         This method retrieves a list of artists that the user has listened
@@ -1252,6 +2112,11 @@ class LastFM:  # noqa PLR0904
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
             date_to (str, optional): The end date of the range in
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing
@@ -1274,17 +2139,23 @@ class LastFM:  # noqa PLR0904
             'from': timestamp_from,
             'to': timestamp_to,
         }
-        return self.request_controller.request(payload).json()[
-            'weeklyartistchart'
-        ]['artist']
+        return parse_result(
+            self.request_controller.request(payload).json()[
+                'weeklyartistchart'
+            ]['artist'],
+            fields,
+            Artist if typed else None,
+        )
 
-    def get_user_weekly_track_chart(
+    def get_user_weekly_track_chart(  # noqa PLR0917
         self,
         user: str,
         amount: int | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Track]:
         """Fetches a weekly chart of tracks listened to by a specific user.
 
         This method retrieves a list of tracks that the user has listened to
@@ -1301,6 +2172,11 @@ class LastFM:  # noqa PLR0904
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
             date_to (str, optional): The end date of the range in
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing
@@ -1323,18 +2199,84 @@ class LastFM:  # noqa PLR0904
             'from': timestamp_from,
             'to': timestamp_to,
         }
-        return self.request_controller.request(payload).json()[
-            'weeklytrackchart'
-        ]['track']
+        return parse_result(
+            self.request_controller.request(payload).json()[
+                'weeklytrackchart'
+            ]['track'],
+            fields,
+            Track if typed else None,
+        )
+
+    def get_user_weekly_chart_history(  # noqa PLR0917
+        self,
+        user: str,
+        date_from: str,
+        date_to: str,
+        chart: T_TopChart = 'artists',
+        amount: int | None = None,
+        workers: int = WORKERS,
+    ) -> ChartHistory:
+        """Fetches the weekly charts of a user over a range of dates.
+
+        The range is split into weeks, and the chart of each week is
+        fetched concurrently under the rate limit of the client, as in
+        `get_user_weekly_artist_chart`, `get_user_weekly_album_chart` or
+        `get_user_weekly_track_chart`. See `ChartHistory` for the details.
+
+        Args:
+            user (str): The username of the user whose charts are to be
+                retrieved.
+            date_from (str): The start date of the range in "YYYY-MM-DD" or
+                "YYYY-MM-DD HH:MM" format.
+            date_to (str): The end date of the range in "YYYY-MM-DD" or
+                "YYYY-MM-DD HH:MM" format.
+            chart (T_TopChart, optional): The chart to fetch. Defaults to
+                'artists'.
+            amount (int, optional): The number of items of each week. The
+                maximum allowed is 1000. If not provided, defaults to all
+                available.
+            workers (int, optional): The number of weeks fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            ChartHistory: The history, a week by entity matrix of
+                playcounts.
+
+        Raises:
+            LastFMException: If `amount` exceeds 1000 or if the date range
+                is invalid.
+        """
+        if amount and amount > MAX_WEEKLY_CHART:
+            raise LastFMException(
+                f'For this request, the maximum "amount" is {MAX_WEEKLY_CHART}'
+            )
+        timestamp_from, timestamp_to = get_timestamp(date_from, date_to)
+        if timestamp_from is None or timestamp_to is None:
+            raise LastFMException(
+                'The params "date_from" and "date_to" should be given'
+            )
+        return ChartHistory.fetch(
+            self.request_controller,
+            user,
+            week_windows(timestamp_from, timestamp_to),
+            chart,
+            amount,
+            workers,
+        )
 
-    def get_user_recent_tracks(
+    def get_user_recent_tracks(  # noqa PLR0917
         self,
         user: str,
         amount: int | None = None,
         date_from: str | None = None,
         date_to: str | None = None,
         extended: bool = False,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+        intern: bool = False,
+        checkpoint: T_Checkpoint | None = None,
+        snapshot: bool = False,
+    ) -> list[dict] | list[Scrobble]:
         """Fetches the recent tracks listened to by a specific user.
 
         This method retrieves a list of tracks recently listened to by the
@@ -1352,6 +2294,23 @@ class LastFM:  # noqa PLR0904
                 "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
             extended (bool, optional): Whether to include extended data such
                 as images. Defaults to False.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Scrobble`
+                models instead of dictionaries. Defaults to False.
+            intern (bool, optional): If True, repeated strings like the
+                artist and album names share a single instance across the
+                items, reducing the memory of long results. Defaults to
+                False.
+            checkpoint (T_Checkpoint, optional): Where the completed pages
+                are saved, so an interrupted call continues from its first
+                missing page when run again. Defaults to None.
+            snapshot (bool, optional): If True, the history is read as a
+                consistent snapshot: `date_to` is pinned to the time of the
+                call if not provided, the track playing now is dropped, and
+                the scrobbles sent twice when a page boundary shifts are
+                deduplicated. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries, each containing information
@@ -1362,6 +2321,8 @@ class LastFM:  # noqa PLR0904
                 `date_to`, or if the date format is invalid.
         """
         timestamp_from, timestamp_to = get_timestamp(date_from, date_to)
+        if snapshot and timestamp_to is None:
+            timestamp_to = int(time.time())
 
         payload = {
             'method': USER_GETRECENTTRACKS,
@@ -1371,7 +2332,205 @@ class LastFM:  # noqa PLR0904
             'extended': extended,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'recenttracks', 'track', amount
+            payload,
+            'recenttracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Scrobble if typed else None,
+            intern=intern,
+            checkpoint=checkpoint,
+            item_filter=unique_scrobbles if snapshot else None,
+        )
+
+    def get_user_recent_tracks_columns(
+        self,
+        user: str,
+        amount: int | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+    ) -> ScrobbleColumns:
+        """Fetches the recent tracks of a user into columnar buffers.
+
+        The tracks are appended to the columns while the pages are read, so
+        no dictionary is kept per scrobble. The track that is playing now is
+        skipped. The result can be exposed with `to_numpy` or `to_arrow`.
+
+        Args:
+            user (str): The username of the user whose recent tracks are to
+                be retrieved.
+            amount (int, optional): The number of tracks to retrieve.
+            date_from (str, optional): The start date of the range in
+                "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+            date_to (str, optional): The end date of the range in
+                "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+
+        Returns:
+            ScrobbleColumns: The timestamps and the dictionary encoded
+                artist, album and track names of the scrobbles.
+
+        Raises:
+            LastFMException: If `date_from` is greater than or equal to
+                `date_to`, or if the date format is invalid.
+        """
+        timestamp_from, timestamp_to = get_timestamp(date_from, date_to)
+
+        payload = {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': timestamp_from,
+            'to': timestamp_to,
+        }
+        columns = ScrobbleColumns()
+        columns.extend(
+            self.request_controller.iter_paginated_data(
+                payload, 'recenttracks', 'track', amount
+            )
+        )
+        return columns
+
+    def backfill_user_recent_tracks(  # noqa PLR0917
+        self,
+        user: str,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        workers: int = WORKERS,
+        checkpoint: T_Checkpoint | None = None,
+    ) -> Iterator[dict]:
+        """Fetches the full history of a user in concurrent time windows.
+
+        The range is split into time windows sized from the number of
+        scrobbles, and the windows are fetched concurrently under the rate
+        limit of the client. See `Backfill` for the details.
+
+        Args:
+            user (str): The username of the user whose recent tracks are to
+                be retrieved.
+            date_from (str, optional): The start date of the range in
+                "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format. If not provided,
+                starts at the registration of the user.
+            date_to (str, optional): The end date of the range in
+                "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format. If not provided,
+                ends at the time of the first run.
+            workers (int, optional): The number of windows fetched
+                concurrently. Defaults to `WORKERS`.
+            checkpoint (T_Checkpoint, optional): Where the completed
+                windows are saved, so an interrupted backfill can be resumed
+                by running it again with the same checkpoint. Defaults to
+                None.
+
+        Returns:
+            Iterator[dict]: The scrobbles, from the oldest to the latest,
+                without duplicates and without the track playing now.
+
+        Raises:
+            LastFMException: If `date_from` is greater than or equal to
+                `date_to`, or if the date format is invalid.
+        """
+        timestamp_from, timestamp_to = get_timestamp(date_from, date_to)
+        return iter(
+            Backfill(
+                self.request_controller,
+                user,
+                timestamp_from,
+                timestamp_to,
+                workers,
+                checkpoint,
+            )
+        )
+
+    def sync_user_recent_tracks(
+        self,
+        user: str,
+        store: T_ScrobbleStore,
+        extended: bool = False,
+    ) -> int:
+        """Fetches the new scrobbles of a user into a local store.
+
+        Only the scrobbles since the high-water mark of the user in the
+        store, the timestamp of their latest stored scrobble, are requested
+        through the `from` parameter. Once a user is synced, polling again
+        costs a single small page. The track that is playing now is
+        skipped, and scrobbles already stored are not duplicated.
+
+        Args:
+            user (str): The username of the user whose recent tracks are to
+                be synced.
+            store (T_ScrobbleStore): The local store of scrobbles.
+            extended (bool, optional): Whether to include extended data such
+                as images. Defaults to False.
+
+        Returns:
+            int: The number of new scrobbles added to the store.
+        """
+        payload = {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': store.last_timestamp(user),
+            'extended': extended,
+        }
+        return store.add(
+            user,
+            self.request_controller.iter_paginated_data(
+                payload, 'recenttracks', 'track', None
+            ),
+        )
+
+    @staticmethod
+    def get_user_local_top_chart(  # noqa PLR0917
+        user: str,
+        store: T_ScrobbleStore,
+        chart: T_TopChart = 'artists',
+        date_from: str | None = None,
+        date_to: str | None = None,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist] | list[Album] | list[Track]:
+        """Computes the top chart of a user from a local store.
+
+        Unlike `get_user_top_artists` and the weekly charts, any range of
+        dates is accepted and the chart is exact and complete, since it is
+        counted from the scrobbles synced with `sync_user_recent_tracks`,
+        without requests. Requires the optional `numpy` dependency. See
+        `ScrobbleColumns.top` for the details.
+
+        Args:
+            user (str): The username of the user whose top chart is to be
+                computed.
+            store (T_ScrobbleStore): The local store of scrobbles.
+            chart (T_TopChart, optional): The chart to compute. Defaults to
+                'artists'.
+            date_from (str, optional): The start date of the range, included,
+                in "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+            date_to (str, optional): The end date of the range, excluded, in
+                "YYYY-MM-DD" or "YYYY-MM-DD HH:MM" format.
+            amount (int, optional): The number of items to retrieve. If not
+                provided, defaults to all of them.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`,
+                `Album` or `Track` models instead of dictionaries. Defaults
+                to False.
+
+        Returns:
+            list[dict]: A list of dictionaries in the format of
+                `get_user_top_artists`, `get_user_top_albums` or
+                `get_user_top_tracks`, from the most played.
+
+        Raises:
+            LastFMException: If `date_from` is greater than or equal to
+                `date_to`, or if the date format is invalid.
+        """
+        timestamp_from, timestamp_to = get_timestamp(date_from, date_to)
+        models = {'artists': Artist, 'albums': Album, 'tracks': Track}
+        return parse_result(
+            store.columns(user).top(
+                chart, timestamp_from, timestamp_to, amount
+            ),
+            fields,
+            models[chart] if typed else None,
         )
 
     #########################################################################
@@ -1379,8 +2538,12 @@ class LastFM:  # noqa PLR0904
     #########################################################################
 
     def get_country_top_artists(
-        self, country: T_ISO3166CountryNames, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        country: T_ISO3166CountryNames,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist]:
         """Fetches the top artists for a specified country.
 
         This method retrieves the top artists in a given country based
@@ -1392,6 +2555,11 @@ class LastFM:  # noqa PLR0904
                 (ISO 3166-1 alpha-2) to get top artists for.
             amount (int, optional): The number of top artists to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top artists
@@ -1402,7 +2570,44 @@ class LastFM:  # noqa PLR0904
             'country': country,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'topartists', 'artist', amount
+            payload,
+            'topartists',
+            'artist',
+            amount,
+            fields=fields,
+            model=Artist if typed else None,
+        )
+
+    def get_countries_top_chart(
+        self,
+        chart: Literal['artists', 'tracks'] = 'artists',
+        countries: Iterable[T_ISO3166CountryNames] | None = None,
+        amount: int = GEO_SNAPSHOT_AMOUNT,
+        workers: int = WORKERS,
+    ) -> GeoSnapshot:
+        """Fetches a snapshot of the top charts of many countries.
+
+        The top artists or tracks of each country are fetched concurrently
+        under the rate limit of the client into a columnar snapshot, which
+        can be saved and compared with a previous snapshot to get the rank
+        movements. See `GeoSnapshot` for the details.
+
+        Args:
+            chart (Literal['artists', 'tracks'], optional): The chart to
+                fetch. Defaults to 'artists'.
+            countries (Iterable[T_ISO3166CountryNames], optional): The
+                countries. If None, every country. Defaults to None.
+            amount (int, optional): The number of items of each chart.
+                Defaults to `GEO_SNAPSHOT_AMOUNT`.
+            workers (int, optional): The number of countries fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            GeoSnapshot: The snapshot, with the countries whose request
+                failed in `failed`.
+        """
+        return GeoSnapshot.fetch(
+            self.request_controller, chart, countries, amount, workers
         )
 
     def get_country_top_tracks(
@@ -1410,7 +2615,9 @@ class LastFM:  # noqa PLR0904
         country: T_ISO3166CountryNames,
         location: str | None = None,
         amount: int | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Track]:
         """Fetches the top tracks for a specified country and optional
         location.
 
@@ -1426,6 +2633,11 @@ class LastFM:  # noqa PLR0904
                     data.
             amount (int, optional): The number of top tracks to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top tracks in
@@ -1437,14 +2649,25 @@ class LastFM:  # noqa PLR0904
             'country': country,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'tracks', 'track', amount
+            payload,
+            'tracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Track if typed else None,
         )
 
     #########################################################################
     # TAG
     #########################################################################
 
-    def get_tag_info(self, tag: str, lang: T_ISO639Alpha2Code = 'en') -> dict:
+    def get_tag_info(
+        self,
+        tag: str,
+        lang: T_ISO639Alpha2Code = 'en',
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> dict | Tag:
         """Fetches detailed information about a specific tag.
 
         This method retrieves detailed information about a given tag from
@@ -1454,18 +2677,29 @@ class LastFM:  # noqa PLR0904
             tag (str): The name of the tag to get information about.
             lang (T_ISO639Alpha2Code, optional):
                 The language for the tag information. Defaults to 'en'.
+            fields (list[str], optional): The keys to keep in the response,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a `Tag` model
+                instead of a dictionary. Defaults to False.
 
         Returns:
             dict: A dictionary containing information about the specified tag.
 
         """
         payload = {'method': TAG_GETINFO, 'tag': tag, 'lang': lang}
-        return self.request_controller.request(payload).json()['tag']
+        return parse_result(
+            self.request_controller.request(payload).json()['tag'],
+            fields,
+            Tag if typed else None,
+        )
 
     def get_tag_similar(
         self,
         tag: str | None = None,
-    ) -> list[dict]:
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Tag]:
         """Fetches similar tags to the specified tag.
 
         This method retrieves tags that are similar to the provided tag
@@ -1473,6 +2707,11 @@ class LastFM:  # noqa PLR0904
 
         Args:
             tag (str): The name of the tag to find similar tags for.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Tag`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing tags that are
@@ -1480,13 +2719,96 @@ class LastFM:  # noqa PLR0904
 
         """
         payload = {'method': TAG_GETSIMILAR, 'tag': tag}
-        return self.request_controller.request(payload).json()['similartags'][
-            'tag'
-        ]
+        return parse_result(
+            self.request_controller.request(payload).json()['similartags'][
+                'tag'
+            ],
+            fields,
+            Tag if typed else None,
+        )
+
+    def build_tag_index(  # noqa PLR0917
+        self,
+        tags: Iterable[str],
+        index: TagIndex | None = None,
+        amount: int = TAG_INDEX_AMOUNT,
+        max_age: float | None = None,
+        workers: int = WORKERS,
+    ) -> TagIndex:
+        """Indexes the top artists, albums and tracks of some tags.
+
+        The top charts and the similar tags of each tag are fetched
+        concurrently under the rate limit of the client into an inverted
+        index, answering which entities are most associated with some tags
+        without further requests. Given an existing index, only the tags
+        missing from it or older than `max_age` are fetched. See `TagIndex`
+        for the details.
+
+        Args:
+            tags (Iterable[str]): The names of the tags.
+            index (TagIndex, optional): The index to refresh. If None, a new
+                index is built. Defaults to None.
+            amount (int, optional): The number of items of each chart.
+                Defaults to `TAG_INDEX_AMOUNT`.
+            max_age (float, optional): The age, in seconds, after which an
+                indexed tag is fetched again. If None, indexed tags are not
+                fetched again. Defaults to None.
+            workers (int, optional): The number of requests sent
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            TagIndex: The index.
+        """
+        if index is None:
+            index = TagIndex()
+        index.refresh(self.request_controller, tags, amount, max_age, workers)
+        return index
+
+    def build_tag_cooccurrence(  # noqa PLR0917
+        self,
+        artists: Iterable[str] = (),
+        tracks: Iterable[tuple[str, str]] = (),
+        cooccurrence: TagCooccurrence | None = None,
+        amount: int = TAG_COOCCURRENCE_AMOUNT,
+        workers: int = WORKERS,
+    ) -> TagCooccurrence:
+        """Counts the co-occurrences of the top tags of artists and tracks.
+
+        The top tags of each artist and track are fetched concurrently
+        under the rate limit of the client into a sparse tag by tag matrix,
+        answering which tags are most related to a tag without further
+        requests. Given an existing matrix, only the entities missing from
+        it are fetched. See `TagCooccurrence` for the details.
+
+        Args:
+            artists (Iterable[str], optional): The names of the artists.
+                Defaults to no artists.
+            tracks (Iterable[tuple[str, str]], optional): The artist and
+                the name of the tracks. Defaults to no tracks.
+            cooccurrence (TagCooccurrence, optional): The matrix to extend.
+                If None, a new matrix is built. Defaults to None.
+            amount (int, optional): The number of top tags of each entity
+                counted. Defaults to `TAG_COOCCURRENCE_AMOUNT`.
+            workers (int, optional): The number of requests sent
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            TagCooccurrence: The matrix.
+        """
+        if cooccurrence is None:
+            cooccurrence = TagCooccurrence()
+        cooccurrence.refresh(
+            self.request_controller, artists, tracks, amount, workers
+        )
+        return cooccurrence
 
     def get_tag_top_albums(
-        self, tag: str, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        tag: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Album]:
         """Fetches the top albums associated with a specific tag.
 
         This method retrieves a list of top albums associated with the
@@ -1497,6 +2819,11 @@ class LastFM:  # noqa PLR0904
             tag (str): The name of the tag to get top albums for.
             amount (int, optional): The number of top albums to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Album`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top albums
@@ -1507,12 +2834,21 @@ class LastFM:  # noqa PLR0904
             'tag': tag,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'albums', 'album', amount
+            payload,
+            'albums',
+            'album',
+            amount,
+            fields=fields,
+            model=Album if typed else None,
         )
 
     def get_tag_top_artists(
-        self, tag: str, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        tag: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Artist]:
         """Fetches the top artists associated with a specific tag.
 
         This method retrieves a list of top artists associated with the
@@ -1523,6 +2859,11 @@ class LastFM:  # noqa PLR0904
             tag (str): The name of the tag to get top artists for.
             amount (int, optional): The number of top artists to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Artist`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top albums
@@ -1533,12 +2874,21 @@ class LastFM:  # noqa PLR0904
             'tag': tag,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'topartists', 'artist', amount
+            payload,
+            'topartists',
+            'artist',
+            amount,
+            fields=fields,
+            model=Artist if typed else None,
         )
 
     def get_tag_top_tracks(
-        self, tag: str, amount: int | None = None
-    ) -> list[dict]:
+        self,
+        tag: str,
+        amount: int | None = None,
+        fields: list[str] | None = None,
+        typed: bool = False,
+    ) -> list[dict] | list[Track]:
         """Fetches the top tracks associated with a specific tag.
 
         This method retrieves a list of top tracks associated with the
@@ -1549,6 +2899,11 @@ class LastFM:  # noqa PLR0904
             tag (str): The name of the tag to get top tracks for.
             amount (int, optional): The number of top tracks to retrieve.
                 If not provided, defaults to all available.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. If None, keeps all keys.
+                Defaults to None.
+            typed (bool, optional): If True, returns a list of `Track`
+                models instead of dictionaries. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the top albums
@@ -1559,5 +2914,10 @@ class LastFM:  # noqa PLR0904
             'tag': tag,
         }
         return self.request_controller.get_paginated_data(
-            payload, 'tracks', 'track', amount
+            payload,
+            'tracks',
+            'track',
+            amount,
+            fields=fields,
+            model=Track if typed else None,
         )
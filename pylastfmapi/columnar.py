@@ -0,0 +1,276 @@
+from array import array
+from typing import Any, Iterable
+
+from pylastfmapi.typehints import T_TopChart
+from pylastfmapi.utils import import_optional
+
+
+class StringDictionary:
+    """Dictionary encoding of strings.
+
+    Each distinct string gets a sequential integer ID, so a column of
+    repeated strings can be stored as a compact array of IDs while every
+    distinct value is stored only once.
+    """
+
+    __slots__ = ('_ids', 'values')
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        """Initializes the dictionary, optionally with known values.
+
+        Args:
+            values (Iterable[str], optional): Values to encode, in the order
+                of their IDs. Defaults to no values.
+        """
+        self.values: list[str] = []
+        self._ids: dict[str, int] = {}
+        for value in values:
+            self.encode(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._ids
+
+    def encode(self, value: str) -> int:
+        """Gets the ID of a value, adding it to the dictionary if needed.
+
+        Args:
+            value (str): The value to encode.
+
+        Returns:
+            int: The ID of the value.
+        """
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def get(self, value: str) -> int | None:
+        """Gets the ID of a value without adding it to the dictionary.
+
+        Args:
+            value (str): The value to look for.
+
+        Returns:
+            int | None: The ID of the value, or None if it is not encoded.
+        """
+        return self._ids.get(value)
+
+    def decode(self, value_id: int) -> str:
+        """Gets the value of an ID.
+
+        Args:
+            value_id (int): The ID of the value.
+
+        Returns:
+            str: The encoded value.
+        """
+        return self.values[value_id]
+
+
+class ScrobbleColumns:
+    """Columnar buffers of a user's scrobbles.
+
+    Each scrobble is stored as one row across typed column buffers: the
+    UNIX timestamp as `int64` and the artist, album and track names as
+    `int32` IDs of their `StringDictionary`. The buffers can be exposed
+    as NumPy arrays or as an Arrow table without building one dictionary
+    per scrobble.
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty columns."""
+        self.timestamps = array('q')
+        self.artist_ids = array('i')
+        self.album_ids = array('i')
+        self.track_ids = array('i')
+        self.artists = StringDictionary()
+        self.albums = StringDictionary()
+        self.tracks = StringDictionary()
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, uts: int, artist: str, album: str, track: str) -> None:
+        """Appends one scrobble to the columns.
+
+        Args:
+            uts (int): The UNIX timestamp of the scrobble.
+            artist (str): The artist name.
+            album (str): The album name.
+            track (str): The track name.
+        """
+        self.timestamps.append(uts)
+        self.artist_ids.append(self.artists.encode(artist))
+        self.album_ids.append(self.albums.encode(album))
+        self.track_ids.append(self.tracks.encode(track))
+
+    def append(self, item: dict) -> bool:
+        """Appends a track from `user.getRecentTracks` to the columns.
+
+        Both the regular and the `extended` format are accepted. The track
+        that is playing now has no timestamp and is skipped.
+
+        Args:
+            item (dict): The track as sent by the LastFM API.
+
+        Returns:
+            bool: True if the track was appended.
+        """
+        date = item.get('date')
+        if not date:
+            return False
+        artist = item.get('artist') or {}
+        album = item.get('album') or {}
+        self.add(
+            int(date['uts']),
+            artist.get('name', artist.get('#text', '')),
+            album.get('#text', ''),
+            item.get('name', ''),
+        )
+        return True
+
+    def extend(self, items: Iterable[dict]) -> int:
+        """Appends every track of an iterable to the columns.
+
+        Args:
+            items (Iterable[dict]): The tracks as sent by the LastFM API.
+
+        Returns:
+            int: The number of tracks appended.
+        """
+        return sum(self.append(item) for item in items)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Exposes the columns as NumPy arrays.
+
+        Requires the optional `numpy` dependency.
+
+        Returns:
+            dict[str, numpy.ndarray]: The `timestamp` (`int64`), and the
+                `artist_id`, `album_id` and `track_id` (`int32`) columns,
+                with the dictionaries in `artists`, `albums` and `tracks`
+                as arrays of strings.
+        """
+        np = import_optional('numpy')
+        return {
+            'timestamp': np.array(self.timestamps, dtype=np.int64),
+            'artist_id': np.array(self.artist_ids, dtype=np.int32),
+            'album_id': np.array(self.album_ids, dtype=np.int32),
+            'track_id': np.array(self.track_ids, dtype=np.int32),
+            'artists': np.array(self.artists.values, dtype=np.str_),
+            'albums': np.array(self.albums.values, dtype=np.str_),
+            'tracks': np.array(self.tracks.values, dtype=np.str_),
+        }
+
+    def to_arrow(self) -> Any:
+        """Exposes the columns as an Arrow table.
+
+        The names are stored as dictionary arrays, sharing the same IDs as
+        the columns. Requires the optional `pyarrow` dependency.
+
+        Returns:
+            pyarrow.Table: A table with the `timestamp`, `artist`, `album`
+                and `track` columns.
+        """
+        pa = import_optional('pyarrow')
+
+        def _column(values: array, data_type: Any) -> Any:
+            return pa.Array.from_buffers(
+                data_type, len(values), [None, pa.py_buffer(values.tobytes())]
+            )
+
+        def _dictionary(ids: array, values: StringDictionary) -> Any:
+            return pa.DictionaryArray.from_arrays(
+                _column(ids, pa.int32()),
+                pa.array(values.values, type=pa.string()),
+            )
+
+        return pa.table({
+            'timestamp': _column(self.timestamps, pa.int64()),
+            'artist': _dictionary(self.artist_ids, self.artists),
+            'album': _dictionary(self.album_ids, self.albums),
+            'track': _dictionary(self.track_ids, self.tracks),
+        })
+
+    def top(
+        self,
+        chart: T_TopChart = 'artists',
+        timestamp_from: int | None = None,
+        timestamp_to: int | None = None,
+        amount: int | None = None,
+    ) -> list[dict]:
+        """Computes the top artists, albums or tracks of the scrobbles.
+
+        The scrobbles of the range are counted with `numpy.bincount` over
+        the dictionary encoded IDs, so any range is computed exactly and
+        without requests. Albums and tracks are counted by artist and name,
+        and the scrobbles without an album are not counted as an album.
+        Requires the optional `numpy` dependency.
+
+        Args:
+            chart (T_TopChart, optional): The chart to compute. Defaults to
+                'artists'.
+            timestamp_from (int, optional): The UNIX timestamp of the start
+                of the range, included. If None, starts at the oldest
+                scrobble. Defaults to None.
+            timestamp_to (int, optional): The UNIX timestamp of the end of
+                the range, excluded. If None, ends after the latest
+                scrobble. Defaults to None.
+            amount (int, optional): The number of items. If None, all of
+                them. Defaults to None.
+
+        Returns:
+            list[dict]: The items from the most played, as sent by the
+                `user.getTop*` methods of the LastFM API: the `name`, the
+                `artist` of albums and tracks, the `playcount` and the
+                `rank` in `@attr`. Ties are ordered by the IDs of the
+                items.
+        """
+        np = import_optional('numpy')
+        timestamps = np.frombuffer(self.timestamps, dtype=np.int64)
+        mask = np.ones(len(timestamps), dtype=bool)
+        if timestamp_from is not None:
+            mask &= timestamps >= timestamp_from
+        if timestamp_to is not None:
+            mask &= timestamps < timestamp_to
+        artist_ids = np.frombuffer(self.artist_ids, dtype=np.int32)[mask]
+
+        if chart == 'artists':
+            counts = np.bincount(artist_ids, minlength=len(self.artists))
+            keys = np.arange(len(counts))
+            names = self.artists
+        else:
+            ids, names = {
+                'albums': (self.album_ids, self.albums),
+                'tracks': (self.track_ids, self.tracks),
+            }[chart]
+            ids = np.frombuffer(ids, dtype=np.int32)[mask]
+            if chart == 'albums' and '' in names:
+                artist_ids = artist_ids[ids != names.get('')]
+                ids = ids[ids != names.get('')]
+            # The pairs of artist and name are encoded as a single integer,
+            # then mapped to dense IDs to be counted.
+            pairs = artist_ids.astype(np.int64) * len(names) + ids
+            keys, inverse = np.unique(pairs, return_inverse=True)
+            counts = np.bincount(inverse, minlength=len(keys))
+
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0][:amount]
+        items = []
+        for rank, index in enumerate(order.tolist(), 1):
+            if chart == 'artists':
+                item = {'name': names.decode(index)}
+            else:
+                artist_id, name_id = divmod(int(keys[index]), len(names))
+                item = {
+                    'name': names.decode(name_id),
+                    'artist': {'name': self.artists.decode(artist_id)},
+                }
+            item['playcount'] = str(counts[index])
+            item['@attr'] = {'rank': str(rank)}
+            items.append(item)
+        return items
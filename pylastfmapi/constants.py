@@ -24,6 +24,109 @@ MAX_WEEKLY_CHART = 1000
 This is set in LastFM backend for the weekly data from users.
 """
 
+STREAM_CHUNK_SIZE = 64 * 1024
+"""
+The size in bytes of each chunk read from the response body when the items
+of a page are streamed instead of decoded at once.
+"""
+
+REQUEST_INTERVAL = 0.25
+"""
+The minimum interval in seconds between two requests sent to the LastFM API
+that are not served from the cache, shared by all the threads of a client.
+"""
+
+WORKERS = 4
+"""
+The default number of threads sending concurrent requests to the LastFM API.
+"""
+
+BACKFILL_WINDOW_PAGES = 10
+"""
+The maximum number of pages fetched in a single time window of a backfill.
+Windows with more pages are split into smaller windows.
+"""
+
+CRAWL_MAX_DEPTH = 2
+"""
+The default number of hops from the seeds followed by a crawl of the friends
+or similar artists graph.
+"""
+
+CRAWL_MAX_NODES = 10_000
+"""
+The default maximum number of users or artists fetched by a crawl.
+"""
+
+CRAWL_SAVE_INTERVAL = 100
+"""
+The number of users fetched by a friends crawl between two saves of its
+frontier in the checkpoint.
+"""
+
+TAG_INDEX_AMOUNT = 100
+"""
+The default number of top artists, albums and tracks of each tag kept in a
+tag index.
+"""
+
+TAG_COOCCURRENCE_AMOUNT = 10
+"""
+The default number of top tags of each artist or track counted in a tag
+co-occurrence matrix.
+"""
+
+GEO_SNAPSHOT_AMOUNT = 50
+"""
+The default number of top artists or tracks of each country kept in a geo
+snapshot.
+"""
+
+STORE_BATCH_SIZE = 1000
+"""
+The number of items inserted in each transaction of a SQLite store.
+"""
+
+SESSION_GAP = 30 * 60
+"""
+The default longest time, in seconds, between two scrobbles of the same
+listening session.
+"""
+
+SEARCH_CACHE_TTL = 60 * 60
+"""
+The default number of seconds the results of a search are kept in a search
+cache.
+"""
+
+SEARCH_CACHE_SIZE = 10_000
+"""
+The default maximum number of search results kept in a search cache.
+"""
+
+SEARCH_MIN_SIMILARITY = 0.75
+"""
+The default fraction of the trigrams of a query that the name of an item of
+a search index must have to answer the search without the API.
+"""
+
+SEARCH_INDEX_AMOUNT = 10
+"""
+The default number of results of a search answered by a search index, which
+can't know if it has all the results of the API.
+"""
+
+TASTE_AMOUNT = 100
+"""
+The default number of top artists of each user kept in a taste matrix.
+"""
+
+TASTE_BLOCK_SIZE = 256
+"""
+The default number of users whose similarities are computed at once in a
+taste matrix.
+"""
+
 #############################################################################
 ALBUM_GETINFO = 'album.getInfo'
 ALBUM_GETTAGS = 'album.getTags'
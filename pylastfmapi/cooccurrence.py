@@ -0,0 +1,332 @@
+import base64
+import json
+import math
+from array import array
+from itertools import permutations
+from pathlib import Path
+from typing import Any, Iterable, Literal
+
+from pylastfmapi.columnar import StringDictionary
+from pylastfmapi.constants import (
+    ARTIST_GETTOPTAGS,
+    TAG_COOCCURRENCE_AMOUNT,
+    TRACK_GETTOPTAGS,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.utils import import_optional, iter_concurrently
+
+
+class TagCooccurrence:
+    """A sparse tag by tag matrix of the co-occurrences of tags.
+
+    The top tags of each artist or track are weighted by their `count`,
+    from 1 for the top tag down to 0, and every pair of top tags of an
+    entity adds the product of their weights to the matrix. The tags are
+    dictionary encoded, the new pairs are appended to typed buffers of
+    `int32` IDs and `float32` weights, and they are merged into compressed
+    sparse rows when the matrix is queried. Tags are matched ignoring the
+    case. Requires the optional `numpy` dependency to query the matrix.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty matrix."""
+        self.tags = StringDictionary()
+        self.entities: set[str] = set()
+        self.weights = array('f')
+        self._pending = (array('i'), array('i'), array('f'))
+        self._rows: Any = None
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag.casefold() in self.tags
+
+    def add(
+        self,
+        entity: str,
+        tags: list[dict],
+        amount: int = TAG_COOCCURRENCE_AMOUNT,
+    ) -> bool:
+        """Adds the top tags of an artist or a track to the matrix.
+
+        Args:
+            entity (str): The key of the artist or the track, as in
+                `entity_key`. An entity already added is skipped.
+            tags (list[dict]): The top tags of the entity, as sent by the
+                LastFM API.
+            amount (int, optional): The number of top tags of the entity
+                kept. Defaults to `TAG_COOCCURRENCE_AMOUNT`.
+
+        Returns:
+            bool: True if the entity was added.
+        """
+        if entity in self.entities:
+            return False
+        self.entities.add(entity)
+
+        weights: dict[int, float] = {}
+        for tag in tags[:amount]:
+            weight = int(tag.get('count') or 0) / 100
+            if weight > 0:
+                tag_id = self.tags.encode(tag['name'].casefold())
+                weights[tag_id] = max(weight, weights.get(tag_id, 0))
+        self.weights.extend([0] * (len(self.tags) - len(self.weights)))
+        for tag_id, weight in weights.items():
+            self.weights[tag_id] += weight
+
+        rows, columns, values = self._pending
+        for (row, row_weight), (column, weight) in permutations(
+            weights.items(), 2
+        ):
+            rows.append(row)
+            columns.append(column)
+            values.append(row_weight * weight)
+        return True
+
+    def matrix(self) -> tuple[Any, Any, Any]:
+        """Gets the matrix in compressed sparse rows, merging the pairs
+        added since the last query.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The start
+                of the co-occurrences of each tag in the other arrays
+                (`int64`), with their number at the end, the IDs of the
+                other tags (`int32`) and the co-occurrence weights
+                (`float32`).
+        """
+        np = import_optional('numpy')
+        if self._rows is None:
+            self._rows = (
+                np.zeros(1, dtype=np.int64),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.float32),
+            )
+        indptr, indices, values = self._rows
+        size = len(self.tags)
+        if len(indptr) == size + 1 and not self._pending[0]:
+            return self._rows
+
+        rows, columns, weights = self._pending
+        keys = np.concatenate((
+            np.repeat(np.arange(len(indptr) - 1), np.diff(indptr)) * size
+            + indices,
+            np.frombuffer(rows, dtype=np.int32).astype(np.int64) * size
+            + np.frombuffer(columns, dtype=np.int32),
+        ))
+        keys, inverse = np.unique(keys, return_inverse=True)
+        values = np.bincount(
+            inverse,
+            weights=np.concatenate((
+                values,
+                np.frombuffer(weights, dtype=np.float32),
+            )),
+            minlength=len(keys),
+        ).astype(np.float32)
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // size, minlength=size), out=indptr[1:])
+        self._rows = (indptr, (keys % size).astype(np.int32), values)
+        self._pending = (array('i'), array('i'), array('f'))
+        return self._rows
+
+    def count(self, tag: str, other: str) -> float:
+        """Gets the co-occurrence weight of two tags.
+
+        Args:
+            tag (str): The name of a tag.
+            other (str): The name of another tag.
+
+        Returns:
+            float: The sum, over the entities with both tags, of the
+                product of their weights. 0 if a tag is unknown.
+        """
+        tag_id = self.tags.get(tag.casefold())
+        other_id = self.tags.get(other.casefold())
+        if tag_id is None or other_id is None:
+            return 0.0
+        indptr, indices, values = self.matrix()
+        start, end = indptr[tag_id], indptr[tag_id + 1]
+        matches = values[start:end][indices[start:end] == other_id]
+        return float(matches[0]) if len(matches) else 0.0
+
+    def pmi(self, tag: str, other: str) -> float | None:
+        """Computes the pointwise mutual information of two tags.
+
+        Args:
+            tag (str): The name of a tag.
+            other (str): The name of another tag.
+
+        Returns:
+            float | None: The logarithm of the ratio of the co-occurrence
+                of the tags to the co-occurrence expected if they were
+                independent, or None if they never occur together.
+        """
+        count = self.count(tag, other)
+        if not count:
+            return None
+        return math.log(
+            count
+            * len(self.entities)
+            / (
+                self.weights[self.tags.get(tag.casefold())]
+                * self.weights[self.tags.get(other.casefold())]
+            )
+        )
+
+    def related(
+        self,
+        tag: str,
+        amount: int = 10,
+        measure: Literal['pmi', 'count'] = 'pmi',
+        min_count: float = 0,
+    ) -> list[dict]:
+        """Gets the tags most related to a tag.
+
+        Args:
+            tag (str): The name of the tag.
+            amount (int, optional): The number of tags. Defaults to 10.
+            measure (Literal['pmi', 'count'], optional): If 'pmi', the
+                tags are ranked by their pointwise mutual information with
+                the tag, and if 'count', by their co-occurrence weight.
+                Defaults to 'pmi'.
+            min_count (float, optional): The minimum co-occurrence weight
+                of the tags ranked, since the PMI favours the rare tags.
+                Defaults to 0.
+
+        Returns:
+            list[dict]: The `name` of each tag, its co-occurrence weight
+                `count` and its `pmi`, from the most related. Empty if the
+                tag is unknown.
+        """
+        np = import_optional('numpy')
+        tag_id = self.tags.get(tag.casefold())
+        if tag_id is None:
+            return []
+        indptr, indices, values = self.matrix()
+        start, end = indptr[tag_id], indptr[tag_id + 1]
+        others, counts = indices[start:end], values[start:end]
+        keep = counts >= min_count
+        others, counts = others[keep], counts[keep]
+
+        weights = np.frombuffer(self.weights, dtype=np.float32)
+        pmis = np.log(
+            counts.astype(np.float64)
+            * len(self.entities)
+            / (weights[tag_id] * weights[others].astype(np.float64))
+        )
+        scores = pmis if measure == 'pmi' else counts
+        order = np.argsort(-scores, kind='stable')[:amount]
+        return [
+            {
+                'name': self.tags.decode(int(others[index])),
+                'count': float(counts[index]),
+                'pmi': float(pmis[index]),
+            }
+            for index in order
+        ]
+
+    def refresh(  # noqa PLR0917
+        self,
+        request_controller: RequestController,
+        artists: Iterable[str] = (),
+        tracks: Iterable[tuple[str, str]] = (),
+        amount: int = TAG_COOCCURRENCE_AMOUNT,
+        workers: int = WORKERS,
+    ) -> int:
+        """Fetches the top tags of the artists and tracks not in the matrix.
+
+        The top tags of each entity are fetched concurrently under the rate
+        limit of the `RequestController`, and the cached responses are
+        served without waiting for it. An entity whose request fails is
+        not added, so it's fetched again by the next refresh.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            artists (Iterable[str], optional): The names of the artists.
+                Defaults to no artists.
+            tracks (Iterable[tuple[str, str]], optional): The artist and
+                the name of the tracks. Defaults to no tracks.
+            amount (int, optional): The number of top tags of each entity
+                kept. Defaults to `TAG_COOCCURRENCE_AMOUNT`.
+            workers (int, optional): The number of requests sent
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            int: The number of entities added.
+        """
+
+        def _request(key: str) -> list[dict]:
+            artist, separator, track = key.partition('\t')
+            if separator:
+                payload = {
+                    'method': TRACK_GETTOPTAGS,
+                    'artist': artist,
+                    'track': track,
+                }
+            else:
+                payload = {'method': ARTIST_GETTOPTAGS, 'artist': artist}
+            response = request_controller.request(payload)
+            tags = response.json()['toptags']['tag']
+            # An entity with a single tag sends it without a list.
+            return [tags] if isinstance(tags, dict) else tags
+
+        keys = [
+            key
+            for key in dict.fromkeys([
+                *artists,
+                *(f'{artist}\t{track}' for artist, track in tracks),
+            ])
+            if key not in self.entities
+        ]
+        added = 0
+        for key, tags in iter_concurrently(_request, keys, workers):
+            if not isinstance(tags, Exception):
+                added += self.add(key, tags, amount)
+        return added
+
+    def save(self, path: str | Path) -> None:
+        """Saves the matrix in a JSON file.
+
+        Args:
+            path (str | Path): The path of the file.
+        """
+        indptr, indices, values = self.matrix()
+        Path(path).write_text(
+            json.dumps({
+                'tags': self.tags.values,
+                'entities': sorted(self.entities),
+                'weights': base64.b64encode(self.weights.tobytes()).decode(),
+                'indptr': base64.b64encode(indptr.tobytes()).decode(),
+                'indices': base64.b64encode(indices.tobytes()).decode(),
+                'values': base64.b64encode(values.tobytes()).decode(),
+            }),
+            encoding='utf-8',
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'TagCooccurrence':
+        """Loads a matrix saved with `save`.
+
+        Args:
+            path (str | Path): The path of the file.
+
+        Returns:
+            TagCooccurrence: The matrix.
+        """
+        np = import_optional('numpy')
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        cooccurrence = cls()
+        cooccurrence.tags = StringDictionary(data['tags'])
+        cooccurrence.entities = set(data['entities'])
+        cooccurrence.weights.frombytes(base64.b64decode(data['weights']))
+        cooccurrence._rows = tuple(
+            np.frombuffer(base64.b64decode(data[name]), dtype=dtype).copy()
+            for name, dtype in (
+                ('indptr', np.int64),
+                ('indices', np.int32),
+                ('values', np.float32),
+            )
+        )
+        return cooccurrence
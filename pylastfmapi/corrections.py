@@ -0,0 +1,196 @@
+import json
+from itertools import chain
+from pathlib import Path
+from typing import Iterable
+
+from pylastfmapi.constants import (
+    ARTIST_GETCORRECTION,
+    TRACK_GETCORRECTION,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.utils import iter_concurrently
+
+# T_Correction is a type alias for a canonical name: the artist, the track,
+# None for artists, and the MusicBrainz ID, empty if LastFM has none.
+T_Correction = tuple[str, str | None, str]
+
+
+class CorrectionIndex:
+    """An index of the raw artist and track names to their canonical names.
+
+    The corrections of LastFM are fetched once per distinct name, and kept
+    in a dictionary keyed by the raw artist name, or by the raw artist and
+    track names separated by a tab, so resolving a name is a single lookup
+    that sends no request. A name without a correction is its own canonical
+    name. The names are matched exactly, as they are scrobbled.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self.corrections: dict[str, T_Correction] = {}
+
+    def __len__(self) -> int:
+        return len(self.corrections)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.corrections
+
+    def get(
+        self, artist: str, track: str | None = None
+    ) -> T_Correction | None:
+        """Gets the canonical name of an artist or a track.
+
+        Args:
+            artist (str): The raw name of the artist.
+            track (str, optional): The raw name of the track. If None, the
+                artist is resolved. Defaults to None.
+
+        Returns:
+            T_Correction | None: The canonical artist, track and MBID, or
+                None if the name is not in the index.
+        """
+        if track is None:
+            return self.corrections.get(artist)
+        return self.corrections.get(f'{artist}\t{track}')
+
+    def resolve(self, artist: str, track: str | None = None) -> T_Correction:
+        """Gets the canonical name of an artist or a track, falling back to
+        the raw name.
+
+        Args:
+            artist (str): The raw name of the artist.
+            track (str, optional): The raw name of the track. If None, the
+                artist is resolved. Defaults to None.
+
+        Returns:
+            T_Correction: The canonical artist, track and MBID, or the raw
+                names with an empty MBID if the name is not in the index.
+        """
+        return self.get(artist, track) or (artist, track, '')
+
+    def add(
+        self, artist: str, track: str | None, correction: dict | str
+    ) -> None:
+        """Adds the correction of an artist or a track to the index.
+
+        Args:
+            artist (str): The raw name of the artist.
+            track (str | None): The raw name of the track, or None for an
+                artist.
+            correction (dict | str): The `corrections` of the response of
+                `artist.getCorrection` or `track.getCorrection`, as sent by
+                the LastFM API.
+        """
+        entity = _corrected_entity(
+            correction, 'artist' if track is None else 'track'
+        )
+        if track is None:
+            self.corrections[artist] = (
+                entity.get('name') or artist,
+                None,
+                entity.get('mbid') or '',
+            )
+            return
+        entity_artist = entity.get('artist') or {}
+        self.corrections[f'{artist}\t{track}'] = (
+            entity_artist.get('name') or artist,
+            entity.get('name') or track,
+            entity.get('mbid') or '',
+        )
+
+    def refresh(
+        self,
+        request_controller: RequestController,
+        artists: Iterable[str] = (),
+        tracks: Iterable[tuple[str, str]] = (),
+        workers: int = WORKERS,
+    ) -> int:
+        """Fetches the corrections of the names not in the index.
+
+        The names are deduplicated before their corrections are fetched
+        concurrently under the rate limit of the `RequestController`, so a
+        name repeated in millions of scrobbles is requested once. A name
+        whose request fails is not added, so it's fetched again by the next
+        refresh.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            artists (Iterable[str], optional): The raw names of the
+                artists. Defaults to no artists.
+            tracks (Iterable[tuple[str, str]], optional): The raw artist
+                and track names of the tracks. Defaults to no tracks.
+            workers (int, optional): The number of requests sent
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            int: The number of names added.
+        """
+
+        def _request(key: str) -> dict:
+            artist, separator, track = key.partition('\t')
+            if separator:
+                payload = {
+                    'method': TRACK_GETCORRECTION,
+                    'artist': artist,
+                    'track': track,
+                }
+            else:
+                payload = {'method': ARTIST_GETCORRECTION, 'artist': artist}
+            return request_controller.request(payload).json()['corrections']
+
+        keys = (
+            key
+            for key in chain(
+                artists, (f'{artist}\t{track}' for artist, track in tracks)
+            )
+            if key not in self.corrections
+        )
+        added = 0
+        for key, correction in iter_concurrently(_request, keys, workers):
+            if not isinstance(correction, Exception):
+                artist, separator, track = key.partition('\t')
+                self.add(artist, track if separator else None, correction)
+                added += 1
+        return added
+
+    def save(self, path: str | Path) -> None:
+        """Saves the index in a JSON file.
+
+        Args:
+            path (str | Path): The path of the file.
+        """
+        Path(path).write_text(json.dumps(self.corrections), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'CorrectionIndex':
+        """Loads an index saved with `save`.
+
+        Args:
+            path (str | Path): The path of the file.
+
+        Returns:
+            CorrectionIndex: The index.
+        """
+        index = cls()
+        index.corrections = {
+            key: tuple(correction)
+            for key, correction in json.loads(
+                Path(path).read_text(encoding='utf-8')
+            ).items()
+        }
+        return index
+
+
+def _corrected_entity(correction: dict | str, kind: str) -> dict:
+    """Gets the corrected artist or track of a response, or an empty
+    dictionary if LastFM has no correction."""
+    # Without a correction, LastFM sends a blank string.
+    if not isinstance(correction, dict):
+        return {}
+    correction = correction.get('correction') or {}
+    # With many corrections, LastFM sends a list, from the best one.
+    if isinstance(correction, list):
+        correction = correction[0] if correction else {}
+    return correction.get(kind) or {}
@@ -0,0 +1,276 @@
+import base64
+import hashlib
+import heapq
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from math import ceil, log
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+import requests
+
+from pylastfmapi.checkpoint import T_Checkpoint
+from pylastfmapi.constants import (
+    CRAWL_MAX_DEPTH,
+    CRAWL_MAX_NODES,
+    CRAWL_SAVE_INTERVAL,
+    USER_GETFRIENDS,
+    WORKERS,
+)
+from pylastfmapi.exceptions import LastFMException, RequestErrorException
+from pylastfmapi.request import RequestController
+
+
+class BloomFilter:
+    """A compact set of strings with false positives.
+
+    The strings are not stored, only a few bits set by their hashes, so a
+    string that was never added may be found in the filter, at a rate close
+    to `error_rate` while the filter has at most `capacity` strings. A
+    string that was added is always found.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float = 0.01,
+        bits: bytes | None = None,
+    ) -> None:
+        """Initializes the filter, optionally with the bits of another one.
+
+        Args:
+            capacity (int): The number of strings expected in the filter.
+            error_rate (float, optional): The rate of false positives when
+                the filter is full. Defaults to 0.01.
+            bits (bytes, optional): The bits of a filter created with the
+                same `capacity` and `error_rate`, as in `to_bytes`.
+                Defaults to an empty filter.
+        """
+        self.size = max(8, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self.hashes = max(1, round(self.size / max(1, capacity) * log(2)))
+        self.bits = bytearray(bits or ceil(self.size / 8))
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def _positions(self, value: str) -> Iterator[int]:
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8])
+        second = int.from_bytes(digest[8:]) | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, value: str) -> bool:
+        """Adds a string to the filter.
+
+        Args:
+            value (str): The string to add.
+
+        Returns:
+            bool: True if the string was not found in the filter before.
+        """
+        added = False
+        for position in self._positions(value):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        return added
+
+    def to_bytes(self) -> bytes:
+        """Gets the bits of the filter.
+
+        Returns:
+            bytes: The bits, to create the same filter again.
+        """
+        return bytes(self.bits)
+
+
+class FriendsCrawler:
+    """Crawls the friends graph of LastFM around some seed users.
+
+    The crawl starts at the seed users and follows their friends, fetched
+    with `user.getFriends`, for up to `max_depth` hops. The frontier is
+    visited in breadth-first order, or by the `priority` of each friend.
+    At most `max_nodes` users are fetched, concurrently under the rate
+    limit of the `RequestController`.
+
+    Each fetched user writes its edges to a tab separated file, one
+    `user<TAB>friend` line per friend, as soon as it is fetched. The users
+    already found are kept in a `BloomFilter`, so a few users may be
+    skipped as false positives, but the memory doesn't grow with the size
+    of the neighbourhood. The frontier is saved in the checkpoint every
+    `save_interval` users, and a rerun resumes from the last save.
+    """
+
+    def __init__(  # noqa PLR0917
+        self,
+        request_controller: RequestController,
+        seeds: Iterable[str],
+        edges_path: str | Path,
+        max_depth: int = CRAWL_MAX_DEPTH,
+        max_nodes: int = CRAWL_MAX_NODES,
+        workers: int = WORKERS,
+        checkpoint: T_Checkpoint | None = None,
+        priority: Callable[[dict], float] | None = None,
+        save_interval: int = CRAWL_SAVE_INTERVAL,
+    ) -> None:
+        """Initializes the crawl.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            seeds (Iterable[str]): The usernames where the crawl starts.
+            edges_path (str | Path): The path of the file where the edges
+                are written.
+            max_depth (int, optional): The number of hops from the seeds.
+                The users at `max_depth` are fetched, but their friends
+                are not followed. Defaults to `CRAWL_MAX_DEPTH`.
+            max_nodes (int, optional): The maximum number of users fetched.
+                Defaults to `CRAWL_MAX_NODES`.
+            workers (int, optional): The number of users fetched
+                concurrently. Defaults to `WORKERS`.
+            checkpoint (T_Checkpoint, optional): Where the frontier is
+                saved. Defaults to None.
+            priority (Callable[[dict], float], optional): A function giving
+                the priority of a friend, as sent by the LastFM API. Lower
+                values are fetched first. If None, the frontier is visited
+                in breadth-first order. Defaults to None.
+            save_interval (int, optional): The number of users fetched
+                between two saves of the frontier. Defaults to
+                `CRAWL_SAVE_INTERVAL`.
+        """
+        self.request_controller = request_controller
+        self.seeds = list(seeds)
+        self.edges_path = Path(edges_path)
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.priority = priority
+        self.save_interval = save_interval
+        self.visited = BloomFilter(max_nodes)
+
+    def __iter__(self) -> Iterator[tuple[str, int, list[dict] | Exception]]:
+        state = self._load()
+        pending: dict[Future, list] = {}
+        self.edges_path.touch()
+
+        with (
+            self.edges_path.open('r+b') as edges,
+            ThreadPoolExecutor(self.workers) as executor,
+        ):
+            # The edges written after the last save are written again by
+            # the rerun, so they are dropped.
+            edges.truncate(state['edges'])
+            edges.seek(state['edges'])
+
+            while state['frontier'] or pending:
+                while state['frontier'] and len(pending) < 2 * self.workers:
+                    entry = heapq.heappop(state['frontier'])
+                    future = executor.submit(self._request_friends, entry[3])
+                    pending[future] = entry
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = pending.pop(future)
+                    _, _, depth, user = entry
+                    try:
+                        friends = future.result()
+                    except (
+                        LastFMException,
+                        RequestErrorException,
+                        requests.RequestException,
+                    ) as error:
+                        friends = error
+                    else:
+                        edges.writelines(
+                            f'{user}\t{friend["name"]}\n'.encode()
+                            for friend in friends
+                        )
+                        if depth < self.max_depth:
+                            self._push(state, friends, depth + 1)
+
+                    state['crawled'] += 1
+                    if state['crawled'] % self.save_interval == 0:
+                        self._save(state, pending.values(), edges)
+                    yield user, depth, friends
+
+            self._save(state, (), edges)
+
+    def _load(self) -> dict:
+        if self.checkpoint is not None:
+            state = self.checkpoint.get(self._key())
+            if state is not None:
+                self.visited = BloomFilter(
+                    self.max_nodes, bits=base64.b64decode(state['visited'])
+                )
+                return state
+
+        self.visited = BloomFilter(self.max_nodes)
+        state = {
+            'frontier': [],
+            'sequence': 0,
+            'found': 0,
+            'crawled': 0,
+            'edges': 0,
+        }
+        for seed in self.seeds:
+            # The seeds are fetched before any friend, whatever their
+            # priority.
+            self._enqueue(state, float('-inf'), 0, seed)
+        return state
+
+    def _save(
+        self, state: dict, pending: Iterable[list], edges: BinaryIO
+    ) -> None:
+        if self.checkpoint is None:
+            return
+        edges.flush()
+        frontier = state['frontier'] + list(pending)
+        heapq.heapify(frontier)
+        self.checkpoint.set(
+            self._key(),
+            {
+                **state,
+                'frontier': frontier,
+                'edges': edges.tell(),
+                'visited': base64.b64encode(self.visited.to_bytes()).decode(),
+            },
+        )
+
+    def _key(self) -> str:
+        return f'crawler:{",".join(sorted(self.seeds))}'
+
+    def _enqueue(
+        self, state: dict, rank: float, depth: int, user: str
+    ) -> None:
+        if not self.visited.add(user):
+            return
+        heapq.heappush(
+            state['frontier'], [rank, state['sequence'], depth, user]
+        )
+        state['sequence'] += 1
+        state['found'] += 1
+
+    def _push(self, state: dict, friends: list[dict], depth: int) -> None:
+        for friend in friends:
+            if state['found'] >= self.max_nodes:
+                return
+            rank = depth if self.priority is None else self.priority(friend)
+            self._enqueue(state, rank, depth, friend['name'])
+
+    def _request_friends(self, user: str) -> list[dict]:
+        return self.request_controller.get_paginated_data(
+            {'method': USER_GETFRIENDS, 'user': user},
+            'friends',
+            'user',
+            None,
+        )
@@ -0,0 +1,291 @@
+import base64
+import json
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Literal, get_args
+
+from pylastfmapi.columnar import StringDictionary
+from pylastfmapi.constants import (
+    GEO_GETOPTRACKS,
+    GEO_GETTOPARTISTS,
+    GEO_SNAPSHOT_AMOUNT,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.typehints import T_ISO3166CountryNames
+from pylastfmapi.utils import (
+    entity_key,
+    import_optional,
+    iter_concurrently,
+    parse_entity_key,
+)
+
+# The endpoint and the keys of the list of items of each chart of a country.
+CHARTS: dict[str, tuple[str, str, str]] = {
+    'artists': (GEO_GETTOPARTISTS, 'topartists', 'artist'),
+    'tracks': (GEO_GETOPTRACKS, 'tracks', 'track'),
+}
+
+# The typecode of each column of a snapshot.
+COLUMNS = {
+    'country_ids': 'i',
+    'ranks': 'i',
+    'entity_ids': 'i',
+    'listeners': 'q',
+}
+
+
+class GeoSnapshot:
+    """The top artists or tracks of many countries at a point in time.
+
+    Each entry of a country chart is stored as one row across typed column
+    buffers: the country and the entity as `int32` IDs of their
+    `StringDictionary`, the rank, starting at 1, as `int32` and the number
+    of listeners as `int64`. The rank movements since a previous snapshot
+    are computed from the stored columns, without requests.
+    """
+
+    def __init__(
+        self,
+        chart: Literal['artists', 'tracks'] = 'artists',
+        created: float | None = None,
+    ) -> None:
+        """Initializes an empty snapshot.
+
+        Args:
+            chart (Literal['artists', 'tracks'], optional): The chart of the
+                snapshot. Defaults to 'artists'.
+            created (float, optional): The UNIX time of the snapshot. If
+                None, the current time. Defaults to None.
+        """
+        self.chart = chart
+        self.created = time.time() if created is None else created
+        self.countries = StringDictionary()
+        self.entities = StringDictionary()
+        self.country_ids = array('i')
+        self.ranks = array('i')
+        self.entity_ids = array('i')
+        self.listeners = array('q')
+        self.failed: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    def add(self, country: str, items: list[dict]) -> None:
+        """Appends the chart of a country to the snapshot.
+
+        Args:
+            country (str): The name of the country.
+            items (list[dict]): The items of the chart, as sent by the
+                LastFM API, from the first.
+        """
+        country_id = self.countries.encode(country)
+        for rank, item in enumerate(items, 1):
+            self.country_ids.append(country_id)
+            self.ranks.append(rank)
+            self.entity_ids.append(self.entities.encode(entity_key(item)))
+            self.listeners.append(int(item.get('listeners') or 0))
+
+    def rows(self) -> Iterable[tuple[str, int, str, int]]:
+        """Iterates over the rows of the snapshot.
+
+        Yields:
+            tuple[str, int, str, int]: The country, the rank, the key of the
+                entity, as in `entity_key`, and the number of listeners.
+        """
+        for country_id, rank, entity_id, listeners in zip(
+            self.country_ids, self.ranks, self.entity_ids, self.listeners
+        ):
+            yield (
+                self.countries.decode(country_id),
+                rank,
+                self.entities.decode(entity_id),
+                listeners,
+            )
+
+    def get(self, country: str) -> list[dict]:
+        """Gets the chart of a country.
+
+        Args:
+            country (str): The name of the country.
+
+        Returns:
+            list[dict]: The `name` of each entity, with the `artist` of
+                tracks, its `rank` and its `listeners`, from the first.
+                Empty if the country is not in the snapshot.
+        """
+        country_id = self.countries.get(country)
+        return [
+            {
+                **parse_entity_key(self.entities.decode(entity_id)),
+                'rank': rank,
+                'listeners': listeners,
+            }
+            for row_country_id, rank, entity_id, listeners in zip(
+                self.country_ids, self.ranks, self.entity_ids, self.listeners
+            )
+            if row_country_id == country_id
+        ]
+
+    def diff(self, previous: 'GeoSnapshot') -> list[dict]:
+        """Computes the rank movements since a previous snapshot.
+
+        Only the countries of this snapshot are compared.
+
+        Args:
+            previous (GeoSnapshot): The previous snapshot of the same chart.
+
+        Returns:
+            list[dict]: The `country`, the `name` of each entity, with the
+                `artist` of tracks, its `rank` and its `previous_rank`, and
+                the `change` of rank, positive when it moved up. New
+                entities have no `previous_rank`, and the entities that
+                left the chart have no `rank`, and both have no `change`.
+        """
+        previous_ranks = {
+            (country, key): rank
+            for country, rank, key, _ in previous.rows()
+            if country in self.countries
+        }
+        movements = []
+        for country, rank, key, _ in self.rows():
+            previous_rank = previous_ranks.pop((country, key), None)
+            movements.append({
+                'country': country,
+                **parse_entity_key(key),
+                'rank': rank,
+                'previous_rank': previous_rank,
+                'change': None
+                if previous_rank is None
+                else previous_rank - rank,
+            })
+        movements.extend(
+            {
+                'country': country,
+                **parse_entity_key(key),
+                'rank': None,
+                'previous_rank': previous_rank,
+                'change': None,
+            }
+            for (country, key), previous_rank in previous_ranks.items()
+        )
+        return movements
+
+    def to_arrow(self) -> Any:
+        """Exposes the snapshot as an Arrow table.
+
+        The countries and the entities are stored as dictionary arrays.
+        Requires the optional `pyarrow` dependency.
+
+        Returns:
+            pyarrow.Table: A table with the `country`, `rank`, `entity` and
+                `listeners` columns.
+        """
+        pa = import_optional('pyarrow')
+        return pa.table({
+            'country': pa.DictionaryArray.from_arrays(
+                pa.array(self.country_ids, type=pa.int32()),
+                pa.array(self.countries.values, type=pa.string()),
+            ),
+            'rank': pa.array(self.ranks, type=pa.int32()),
+            'entity': pa.DictionaryArray.from_arrays(
+                pa.array(self.entity_ids, type=pa.int32()),
+                pa.array(self.entities.values, type=pa.string()),
+            ),
+            'listeners': pa.array(self.listeners, type=pa.int64()),
+        })
+
+    def save(self, path: str | Path) -> None:
+        """Saves the snapshot in a JSON file.
+
+        Args:
+            path (str | Path): The path of the file.
+        """
+        Path(path).write_text(
+            json.dumps({
+                'chart': self.chart,
+                'created': self.created,
+                'countries': self.countries.values,
+                'entities': self.entities.values,
+                'failed': self.failed,
+                **{
+                    column: base64.b64encode(
+                        getattr(self, column).tobytes()
+                    ).decode()
+                    for column in COLUMNS
+                },
+            }),
+            encoding='utf-8',
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'GeoSnapshot':
+        """Loads a snapshot saved with `save`.
+
+        Args:
+            path (str | Path): The path of the file.
+
+        Returns:
+            GeoSnapshot: The snapshot.
+        """
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        snapshot = cls(data['chart'], data['created'])
+        snapshot.countries = StringDictionary(data['countries'])
+        snapshot.entities = StringDictionary(data['entities'])
+        snapshot.failed = data['failed']
+        for column, typecode in COLUMNS.items():
+            values = array(typecode)
+            values.frombytes(base64.b64decode(data[column]))
+            setattr(snapshot, column, values)
+        return snapshot
+
+    @classmethod
+    def fetch(  # noqa PLR0917
+        cls,
+        request_controller: RequestController,
+        chart: Literal['artists', 'tracks'] = 'artists',
+        countries: Iterable[T_ISO3166CountryNames] | None = None,
+        amount: int = GEO_SNAPSHOT_AMOUNT,
+        workers: int = WORKERS,
+    ) -> 'GeoSnapshot':
+        """Fetches the chart of many countries concurrently.
+
+        The countries are fetched under the rate limit of the
+        `RequestController`. A country whose request fails is kept in
+        `failed` instead of the snapshot.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            chart (Literal['artists', 'tracks'], optional): The chart to
+                fetch. Defaults to 'artists'.
+            countries (Iterable[T_ISO3166CountryNames], optional): The
+                countries. If None, every country. Defaults to None.
+            amount (int, optional): The number of items of each chart.
+                Defaults to `GEO_SNAPSHOT_AMOUNT`.
+            workers (int, optional): The number of countries fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            GeoSnapshot: The snapshot.
+        """
+        method, parent_key, list_key = CHARTS[chart]
+        if countries is None:
+            countries = get_args(T_ISO3166CountryNames)
+
+        def _request(country: str) -> list[dict]:
+            return request_controller.get_paginated_data(
+                {'method': method, 'country': country},
+                parent_key,
+                list_key,
+                amount,
+            )
+
+        snapshot = cls(chart)
+        for country, items in iter_concurrently(_request, countries, workers):
+            if isinstance(items, Exception):
+                snapshot.failed.append(country)
+            else:
+                snapshot.add(country, items)
+        return snapshot
@@ -0,0 +1,292 @@
+import json
+import mmap
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from pylastfmapi.constants import (
+    ARTIST_GETSIMILAR,
+    CRAWL_MAX_DEPTH,
+    CRAWL_MAX_NODES,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.utils import iter_concurrently
+
+
+class ArtistGraph:
+    """A weighted graph of similar artists in compressed sparse rows.
+
+    Each artist is a node with a sequential integer ID. The neighbours of a
+    node are stored in `indices`, with the `match` of each similarity in
+    `weights`, from `indptr[id]` to `indptr[id + 1]`. The arrays are typed
+    buffers (`int64`, `int32` and `float32`), so the graph takes a few bytes
+    per edge, and a loaded graph maps them from its files without reading
+    them in memory.
+    """
+
+    def __init__(  # noqa PLR0917
+        self,
+        names: list[str],
+        mbids: list[str],
+        indptr: array | memoryview,
+        indices: array | memoryview,
+        weights: array | memoryview,
+    ) -> None:
+        """Initializes the graph from its arrays.
+
+        Args:
+            names (list[str]): The name of each artist, by ID.
+            mbids (list[str]): The MusicBrainz ID of each artist, by ID, or
+                an empty string if it has none.
+            indptr (array | memoryview): The start of the neighbours of each
+                artist in `indices`, with the number of edges at the end.
+            indices (array | memoryview): The IDs of the neighbours.
+            weights (array | memoryview): The `match` of each edge.
+        """
+        self.names = names
+        self.mbids = mbids
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self._ids = {name.casefold(): node for node, name in enumerate(names)}
+        self._ids.update({
+            mbid: node for node, mbid in enumerate(mbids) if mbid
+        })
+        self._maps: list[mmap.mmap] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __enter__(self) -> 'ArtistGraph':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __contains__(self, artist: str) -> bool:
+        return self.node(artist) is not None
+
+    @property
+    def edges(self) -> int:
+        """The number of edges of the graph."""
+        return len(self.indices)
+
+    def node(self, artist: str) -> int | None:
+        """Gets the ID of an artist.
+
+        Args:
+            artist (str): The name or the MusicBrainz ID of the artist.
+
+        Returns:
+            int | None: The ID of the artist, or None if it is not a node.
+        """
+        node = self._ids.get(artist)
+        if node is None:
+            node = self._ids.get(artist.casefold())
+        return node
+
+    def neighbor_ids(self, node: int) -> tuple[memoryview, memoryview]:
+        """Gets the neighbours of a node by ID, without copying them.
+
+        Args:
+            node (int): The ID of the artist.
+
+        Returns:
+            tuple[memoryview, memoryview]: The IDs of the neighbours and the
+                weights of the edges.
+        """
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return (
+            memoryview(self.indices)[start:end],
+            memoryview(self.weights)[start:end],
+        )
+
+    def neighbors(self, artist: str) -> list[tuple[str, float]]:
+        """Gets the artists similar to an artist.
+
+        Args:
+            artist (str): The name or the MusicBrainz ID of the artist.
+
+        Returns:
+            list[tuple[str, float]]: The name of each similar artist with
+                its `match`, from the most similar. Empty if the artist is
+                not a node or its similar artists were not fetched.
+        """
+        node = self.node(artist)
+        if node is None:
+            return []
+        indices, weights = self.neighbor_ids(node)
+        return [
+            (self.names[index], weight)
+            for index, weight in zip(indices, weights)
+        ]
+
+    def save(self, path: str | Path) -> None:
+        """Saves the graph in a directory.
+
+        The arrays are saved as raw files in the byte order of the machine,
+        and the artists in `nodes.json`.
+
+        Args:
+            path (str | Path): The directory. It is created if it does not
+                exist.
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for name in ('indptr', 'indices', 'weights'):
+            (path / f'{name}.bin').write_bytes(getattr(self, name).tobytes())
+        (path / 'nodes.json').write_text(
+            json.dumps({'names': self.names, 'mbids': self.mbids}),
+            encoding='utf-8',
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'ArtistGraph':
+        """Loads a graph saved with `save`, memory-mapping its arrays.
+
+        The files stay mapped until the graph is closed, with `close` or by
+        using the graph as a context manager.
+
+        Args:
+            path (str | Path): The directory of the graph.
+
+        Returns:
+            ArtistGraph: The graph.
+        """
+        path = Path(path)
+        nodes = json.loads((path / 'nodes.json').read_text(encoding='utf-8'))
+        maps: list[mmap.mmap] = []
+        graph = cls(
+            nodes['names'],
+            nodes['mbids'],
+            _map_array(path / 'indptr.bin', 'q', maps),
+            _map_array(path / 'indices.bin', 'i', maps),
+            _map_array(path / 'weights.bin', 'f', maps),
+        )
+        graph._maps = maps
+        return graph
+
+    def close(self) -> None:
+        """Closes the files mapped by `load`, so they can be removed or
+        overwritten.
+
+        The graph can't be used once it is closed, and the neighbours got
+        from `neighbor_ids` must not be in use. A graph built in memory has
+        no files to close.
+        """
+        for name in ('indptr', 'indices', 'weights'):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        for file_map in self._maps:
+            file_map.close()
+        self._maps.clear()
+
+
+def _map_array(
+    path: Path, typecode: str, maps: list[mmap.mmap]
+) -> array | memoryview:
+    """Maps a file saved from an array in memory, read only, keeping its
+    map in `maps` to close it."""
+    with path.open('rb') as file:
+        if not path.stat().st_size:
+            # An empty file can't be mapped.
+            return array(typecode)
+        file_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        maps.append(file_map)
+        return memoryview(file_map).cast(typecode)
+
+
+def build_artist_graph(  # noqa PLR0917
+    request_controller: RequestController,
+    artists: Iterable[str],
+    max_depth: int = CRAWL_MAX_DEPTH,
+    max_nodes: int = CRAWL_MAX_NODES,
+    amount: int = 30,
+    workers: int = WORKERS,
+) -> ArtistGraph:
+    """Builds the graph of similar artists around some seed artists.
+
+    The similar artists of the seeds are fetched with `artist.getSimilar`,
+    then the similar artists of those, for up to `max_depth` hops. Each hop
+    is fetched concurrently under the rate limit of the
+    `RequestController`. The artists are deduplicated by MusicBrainz ID
+    and by name, ignoring the case.
+
+    Args:
+        request_controller (RequestController): The controller used to send
+            the requests.
+        artists (Iterable[str]): The names of the seed artists.
+        max_depth (int, optional): The number of hops from the seeds. The
+            artists at `max_depth` are nodes, but their similar artists are
+            not fetched. Defaults to `CRAWL_MAX_DEPTH`.
+        max_nodes (int, optional): The maximum number of artists whose
+            similar artists are fetched. Defaults to `CRAWL_MAX_NODES`.
+        amount (int, optional): The number of similar artists fetched for
+            each artist. Defaults to 30.
+        workers (int, optional): The number of artists fetched concurrently.
+            Defaults to `WORKERS`.
+
+    Returns:
+        ArtistGraph: The graph. The artists whose request failed have no
+            neighbours.
+    """
+    names: list[str] = []
+    mbids: list[str] = []
+    ids: dict[str, int] = {}
+    rows: dict[int, tuple[array, array]] = {}
+
+    def _node(name: str, mbid: str = '') -> int:
+        node = ids.get(mbid) if mbid else None
+        if node is None:
+            node = ids.get(name.casefold())
+        if node is None:
+            node = len(names)
+            names.append(name)
+            mbids.append(mbid)
+            ids[name.casefold()] = node
+        if mbid and not mbids[node]:
+            mbids[node] = mbid
+        if mbid:
+            ids[mbid] = node
+        return node
+
+    def _request_similar(node: int) -> list[dict]:
+        response = request_controller.request({
+            'method': ARTIST_GETSIMILAR,
+            'artist': names[node],
+            'autocorrect': False,
+            'limit': amount,
+        })
+        similar = response.json()['similarartists']['artist']
+        # A single similar artist is sent without a list.
+        return [similar] if isinstance(similar, dict) else similar
+
+    level = list(dict.fromkeys(_node(artist) for artist in artists))
+    scheduled = set(level)
+    for depth in range(max_depth):
+        level = level[: max(0, max_nodes - len(rows))]
+        next_level = []
+        for node, similar in iter_concurrently(
+            _request_similar, level, workers
+        ):
+            rows[node] = (array('i'), array('f'))
+            if isinstance(similar, Exception):
+                continue
+            for item in similar:
+                neighbor = _node(item['name'], item.get('mbid', ''))
+                rows[node][0].append(neighbor)
+                rows[node][1].append(float(item.get('match', 0)))
+                if depth + 1 < max_depth and neighbor not in scheduled:
+                    scheduled.add(neighbor)
+                    next_level.append(neighbor)
+        level = next_level
+
+    indptr, indices, weights = array('q', [0]), array('i'), array('f')
+    for node in range(len(names)):
+        if node in rows:
+            indices.extend(rows[node][0])
+            weights.extend(rows[node][1])
+        indptr.append(len(indices))
+    return ArtistGraph(names, mbids, indptr, indices, weights)
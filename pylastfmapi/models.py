@@ -0,0 +1,288 @@
+from dataclasses import dataclass
+from typing import Any, Self
+
+from pylastfmapi.utils import intern_strings, project_fields
+
+
+def _int(value: Any) -> int | None:
+    """Converts a numeric string from the API, like '1234', to int."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float(value: Any) -> float | None:
+    """Converts a numeric string from the API, like '0.75', to float."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _name(value: Any) -> str | None:
+    """Gets a name that the API sends as a string, or as an object with
+    `name` or `#text` keys depending on the endpoint."""
+    if isinstance(value, dict):
+        return value.get('name', value.get('#text'))
+    return value
+
+
+def _rank(data: dict) -> int | None:
+    """Gets the position of an item in a chart, sent in `@attr`."""
+    attributes = data.get('@attr')
+    return _int(attributes.get('rank')) if attributes else None
+
+
+@dataclass(slots=True)
+class Artist:
+    """An artist, with its numeric statistics converted to numbers."""
+
+    name: str | None
+    mbid: str | None = None
+    url: str | None = None
+    playcount: int | None = None
+    listeners: int | None = None
+    match: float | None = None
+    rank: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Creates an artist from an item of the API response.
+
+        Args:
+            data (dict): The artist as sent by the LastFM API.
+
+        Returns:
+            Artist: The artist model.
+        """
+        stats = data.get('stats', {})
+        return cls(
+            name=_name(data),
+            mbid=data.get('mbid') or None,
+            url=data.get('url'),
+            playcount=_int(data.get('playcount', stats.get('playcount'))),
+            listeners=_int(data.get('listeners', stats.get('listeners'))),
+            match=_float(data.get('match')),
+            rank=_rank(data),
+        )
+
+
+@dataclass(slots=True)
+class Album:
+    """An album, with its numeric statistics converted to numbers."""
+
+    name: str | None
+    artist: str | None = None
+    mbid: str | None = None
+    url: str | None = None
+    playcount: int | None = None
+    listeners: int | None = None
+    rank: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Creates an album from an item of the API response.
+
+        Args:
+            data (dict): The album as sent by the LastFM API.
+
+        Returns:
+            Album: The album model.
+        """
+        return cls(
+            name=data.get('name', data.get('title')),
+            artist=_name(data.get('artist')),
+            mbid=data.get('mbid') or None,
+            url=data.get('url'),
+            playcount=_int(data.get('playcount')),
+            listeners=_int(data.get('listeners')),
+            rank=_rank(data),
+        )
+
+
+@dataclass(slots=True)
+class Track:
+    """A track, with its numeric statistics converted to numbers."""
+
+    name: str | None
+    artist: str | None = None
+    mbid: str | None = None
+    url: str | None = None
+    playcount: int | None = None
+    listeners: int | None = None
+    duration: int | None = None
+    match: float | None = None
+    rank: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Creates a track from an item of the API response.
+
+        Args:
+            data (dict): The track as sent by the LastFM API.
+
+        Returns:
+            Track: The track model.
+        """
+        return cls(
+            name=data.get('name'),
+            artist=_name(data.get('artist')),
+            mbid=data.get('mbid') or None,
+            url=data.get('url'),
+            playcount=_int(data.get('playcount')),
+            listeners=_int(data.get('listeners')),
+            duration=_int(data.get('duration')),
+            match=_float(data.get('match')),
+            rank=_rank(data),
+        )
+
+
+@dataclass(slots=True)
+class Scrobble:
+    """A track listened (or loved) by a user at a given time.
+
+    The `uts` is the UNIX timestamp of the scrobble, and it is `None` for
+    the track that is playing now.
+    """
+
+    name: str | None
+    artist: str | None = None
+    album: str | None = None
+    mbid: str | None = None
+    url: str | None = None
+    uts: int | None = None
+    loved: bool | None = None
+    now_playing: bool = False
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Creates a scrobble from an item of the API response.
+
+        Args:
+            data (dict): The track as sent by the LastFM API.
+
+        Returns:
+            Scrobble: The scrobble model.
+        """
+        attributes = data.get('@attr', {})
+        return cls(
+            name=data.get('name'),
+            artist=_name(data.get('artist')),
+            album=_name(data.get('album')),
+            mbid=data.get('mbid') or None,
+            url=data.get('url'),
+            uts=_int(data.get('date', {}).get('uts')),
+            loved=data['loved'] == '1' if 'loved' in data else None,
+            now_playing=attributes.get('nowplaying') == 'true',
+        )
+
+
+@dataclass(slots=True)
+class Tag:
+    """A tag, with its numeric statistics converted to numbers."""
+
+    name: str | None
+    url: str | None = None
+    count: int | None = None
+    reach: int | None = None
+    total: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Creates a tag from an item of the API response.
+
+        Args:
+            data (dict): The tag as sent by the LastFM API.
+
+        Returns:
+            Tag: The tag model.
+        """
+        return cls(
+            name=data.get('name'),
+            url=data.get('url'),
+            count=_int(data.get('count')),
+            reach=_int(data.get('reach')),
+            total=_int(data.get('total', data.get('taggings'))),
+        )
+
+
+@dataclass(slots=True)
+class User:
+    """A LastFM user, with its numeric statistics converted to numbers."""
+
+    name: str | None
+    realname: str | None = None
+    url: str | None = None
+    country: str | None = None
+    playcount: int | None = None
+    registered: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Creates a user from an item of the API response.
+
+        Args:
+            data (dict): The user as sent by the LastFM API.
+
+        Returns:
+            User: The user model.
+        """
+        registered = data.get('registered')
+        if isinstance(registered, dict):
+            registered = registered.get('unixtime')
+        return cls(
+            name=data.get('name'),
+            realname=data.get('realname') or None,
+            url=data.get('url'),
+            country=data.get('country') or None,
+            playcount=_int(data.get('playcount')),
+            registered=_int(registered),
+        )
+
+
+T_Model = (
+    type[Artist]
+    | type[Album]
+    | type[Track]
+    | type[Scrobble]
+    | type[Tag]
+    | type[User]
+)
+"""
+Any of the model classes that an API item can be converted into.
+"""
+
+
+def parse_result(
+    data: Any,
+    fields: list[str] | None = None,
+    model: T_Model | None = None,
+    strings: dict[str, str] | None = None,
+) -> Any:
+    """
+    Projects and converts an item, or a list of items, from the API.
+
+    Args:
+        data (dict | list[dict]): An item, or a list of items, from the
+            LastFM API response.
+        fields (list[str], optional): The fields to keep, as in
+            `project_fields`. Defaults to None.
+        model (T_Model, optional): The model to convert each item into.
+            If None, the items are kept as dictionaries. Defaults to None.
+        strings (dict[str, str], optional): A pool of strings shared
+            between the items, as in `intern_strings`. If None, the strings
+            are not interned. Defaults to None.
+
+    Returns:
+        The projected item, or list of items, converted to `model` if given.
+
+    """
+    data = project_fields(data, fields)
+    if strings is not None:
+        data = intern_strings(data, strings)
+    if model is None:
+        return data
+    if isinstance(data, list):
+        return [model.from_dict(item) for item in data]
+    return model.from_dict(data)
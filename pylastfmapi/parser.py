@@ -0,0 +1,164 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+WHITESPACE = ' \t\n\r'
+
+
+class ItemStream:
+    """Incrementally extracts the items of a list from a JSON document.
+
+    The LastFM API wraps every paginated list as
+    `{parent_key: {list_key: [...], '@attr': {...}}}` (or inside an extra
+    `taggings` object for personal tags). Instead of decoding the whole
+    document into a dict tree, this class walks the document structure and
+    decodes one item of the target list at a time, so only the current
+    item and the unread part of the body are kept in memory.
+
+    The values found alongside the path (like `@attr`, or `error` and
+    `message` for an error response) are decoded and stored in
+    `metadata` while iterating.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes | str],
+        parent_key: str,
+        list_key: str,
+    ) -> None:
+        """Initializes the stream over the given chunks of a JSON document.
+
+        Args:
+            chunks (Iterable[bytes | str]): The document, split in chunks of
+                any size (e.g. from `response.iter_content`).
+            parent_key (str): The key in the document that contains the
+                primary data structure.
+            list_key (str): The key within the `parent_key` that contains
+                the list of items.
+        """
+        self.path = (parent_key, list_key)
+        self.metadata: dict[str, Any] = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._exhausted = False
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._next_char() != '{':
+            raise ValueError('The JSON document should be an object')
+        yield from self._iter_object(self.path)
+
+    #########################################################################
+    # BUFFER
+    #########################################################################
+
+    def _fill(self) -> bool:
+        """Appends the next chunk to the buffer, dropping consumed text.
+
+        Returns:
+            bool: False if there is no more data to read.
+        """
+        if self._exhausted:
+            return False
+        for chunk in self._chunks:
+            text = (
+                self._decoder.decode(chunk)
+                if isinstance(chunk, bytes)
+                else chunk
+            )
+            if text:
+                self._buffer = self._buffer[self._pos :] + text
+                self._pos = 0
+                return True
+        self._exhausted = True
+        return False
+
+    def _next_char(self) -> str:
+        """Skips whitespace and consumes the next structural character."""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                char = self._buffer[self._pos]
+                self._pos += 1
+                return char
+            if not self._fill():
+                raise ValueError('Unexpected end of the JSON document')
+
+    def _peek_char(self) -> str:
+        """Returns the next structural character without consuming it."""
+        char = self._next_char()
+        self._pos -= 1
+        return char
+
+    def _decode_value(self) -> Any:
+        """Decodes the next complete JSON value from the buffer."""
+        self._peek_char()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    #########################################################################
+    # STRUCTURE
+    #########################################################################
+
+    def _iter_object(self, path: tuple[str, ...]) -> Iterator[Any]:
+        """Walks an object whose opening brace was already consumed."""
+        if self._peek_char() == '}':
+            self._next_char()
+            return
+        while True:
+            key = self._decode_value()
+            if self._next_char() != ':':
+                raise ValueError(f'Expected ":" after key "{key}"')
+
+            if key == path[0] and len(path) == 1:
+                yield from self._iter_list()
+            elif key == path[0] or (key == 'taggings' and len(path) > 1):
+                if self._next_char() != '{':
+                    raise ValueError(f'The key "{key}" should be an object')
+                inner_path = path if key == 'taggings' else path[1:]
+                yield from self._iter_object(inner_path)
+            else:
+                self.metadata[key] = self._decode_value()
+
+            char = self._next_char()
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f'Expected "," or "}}" but found "{char}"')
+
+    def _iter_list(self) -> Iterator[Any]:
+        """Yields the items of the target list, one at a time.
+
+        LastFM returns a single object instead of a list when there is only
+        one item, so an object value is yielded as the only item.
+        """
+        if self._peek_char() != '[':
+            yield self._decode_value()
+            return
+        self._next_char()
+        if self._peek_char() == ']':
+            self._next_char()
+            return
+        while True:
+            yield self._decode_value()
+            char = self._next_char()
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError(f'Expected "," or "]" but found "{char}"')
@@ -1,13 +1,28 @@
 import time
 from http import HTTPStatus
+from itertools import chain, islice
 from math import ceil
-from typing import Annotated
+from threading import Lock
+from typing import Annotated, Callable, Iterable, Iterator
 
 import requests
 import requests_cache
-
-from pylastfmapi.constants import LIMIT, LIMIT_SEARCH, URL
+from requests_cache.patcher import OriginalSession
+
+from pylastfmapi.cache import SearchCache
+from pylastfmapi.checkpoint import T_Checkpoint, checkpoint_key
+from pylastfmapi.constants import (
+    LIMIT,
+    LIMIT_SEARCH,
+    REQUEST_INTERVAL,
+    STREAM_CHUNK_SIZE,
+    URL,
+    WORKERS,
+)
 from pylastfmapi.exceptions import RequestErrorException
+from pylastfmapi.models import T_Model, parse_result
+from pylastfmapi.parser import ItemStream
+from pylastfmapi.utils import entity_key, iter_concurrently
 
 # T_Response is a type alias representing the possible response types
 # returned by requests made through the `RequestController`.
@@ -19,12 +34,74 @@ T_Response = Annotated[
     requests_cache.models.response.CachedResponse,
 ]
 
+# T_ItemFilter is a type alias for a filter of the raw items of a paginated
+# query, like `unique_scrobbles`, that receives the items of all pages and
+# yields the items to keep.
+T_ItemFilter = Callable[[Iterable[dict]], Iterable[dict]]
+
+
+class CheckpointResponse:
+    """A page of a paginated query served from a checkpoint.
+
+    It has the parts of `T_Response` read by the pagination.
+    """
+
+    def __init__(self, content: dict) -> None:
+        """Initializes the response with the saved content of the page.
+
+        Args:
+            content (dict): The JSON content of the page.
+        """
+        self.content = content
+
+    def json(self) -> dict:
+        """Gets the JSON content of the page.
+
+        Returns:
+            dict: The content of the page.
+        """
+        return self.content
+
+
+class RateLimiter:
+    """Spaces the requests sent to the LastFM API, across threads.
+
+    Every call to `wait` reserves the next free slot, at least `interval`
+    seconds after the previous one, and sleeps until it. Threads sharing a
+    limiter are then never faster, together, than the rate limit.
+    """
+
+    def __init__(self, interval: float = REQUEST_INTERVAL) -> None:
+        """Initializes the limiter.
+
+        Args:
+            interval (float, optional): The minimum interval in seconds
+                between two slots. Defaults to `REQUEST_INTERVAL`.
+        """
+        self.interval = interval
+        self._lock = Lock()
+        self._last_slot = float('-inf')
+
+    def wait(self) -> None:
+        """Sleeps until the next free slot of the limiter."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._last_slot + self.interval)
+            self._last_slot = slot
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class RequestController:
     """Handles API requests and manages cached responses for the LastFM API."""
 
     def __init__(
-        self, user_agent: str, api_key: str, reset_cache: bool = False
+        self,
+        user_agent: str,
+        api_key: str,
+        reset_cache: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        search_cache: SearchCache | None = None,
     ) -> None:
         """Initializes the RequestController with user-agent and API key.
 
@@ -34,9 +111,18 @@ class RequestController:
             api_key (str): The API key for authentication with the LastFM API.
             reset_cache (bool, optional): If True, clears the existing cache.
                 Defaults to False.
+            rate_limiter (RateLimiter, optional): The rate limiter to share
+                with other controllers. If None, a new one is created.
+                Defaults to None.
+            search_cache (SearchCache, optional): The cache answering the
+                searches of `get_search_data`, including the longer
+                prefixes of a query already searched. If None, the searches
+                are only cached by their exact requests. Defaults to None.
         """
         self.headers = {'user-agent': user_agent}
         self.payload = {'api_key': api_key, 'format': 'json'}
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.search_cache = search_cache
         requests_cache.install_cache()
         if reset_cache:
             self.clear_cache()
@@ -54,8 +140,10 @@ class RequestController:
             RequestErrorException: If the response status code is not
                 200 (OK) or if the response contains an error.
         """
-        self.payload.update(payload)
-        response = requests.get(URL, headers=self.headers, params=self.payload)
+        params = {**self.payload, **payload}
+        if not self.is_cached(params):
+            self.rate_limiter.wait()
+        response = requests.get(URL, headers=self.headers, params=params)
 
         if response.status_code != HTTPStatus.OK:
             raise RequestErrorException(
@@ -71,6 +159,99 @@ class RequestController:
             )
         return response
 
+    def stream_request(self, payload: dict) -> T_Response:
+        """Sends a request to the LastFM API without decoding its body.
+
+        The body is left to be read incrementally, so errors sent inside
+        the content should be checked by the caller while parsing it. The
+        request bypasses the cache of `requests_cache`, which would read
+        the whole body to store it, so it is always sent under the rate
+        limit.
+
+        Args:
+            payload (dict): The query parameters for the request.
+
+        Returns:
+            T_Response: The HTTP response object.
+
+        Raises:
+            RequestErrorException: If the response status code is not
+                200 (OK).
+        """
+        self.rate_limiter.wait()
+        # `requests_cache.install_cache` patches `requests.Session`, so the
+        # session saved before the patch is used. Unlike
+        # `requests_cache.disabled`, it leaves the cache of the requests
+        # sent by other threads installed.
+        with OriginalSession() as session:
+            response = session.get(
+                URL,
+                headers=self.headers,
+                params={**self.payload, **payload},
+                stream=True,
+            )
+
+        if response.status_code != HTTPStatus.OK:
+            raise RequestErrorException(
+                f'Something wrong, HTTP error {response.status_code}: '
+                f'{response.text}'
+            )
+        return response
+
+    def request_page(
+        self, payload: dict, checkpoint: T_Checkpoint | None = None
+    ) -> T_Response | CheckpointResponse:
+        """Sends a request for a page, unless it is saved in a checkpoint.
+
+        The content of the pages sent by the LastFM API is saved in the
+        checkpoint, keyed by all the parameters of the query, including
+        the page number.
+
+        Args:
+            payload (dict): The query parameters for the request.
+            checkpoint (T_Checkpoint, optional): Where the pages are saved.
+                If None, the request is always sent. Defaults to None.
+
+        Returns:
+            T_Response | CheckpointResponse: The HTTP response object, or
+                the page saved in the checkpoint.
+
+        Raises:
+            RequestErrorException: If the response status code is not
+                200 (OK) or if the response contains an error.
+        """
+        if checkpoint is None:
+            return self.request(payload)
+        key = checkpoint_key(payload)
+        content = checkpoint.get(key)
+        if content is not None:
+            return CheckpointResponse(content)
+        response = self.request(payload)
+        checkpoint.set(key, response.json())
+        return response
+
+    def is_cached(self, params: dict) -> bool:
+        """Checks if the response of a request is stored in the cache.
+
+        Args:
+            params (dict): All the query parameters of the request.
+
+        Returns:
+            bool: True if the response would be served from the cache.
+        """
+        cache = requests_cache.get_cache()
+        if cache is None:
+            return False
+        request = requests.Request(
+            'GET', URL, headers=self.headers, params=params
+        )
+        try:
+            return cache.contains(request=request)
+        except requests.RequestException:
+            # A request that can't be prepared is not in the cache, and the
+            # error is raised when it is sent.
+            return False
+
     @staticmethod
     def clear_cache() -> None:
         """Clears the cache of stored API responses."""
@@ -82,9 +263,14 @@ class RequestController:
     # PAGINATION
     #########################################################################
 
-    def request_all_pages(
-        self, payload: dict, parent_key: str, list_key: str, amount: int | None
-    ) -> list[T_Response]:
+    def request_all_pages(  # noqa PLR0917
+        self,
+        payload: dict,
+        parent_key: str,
+        list_key: str,
+        amount: int | None,
+        checkpoint: T_Checkpoint | None = None,
+    ) -> list[T_Response | CheckpointResponse]:
         """Requests all pages of data from the API for a given query,
         handling pagination.
 
@@ -95,29 +281,40 @@ class RequestController:
             list_key (str): The key within the parent key's value
                 that contains the list of items.
             amount (int): The total number of items to request.
+            checkpoint (T_Checkpoint, optional): Where the completed pages
+                are saved. The pages already saved, from a previous run of
+                the same query, are not requested again. Defaults to None.
 
         Returns:
-            list[T_Response]: A list of HTTP response objects,
-                each representing a page of data.
+            list[T_Response | CheckpointResponse]: A list of HTTP response
+                objects, or pages saved in the checkpoint, each representing
+                a page of data.
         """
-        responses = []
-        page = 1
-        num_pages = None
-
-        payload['limit'] = LIMIT
-        if amount:
-            if amount < LIMIT:
-                last_limit = amount
-                num_pages = 1
-            else:
-                last_limit = amount % LIMIT
-                num_pages = ceil(amount / LIMIT)
+        # Every page has the same limit, since the offset of a page is its
+        # number times the limit. The extra items of the last page are cut
+        # by `get_paginated_data`.
+        payload['limit'] = min(amount, LIMIT) if amount else LIMIT
+        num_pages = ceil(amount / payload['limit']) if amount else None
+        return list(
+            self._iter_pages(
+                payload, parent_key, list_key, num_pages, checkpoint
+            )
+        )
 
+    def _iter_pages(  # noqa PLR0917
+        self,
+        payload: dict,
+        parent_key: str,
+        list_key: str,
+        num_pages: int | None,
+        checkpoint: T_Checkpoint | None,
+    ) -> Iterator[T_Response | CheckpointResponse]:
+        """Requests the pages of a query one at a time, up to `num_pages`,
+        or up to the last page if None."""
+        page = 1
         while True:
             payload = {**payload, 'page': page}
-            if num_pages == page:
-                payload.update({'limit': last_limit})
-            response = self.request(payload)
+            response = self.request_page(payload, checkpoint)
             content = response.json()
 
             if (
@@ -125,9 +322,7 @@ class RequestController:
                 == 0
             ):
                 break
-            if not getattr(response, 'from_cache', False):
-                time.sleep(0.25)
-            responses.append(response)
+            yield response
 
             if 'taggings' in content:
                 if page == int(content['taggings']['@attr']['totalPages']):
@@ -139,10 +334,18 @@ class RequestController:
                 break
 
             page += 1
-        return responses
 
-    def get_paginated_data(
-        self, payload: dict, parent_key: str, list_key: str, amount: int | None
+    def get_paginated_data(  # noqa PLR0917
+        self,
+        payload: dict,
+        parent_key: str,
+        list_key: str,
+        amount: int | None,
+        fields: list[str] | None = None,
+        model: T_Model | None = None,
+        intern: bool = False,
+        checkpoint: T_Checkpoint | None = None,
+        item_filter: T_ItemFilter | None = None,
     ) -> list[dict]:
         """Fetches paginated data from the LastFM API based on the
         given parameters.
@@ -159,39 +362,184 @@ class RequestController:
                 the list of items.
             amount (int): The total number of elements to retrieve from
                 the API.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. The projection is applied
+                page by page, so the discarded keys of a page are released
+                before the next one is decoded. Defaults to None.
+            model (T_Model, optional): The model to convert each item into,
+                as soon as it is decoded. Defaults to None.
+            intern (bool, optional): If True, the repeated strings of the
+                items, like artist and album names, share a single instance
+                across all pages. Defaults to False.
+            checkpoint (T_Checkpoint, optional): Where the completed pages
+                are saved, so an interrupted query continues from its first
+                missing page when run again. Defaults to None.
+            item_filter (T_ItemFilter, optional): A filter applied to the
+                raw items of all pages, before the projection, like
+                `unique_scrobbles`. The `amount` counts the items kept by
+                the filter, as in `iter_paginated_data`. Defaults to None.
 
         Returns:
             list[dict]: A list of dictionaries containing the retrieved data.
         """
-        responses = self.request_all_pages(
-            payload, parent_key, list_key, amount
-        )
-        response_list = []
-        for index, data in enumerate(responses, start=1):
-            _data = data.json()
-            if amount and index == len(responses):
-                left_data = amount % LIMIT_SEARCH
-                response_list.extend(
-                    _data.get('taggings', _data)[parent_key][list_key][
-                        :left_data
-                    ]
+        strings: dict[str, str] | None = {} if intern else None
+        if item_filter is not None and amount:
+            # The filter may drop items, so the pages are requested one at
+            # a time until `amount` items are kept, instead of only the
+            # pages holding `amount` items.
+            responses: Iterable[T_Response | CheckpointResponse] = (
+                self._iter_pages(
+                    {**payload, 'limit': min(amount, LIMIT)},
+                    parent_key,
+                    list_key,
+                    None,
+                    checkpoint,
                 )
-            else:
-                response_list.extend(
-                    _data.get('taggings', _data)[parent_key][list_key]
+            )
+        else:
+            responses = self.request_all_pages(
+                payload, parent_key, list_key, amount, checkpoint
+            )
+        pages = (
+            self._page_items(data.json(), parent_key, list_key)
+            for data in responses
+        )
+        if item_filter is not None:
+            return [
+                parse_result(item, fields, model, strings)
+                for item in islice(
+                    item_filter(chain.from_iterable(pages)), amount or None
                 )
+            ]
+        if amount:
+            pages = self._cut_pages(pages, amount)
+        response_list = []
+        for items in pages:
+            response_list.extend(parse_result(items, fields, model, strings))
         return response_list
 
+    @staticmethod
+    def _page_items(content: dict, parent_key: str, list_key: str) -> list:
+        """Gets the list of items of a page of a query."""
+        return content.get('taggings', content)[parent_key][list_key]
+
+    @staticmethod
+    def _cut_pages(pages: Iterable[list], amount: int) -> Iterator[list]:
+        """Cuts the items of the pages of a query to `amount` in total."""
+        for items in pages:
+            yield items[:amount]
+            amount -= len(items)
+            if amount <= 0:
+                return
+
+    def iter_paginated_data(  # noqa PLR0917
+        self,
+        payload: dict,
+        parent_key: str,
+        list_key: str,
+        amount: int | None,
+        fields: list[str] | None = None,
+        model: T_Model | None = None,
+        intern: bool = False,
+        item_filter: T_ItemFilter | None = None,
+    ) -> Iterator[dict]:
+        """Streams paginated data from the LastFM API, item by item.
+
+        Unlike `get_paginated_data`, the pages are not decoded at once:
+        the items of the list are parsed straight out of the response body
+        and yielded as soon as they are read, keeping only one item of the
+        page in memory. The pages are not cached, as in `stream_request`.
+
+        Args:
+            payload (dict): The parameters to send to the API.
+            parent_key (str): The key in the API response that contains the
+                primary data structure.
+            list_key (str): The key within the `parent_key` that contains
+                the list of items.
+            amount (int): The total number of elements to retrieve from
+                the API.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. Each item is projected as
+                soon as it is parsed. Defaults to None.
+            model (T_Model, optional): The model to convert each item into,
+                as soon as it is decoded. Defaults to None.
+            intern (bool, optional): If True, the repeated strings of the
+                items, like artist and album names, share a single instance
+                across all pages. Defaults to False.
+            item_filter (T_ItemFilter, optional): A filter applied to the
+                raw items of all pages, before the projection, like
+                `unique_scrobbles`. The `amount` counts the items kept by
+                the filter. Defaults to None.
+
+        Yields:
+            dict: Each item of the list, in the order sent by the API.
+
+        Raises:
+            RequestErrorException: If the response contains an error.
+        """
+        strings: dict[str, str] | None = {} if intern else None
+        items = self._stream_items(
+            {**payload, 'limit': min(amount or LIMIT, LIMIT)},
+            parent_key,
+            list_key,
+        )
+        if item_filter is not None:
+            items = item_filter(items)
+        for count, item in enumerate(items, start=1):
+            yield parse_result(item, fields, model, strings)
+            if amount and count == amount:
+                return
+
+    def _stream_items(
+        self, payload: dict, parent_key: str, list_key: str
+    ) -> Iterator[dict]:
+        """Streams the raw items of all pages of a query."""
+        page = 1
+        while True:
+            response = self.stream_request({**payload, 'page': page})
+            stream = ItemStream(
+                response.iter_content(STREAM_CHUNK_SIZE), parent_key, list_key
+            )
+            page_count = 0
+            try:
+                for item in stream:
+                    yield item
+                    page_count += 1
+            finally:
+                response.close()
+
+            if 'error' in stream.metadata:
+                raise RequestErrorException(
+                    f'Something wrong, error {stream.metadata["error"]}: '
+                    f'{stream.metadata["message"]}'
+                )
+            if page_count == 0:
+                break
+            if page >= int(stream.metadata['@attr']['totalPages']):
+                break
+
+            page += 1
+
     #########################################################################
     # SEARCHES
     #########################################################################
 
-    def request_search_pages(
-        self, payload: dict, parent_key: str, list_key: str, amount: int | None
+    def request_search_pages(  # noqa PLR0917
+        self,
+        payload: dict,
+        parent_key: str,
+        list_key: str,
+        amount: int | None,
+        workers: int = WORKERS,
     ) -> list[T_Response]:
         """Requests all pages of data from the API for a given query,
         handling pagination. Specific for LastFM search format.
 
+        The first page is requested alone, to read the total number of
+        results, and the pages needed for `amount` are then requested
+        concurrently, under the rate limit of the controller. No new pages
+        are requested after a page without results.
+
         Args:
             payload (dict): The query parameters for the search request.
             parent_key (str): The parent key in the JSON response
@@ -199,47 +547,68 @@ class RequestController:
             list_key (str): The key within the parent key's value
                 that contains the list of items.
             amount (int): The total number of items to request.
+            workers (int, optional): The number of pages requested
+                concurrently. Defaults to `WORKERS`.
 
         Returns:
             list[T_Response]: A list of HTTP response objects,
-                each representing a page of search results.
-        """
-        responses = []
-        page = 1
-        num_pages = None
+                each representing a page of search results, in order, up
+                to the first page without results.
 
-        payload['limit'] = LIMIT_SEARCH
+        Raises:
+            RequestErrorException: If the request of a page fails.
+        """
+        payload = {
+            **payload,
+            'limit': min(amount, LIMIT_SEARCH) if amount else LIMIT_SEARCH,
+        }
+
+        def _request(page: int) -> T_Response:
+            return self.request({**payload, 'page': page})
+
+        first = _request(1)
+        content = first.json()
+        if len(content['results'][parent_key][list_key]) == 0:
+            return []
+        total = int(content['results']['opensearch:totalResults'])
         if amount:
-            if amount < LIMIT_SEARCH:
-                num_pages = 1
-                payload['limit'] = amount
-            else:
-                num_pages = ceil(amount / LIMIT_SEARCH)
-
-        while True:
-            payload = {**payload, 'page': page}
-            response = self.request(payload)
-            content = response.json()
+            total = min(total, amount)
+        num_pages = ceil(total / payload['limit'])
+
+        # The total of LastFM is often far more than the results it serves,
+        # so the pages are queued lazily and stop after an empty page.
+        empty: list[int] = []
+
+        def _pages() -> Iterator[int]:
+            for page in range(2, num_pages + 1):
+                if empty and page > min(empty):
+                    return
+                yield page
+
+        pages = {1: first}
+        for page, response in iter_concurrently(_request, _pages(), workers):
+            if isinstance(response, Exception):
+                raise response
+            pages[page] = response
+            if len(response.json()['results'][parent_key][list_key]) == 0:
+                empty.append(page)
 
-            if len(content['results'][parent_key][list_key]) == 0:
-                break
-            if not getattr(response, 'from_cache', False):
-                time.sleep(0.25)
-            responses.append(response)
-
-            if page == ceil(
-                int(content['results']['opensearch:totalResults'])
-                / LIMIT_SEARCH
-            ):
-                break
-            if num_pages and page == num_pages:
+        responses = []
+        for page in range(1, num_pages + 1):
+            if page not in pages or page in empty:
                 break
-
-            page += 1
+            responses.append(pages[page])
         return responses
 
-    def get_search_data(
-        self, payload: dict, parent_key: str, list_key: str, amount: int | None
+    def get_search_data(  # noqa PLR0917
+        self,
+        payload: dict,
+        parent_key: str,
+        list_key: str,
+        amount: int | None,
+        fields: list[str] | None = None,
+        model: T_Model | None = None,
+        intern: bool = False,
     ) -> list[dict]:
         """Fetches search result data from the LastFM API based on the
         given parameters.
@@ -247,6 +616,8 @@ class RequestController:
         This method handles the pagination of search result requests,
         retrieving
         the specified number of results and combining them into a single list.
+        The results repeated across pages, when the ranking shifts while the
+        pages are requested, are kept only once, in their first position.
 
         Args:
             payload (dict): The parameters to send to the API for the
@@ -257,21 +628,54 @@ class RequestController:
                 the list of items.
             amount (int): The total number of elements to retrieve from
                 the API.
+            fields (list[str], optional): The keys to keep in each item,
+                with nested keys joined by dots. Defaults to None.
+            model (T_Model, optional): The model to convert each item into,
+                as soon as it is decoded. Defaults to None.
+            intern (bool, optional): If True, the repeated strings of the
+                items, like artist and album names, share a single instance
+                across all pages. Defaults to False.
 
         Returns:
             list[dict]: A list of dictionaries containing the search results.
         """
-        responses = self.request_search_pages(
-            payload, parent_key, list_key, amount
-        )
-        response_list = []
-        for index, data in enumerate(responses, start=1):
-            _data = data.json()
-            if amount and index == len(responses):
-                left_data = amount % LIMIT_SEARCH
-                response_list.extend(
-                    _data['results'][parent_key][list_key][:left_data]
-                )
-            else:
-                response_list.extend(_data['results'][parent_key][list_key])
-        return response_list
+        items = None
+        if self.search_cache is not None:
+            items = self.search_cache.get(payload, list_key, amount)
+        if items is None:
+            responses = self.request_search_pages(
+                payload, parent_key, list_key, amount
+            )
+            items, complete = self._search_items(
+                responses, parent_key, list_key, amount
+            )
+            if self.search_cache is not None:
+                self.search_cache.set(payload, list_key, items, complete)
+        strings: dict[str, str] | None = {} if intern else None
+        return [parse_result(item, fields, model, strings) for item in items]
+
+    @staticmethod
+    def _search_items(
+        responses: list[T_Response],
+        parent_key: str,
+        list_key: str,
+        amount: int | None,
+    ) -> tuple[list[dict], bool]:
+        """Gets the results of the pages of a search, without the results
+        repeated across pages, up to `amount`, and if they are all the
+        results of the query."""
+        seen: set[str] = set()
+        items = []
+        count = total = 0
+        for index, data in enumerate(responses):
+            content = data.json()['results']
+            if index == 0:
+                total = int(content['opensearch:totalResults'])
+            count += len(content[parent_key][list_key])
+            for item in content[parent_key][list_key]:
+                key = item.get('url') or entity_key(item)
+                if key not in seen:
+                    seen.add(key)
+                    items.append(item)
+        complete = count >= total and not (amount and len(items) > amount)
+        return items[:amount], complete
@@ -0,0 +1,297 @@
+import json
+import math
+from array import array
+from pathlib import Path
+from typing import Iterable
+
+from pylastfmapi.columnar import StringDictionary
+from pylastfmapi.constants import (
+    ALBUM_SEARCH,
+    ARTIST_SEARCH,
+    SEARCH_INDEX_AMOUNT,
+    SEARCH_MIN_SIMILARITY,
+    TRACK_SEARCH,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.typehints import T_TopChart
+from pylastfmapi.utils import entity_key, normalize_name
+
+# The keys kept of each item, as in the results of the search methods.
+FIELDS = ('name', 'artist', 'url', 'streamable', 'listeners', 'image', 'mbid')
+
+# The API method, the searched parameter and the keys of the results of each
+# kind of search.
+SEARCHES = {
+    'artists': (ARTIST_SEARCH, 'artist', 'artistmatches', 'artist'),
+    'albums': (ALBUM_SEARCH, 'album', 'albummatches', 'album'),
+    'tracks': (TRACK_SEARCH, 'track', 'trackmatches', 'track'),
+}
+
+# The boost of the score of an item for each factor of 10 of its listeners.
+POPULARITY_WEIGHT = 0.05
+
+
+class SearchIndex:
+    """A local trigram index of artists, albums and tracks.
+
+    The names are normalized, ignoring the case, the accents and the
+    punctuation, and split into trigrams. Each trigram keeps the IDs of the
+    items with it, so a query only visits the items sharing a trigram with
+    it. The similarity of an item is the fraction of the trigrams of the
+    query found in its name, so the prefixes typed in an autocomplete match
+    fully, and the items are ranked by similarity with a boost for their
+    number of listeners.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self.keys = {
+            kind: StringDictionary()
+            for kind in ('artists', 'albums', 'tracks')
+        }
+        self.items: dict[str, list[dict]] = {kind: [] for kind in self.keys}
+        self.listeners = {kind: array('q') for kind in self.keys}
+        self.postings: dict[str, dict[str, array]] = {
+            kind: {} for kind in self.keys
+        }
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.items.values())
+
+    def add(self, kind: T_TopChart, items: Iterable[dict]) -> int:
+        """Adds items already fetched to the index.
+
+        Any item with a `name` is accepted, like the results of the search
+        and top chart methods. An item already indexed is replaced, keeping
+        the highest number of listeners.
+
+        Args:
+            kind (T_TopChart): The kind of the items.
+            items (Iterable[dict]): The items, as sent by the LastFM API.
+
+        Returns:
+            int: The number of new items.
+        """
+        keys, postings = self.keys[kind], self.postings[kind]
+        added = 0
+        for raw_item in items:
+            item = _search_item(raw_item)
+            key = _item_key(kind, item)
+            item_id = keys.get(key)
+            listeners = int(item.get('listeners') or 0)
+            if item_id is not None:
+                listeners = max(listeners, self.listeners[kind][item_id])
+                self.items[kind][item_id] = {
+                    **item,
+                    'listeners': str(listeners),
+                }
+                self.listeners[kind][item_id] = listeners
+                continue
+            item_id = keys.encode(key)
+            self.items[kind].append(item)
+            self.listeners[kind].append(listeners)
+            for trigram in _trigrams(item['name']):
+                postings.setdefault(trigram, array('i')).append(item_id)
+            added += 1
+        return added
+
+    def search(
+        self,
+        kind: T_TopChart,
+        query: str,
+        amount: int | None = 10,
+        artist: str | None = None,
+    ) -> list[tuple[dict, float]]:
+        """Searches the index.
+
+        Args:
+            kind (T_TopChart): The kind of the items.
+            query (str): The name, or the start of the name, to search for.
+                An empty query finds no items.
+            amount (int, optional): The number of items. If None, all the
+                items sharing a trigram with the query. Defaults to 10.
+            artist (str, optional): Keeps only the albums or tracks of an
+                artist, ignoring the case and the accents. Defaults to None.
+
+        Returns:
+            list[tuple[dict, float]]: Each item, in the format of the
+                search methods, with its similarity to the query, from 0 to
+                1, from the best ranked.
+        """
+        trigrams = _trigrams(query, prefix=True)
+        if not trigrams:
+            return []
+        postings = self.postings[kind]
+        shared: dict[int, int] = {}
+        for trigram in trigrams:
+            for item_id in postings.get(trigram, ()):
+                shared[item_id] = shared.get(item_id, 0) + 1
+
+        items, listeners = self.items[kind], self.listeners[kind]
+        artist = normalize_name(artist) if artist else None
+        results = [
+            (
+                shared_count / len(trigrams),
+                math.log10(1 + listeners[item_id]),
+                item_id,
+            )
+            for item_id, shared_count in shared.items()
+            if artist is None
+            or normalize_name(items[item_id].get('artist', '')) == artist
+        ]
+        results.sort(
+            key=lambda result: (
+                -result[0] * (1 + POPULARITY_WEIGHT * result[1]),
+                result[2],
+            )
+        )
+        return [
+            (items[item_id], similarity)
+            for similarity, _, item_id in results[:amount]
+        ]
+
+    def lookup(
+        self,
+        kind: T_TopChart,
+        query: str,
+        amount: int | None = SEARCH_INDEX_AMOUNT,
+        artist: str | None = None,
+        min_similarity: float = SEARCH_MIN_SIMILARITY,
+    ) -> list[dict] | None:
+        """Answers a search from the index if it has enough confident
+        results.
+
+        Args:
+            kind (T_TopChart): The kind of the items.
+            query (str): The name, or the start of the name, to search for.
+            amount (int, optional): The number of items. If None, the index
+                never answers, since the API may have more results.
+                Defaults to `SEARCH_INDEX_AMOUNT`.
+            artist (str, optional): Keeps only the albums or tracks of an
+                artist, as in `search`. Defaults to None.
+            min_similarity (float, optional): The similarity an item needs
+                to be a confident result. Defaults to
+                `SEARCH_MIN_SIMILARITY`.
+
+        Returns:
+            list[dict] | None: The first `amount` confident items, in the
+                format of the search methods, or None if there are fewer,
+                and the API should be searched.
+        """
+        if amount is None:
+            return None
+        results = self._confident(kind, query, artist, min_similarity)
+        return results[:amount] if len(results) >= amount else None
+
+    def find(  # noqa PLR0917
+        self,
+        request_controller: RequestController,
+        kind: T_TopChart,
+        query: str,
+        amount: int | None = None,
+        artist: str | None = None,
+    ) -> list[dict]:
+        """Searches the index, falling back to the API.
+
+        The search is answered from the index when its confident results
+        fill `amount`, as in `lookup`. Otherwise, the API is searched, its
+        results are added to the index, so the next searches for them are
+        local, and the confident results of the index come first, followed
+        by the results of the API not among them.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            kind (T_TopChart): The kind of the items.
+            query (str): The name to search for.
+            amount (int, optional): The number of items. If None, all the
+                items. Defaults to None.
+            artist (str, optional): The artist of the tracks searched.
+                Defaults to None.
+
+        Returns:
+            list[dict]: The items, in the format of the search methods.
+        """
+        local = self._confident(kind, query, artist)
+        if amount is not None and len(local) >= amount:
+            return local[:amount]
+        method, parameter, parent_key, list_key = SEARCHES[kind]
+        payload = {'method': method, parameter: query}
+        if artist is not None:
+            payload['artist'] = artist
+        items = request_controller.get_search_data(
+            payload, parent_key, list_key, amount
+        )
+        self.add(kind, items)
+        if not local:
+            return items
+        seen = {_item_key(kind, item) for item in local}
+        merged = local + [
+            item
+            for item in items
+            if _item_key(kind, _search_item(item)) not in seen
+        ]
+        return merged[:amount]
+
+    def _confident(
+        self,
+        kind: T_TopChart,
+        query: str,
+        artist: str | None,
+        min_similarity: float = SEARCH_MIN_SIMILARITY,
+    ) -> list[dict]:
+        """Gets all the items of a search with at least `min_similarity`,
+        from the best ranked."""
+        return [
+            item
+            for item, similarity in self.search(kind, query, None, artist)
+            if similarity >= min_similarity
+        ]
+
+    def save(self, path: str | Path) -> None:
+        """Saves the items of the index in a JSON file.
+
+        Args:
+            path (str | Path): The path of the file.
+        """
+        Path(path).write_text(json.dumps(self.items), encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'SearchIndex':
+        """Loads an index saved with `save`, indexing its items again.
+
+        Args:
+            path (str | Path): The path of the file.
+
+        Returns:
+            SearchIndex: The index.
+        """
+        index = cls()
+        for kind, items in json.loads(
+            Path(path).read_text(encoding='utf-8')
+        ).items():
+            index.add(kind, items)
+        return index
+
+
+def _search_item(item: dict) -> dict:
+    """Gets an item in the format of the search results, with the artist
+    of albums and tracks as a string."""
+    item = {key: item[key] for key in FIELDS if key in item}
+    artist = item.get('artist')
+    if isinstance(artist, dict):
+        item['artist'] = artist.get('name', artist.get('#text', ''))
+    return item
+
+
+def _item_key(kind: T_TopChart, item: dict) -> str:
+    """Gets the key of an item in the format of the search results, its
+    name for artists and its `entity_key` otherwise."""
+    return item['name'] if kind == 'artists' else entity_key(item)
+
+
+def _trigrams(text: str, prefix: bool = False) -> set[str]:
+    """Gets the trigrams of a normalized name, padded at the start, and at
+    the end unless the text is a prefix."""
+    text = f'  {normalize_name(text)}' + ('' if prefix else ' ')
+    return {text[index : index + 3] for index in range(len(text) - 2)}
@@ -0,0 +1,58 @@
+import json
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any
+
+from pylastfmapi.checkpoint import iter_json_lines
+
+
+class JSONLinesSink:
+    """Writes the top charts of many users to a JSON lines file.
+
+    Each chart is appended to the file as one line as soon as it is
+    fetched, with the `user`, `period` and `chart` it belongs to, so the
+    charts fetched before a crash are kept. The charts already in the file
+    are loaded when the sink is opened, and a rerun of the same fan-out
+    only fetches the missing ones.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the sink, loading the charts of an existing file.
+
+        Args:
+            path (str | Path): The path of the file. It is created if it
+                does not exist.
+        """
+        self.path = Path(path)
+        self._written: set[tuple[str, str, str]] = set()
+        for _, data in iter_json_lines(self.path):
+            self._written.add((data['user'], data['period'], data['chart']))
+
+    def __contains__(self, key: tuple[str, str, str]) -> bool:
+        return key in self._written
+
+    def __len__(self) -> int:
+        return len(self._written)
+
+    def write(self, user: str, period: str, chart: str, items: Any) -> None:
+        """Appends the chart of a user to the file.
+
+        Args:
+            user (str): The username.
+            period (str): The period of the chart.
+            chart (str): The name of the chart.
+            items (Any): The items of the chart, as dictionaries or models.
+        """
+        if isinstance(items, list):
+            items = [
+                asdict(item) if is_dataclass(item) else item for item in items
+            ]
+        line = json.dumps({
+            'user': user,
+            'period': period,
+            'chart': chart,
+            'items': items,
+        })
+        with self.path.open('a', encoding='utf-8') as file:
+            file.write(line + '\n')
+        self._written.add((user, period, chart))
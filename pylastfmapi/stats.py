@@ -0,0 +1,209 @@
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pylastfmapi.columnar import ScrobbleColumns
+from pylastfmapi.constants import SESSION_GAP
+from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.typehints import T_TopChart
+from pylastfmapi.utils import import_optional
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+WEEK_HOURS = 7 * 24
+
+
+def local_timestamps(timestamps: Any, timezone: str | None = None) -> Any:
+    """Shifts UNIX timestamps to the wall clock time of a timezone.
+
+    The offset of the timezone is computed at the start and the end of each
+    week, and hour by hour only in the weeks where it changes, so the
+    daylight saving time changes are followed without converting every
+    timestamp to a `datetime`. Requires the optional `numpy` dependency.
+
+    Args:
+        timestamps (numpy.ndarray): The UNIX timestamps (`int64`).
+        timezone (str, optional): The IANA name of the timezone, like
+            'America/Sao_Paulo'. If None, UTC. Defaults to None.
+
+    Returns:
+        numpy.ndarray: The timestamps shifted by the offset of the timezone
+            (`int64`), so the hour and the day can be computed with integer
+            arithmetic.
+
+    Raises:
+        LastFMException: If the timezone is unknown.
+    """
+    np = import_optional('numpy')
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if timezone is None:
+        return timestamps
+    try:
+        zone = ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise LastFMException(f'Unknown timezone "{timezone}": {e}')
+
+    if not timestamps.size:
+        return timestamps
+
+    hours = timestamps // HOUR
+    first = int(hours.min())
+    weeks = (int(hours.max()) - first) // WEEK_HOURS + 1
+
+    def _offset(hour: int) -> int:
+        offset = datetime.fromtimestamp((first + hour) * HOUR, zone)
+        return int(offset.utcoffset().total_seconds())
+
+    offsets = np.empty(weeks * WEEK_HOURS, dtype=np.int64)
+    for start in range(0, weeks * WEEK_HOURS, WEEK_HOURS):
+        end = start + WEEK_HOURS
+        offset = _offset(start)
+        if offset == _offset(end - 1):
+            offsets[start:end] = offset
+        else:
+            offsets[start:end] = [_offset(hour) for hour in range(start, end)]
+    return timestamps + offsets[hours - first]
+
+
+def hour_of_day(columns: ScrobbleColumns, timezone: str | None = None) -> Any:
+    """Counts the scrobbles by hour of the day.
+
+    Requires the optional `numpy` dependency.
+
+    Args:
+        columns (ScrobbleColumns): The scrobbles.
+        timezone (str, optional): The IANA name of the timezone of the
+            hours. If None, UTC. Defaults to None.
+
+    Returns:
+        numpy.ndarray: The number of scrobbles of each hour, from 0 to 23
+            (`int64`).
+    """
+    np = import_optional('numpy')
+    timestamps = local_timestamps(_timestamps(columns), timezone)
+    return np.bincount(timestamps // HOUR % 24, minlength=24)
+
+
+def day_of_week(columns: ScrobbleColumns, timezone: str | None = None) -> Any:
+    """Counts the scrobbles by day of the week.
+
+    Requires the optional `numpy` dependency.
+
+    Args:
+        columns (ScrobbleColumns): The scrobbles.
+        timezone (str, optional): The IANA name of the timezone of the
+            days. If None, UTC. Defaults to None.
+
+    Returns:
+        numpy.ndarray: The number of scrobbles of each day, from Monday to
+            Sunday (`int64`).
+    """
+    np = import_optional('numpy')
+    timestamps = local_timestamps(_timestamps(columns), timezone)
+    # The UNIX epoch was a Thursday.
+    return np.bincount((timestamps // DAY + 3) % 7, minlength=7)
+
+
+def sessions(columns: ScrobbleColumns, gap: int = SESSION_GAP) -> dict:
+    """Splits the scrobbles into listening sessions.
+
+    A session ends when the next scrobble is more than `gap` seconds
+    later. Requires the optional `numpy` dependency.
+
+    Args:
+        columns (ScrobbleColumns): The scrobbles.
+        gap (int, optional): The longest time, in seconds, between two
+            scrobbles of the same session. Defaults to `SESSION_GAP`.
+
+    Returns:
+        dict[str, numpy.ndarray]: The UNIX timestamps of the `start` and
+            the `end` of each session (`int64`), and its number of
+            `scrobbles` (`int64`), from the oldest session.
+    """
+    np = import_optional('numpy')
+    timestamps = np.sort(_timestamps(columns))
+    starts, ends = _runs(np.diff(timestamps) > gap, len(timestamps))
+    return {
+        'start': timestamps[starts],
+        'end': timestamps[ends - 1],
+        'scrobbles': ends - starts,
+    }
+
+
+def streaks(columns: ScrobbleColumns, timezone: str | None = None) -> dict:
+    """Finds the runs of consecutive days with scrobbles.
+
+    Requires the optional `numpy` dependency.
+
+    Args:
+        columns (ScrobbleColumns): The scrobbles.
+        timezone (str, optional): The IANA name of the timezone of the
+            days. If None, UTC. Defaults to None.
+
+    Returns:
+        dict[str, numpy.ndarray]: The first day of each streak
+            (`datetime64[D]`) and its number of `days` (`int64`), from the
+            oldest streak.
+    """
+    np = import_optional('numpy')
+    days = np.unique(local_timestamps(_timestamps(columns), timezone) // DAY)
+    starts, ends = _runs(np.diff(days) != 1, len(days))
+    return {
+        'start': days[starts].astype('datetime64[D]'),
+        'days': ends - starts,
+    }
+
+
+def distinct_growth(
+    columns: ScrobbleColumns, chart: T_TopChart = 'artists'
+) -> dict:
+    """Computes the number of distinct artists, albums or tracks over time.
+
+    Albums and tracks are distinguished by their artist and name, and the
+    scrobbles without an album are not counted as an album. Requires the
+    optional `numpy` dependency.
+
+    Args:
+        columns (ScrobbleColumns): The scrobbles.
+        chart (T_TopChart, optional): The entities to count. Defaults to
+            'artists'.
+
+    Returns:
+        dict[str, numpy.ndarray]: The UNIX `timestamp` of each scrobble
+            (`int64`), from the oldest, and the number of `distinct`
+            entities scrobbled up to it (`int64`).
+    """
+    np = import_optional('numpy')
+    timestamps = _timestamps(columns)
+    order = np.argsort(timestamps, kind='stable')
+    keys = np.frombuffer(columns.artist_ids, dtype=np.int32).astype(np.int64)
+    new = np.zeros(len(timestamps), dtype=np.int64)
+    if chart != 'artists':
+        ids, names = {
+            'albums': (columns.album_ids, columns.albums),
+            'tracks': (columns.track_ids, columns.tracks),
+        }[chart]
+        ids = np.frombuffer(ids, dtype=np.int32)
+        keys = keys * len(names) + ids
+
+    _, first = np.unique(keys[order], return_index=True)
+    new[first] = 1
+    if chart == 'albums' and '' in columns.albums:
+        new[ids[order] == columns.albums.get('')] = 0
+    return {'timestamp': timestamps[order], 'distinct': np.cumsum(new)}
+
+
+def _timestamps(columns: ScrobbleColumns) -> Any:
+    """Gets the timestamps of the columns as an array, without copying."""
+    np = import_optional('numpy')
+    return np.frombuffer(columns.timestamps, dtype=np.int64)
+
+
+def _runs(breaks: Any, size: int) -> tuple[Any, Any]:
+    """Gets the start and the end, excluded, of each run of an array of
+    `size` items, given where two consecutive items are in different runs."""
+    np = import_optional('numpy')
+    starts = np.flatnonzero(breaks) + 1
+    if not size:
+        return starts, starts
+    return np.concatenate(([0], starts)), np.append(starts, size)
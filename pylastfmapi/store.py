@@ -0,0 +1,578 @@
+import sqlite3
+from itertools import batched
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Iterable
+
+from pylastfmapi.columnar import ScrobbleColumns
+from pylastfmapi.constants import STORE_BATCH_SIZE
+from pylastfmapi.typehints import T_TopChart
+from pylastfmapi.utils import is_now_playing, scrobble_key
+
+
+class MemoryScrobbleStore:
+    """Keeps the scrobbles of each user in memory.
+
+    The store is the local copy used by `LastFM.sync_user_recent_tracks`:
+    it keeps the high-water mark of each user, the timestamp of their
+    latest scrobble, and merges the new scrobbles without duplicates.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty store."""
+        self._scrobbles: dict[str, dict[tuple[int, str, str], dict]] = {}
+        self._last_timestamps: dict[str, int] = {}
+
+    def __contains__(self, user: str) -> bool:
+        return user in self._scrobbles
+
+    def users(self) -> list[str]:
+        """Gets the users with scrobbles in the store.
+
+        Returns:
+            list[str]: The usernames.
+        """
+        return list(self._scrobbles)
+
+    def last_timestamp(self, user: str) -> int | None:
+        """Gets the high-water mark of a user.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            int | None: The UNIX timestamp of the latest stored scrobble of
+                the user, or None if there is none.
+        """
+        return self._last_timestamps.get(user)
+
+    def add(self, user: str, scrobbles: Iterable[dict]) -> int:
+        """Merges scrobbles of a user into the store.
+
+        Scrobbles already stored and the track that is playing now are
+        skipped.
+
+        Args:
+            user (str): The username.
+            scrobbles (Iterable[dict]): The tracks as sent by
+                `user.getRecentTracks`.
+
+        Returns:
+            int: The number of scrobbles added.
+        """
+        stored = self._scrobbles.setdefault(user, {})
+        added = 0
+        for item in scrobbles:
+            if is_now_playing(item):
+                continue
+            key = scrobble_key(item)
+            if key in stored:
+                continue
+            stored[key] = item
+            added += 1
+            if key[0] > self._last_timestamps.get(user, -1):
+                self._last_timestamps[user] = key[0]
+        return added
+
+    def get(self, user: str) -> list[dict]:
+        """Gets the stored scrobbles of a user.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            list[dict]: The scrobbles, from the latest to the oldest as
+                sent by the LastFM API.
+        """
+        stored = self._scrobbles.get(user, {})
+        return [stored[key] for key in sorted(stored, reverse=True)]
+
+    def columns(self, user: str) -> ScrobbleColumns:
+        """Gets the stored scrobbles of a user as columnar buffers.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            ScrobbleColumns: The scrobbles, from the oldest to the latest.
+        """
+        stored = self._scrobbles.get(user, {})
+        columns = ScrobbleColumns()
+        columns.extend(stored[key] for key in sorted(stored))
+        return columns
+
+
+class SQLiteScrobbleStore:
+    """Keeps the scrobbles, loved tracks and library of each user in SQLite.
+
+    It has the same interface as `MemoryScrobbleStore`, and it's suited to
+    long histories kept between runs. The artists, albums and tracks are
+    stored once in their own tables and referenced by integer IDs, and the
+    scrobbles are indexed by user and time and by user and artist, so the
+    range, count and top queries are answered without the LastFM API.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initializes the store, creating its tables if needed.
+
+        Args:
+            path (str | Path): The path of the database file. Use
+                `':memory:'` to keep the store in memory.
+        """
+        self.path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE
+                );
+                CREATE TABLE IF NOT EXISTS artists (
+                    id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE
+                );
+                CREATE TABLE IF NOT EXISTS albums (
+                    id INTEGER PRIMARY KEY,
+                    artist_id INTEGER NOT NULL REFERENCES artists (id),
+                    name TEXT NOT NULL,
+                    UNIQUE (artist_id, name)
+                );
+                CREATE TABLE IF NOT EXISTS tracks (
+                    id INTEGER PRIMARY KEY,
+                    artist_id INTEGER NOT NULL REFERENCES artists (id),
+                    name TEXT NOT NULL,
+                    UNIQUE (artist_id, name)
+                );
+                CREATE TABLE IF NOT EXISTS scrobbles (
+                    user_id INTEGER NOT NULL REFERENCES users (id),
+                    uts INTEGER NOT NULL,
+                    track_id INTEGER NOT NULL REFERENCES tracks (id),
+                    artist_id INTEGER NOT NULL REFERENCES artists (id),
+                    album_id INTEGER REFERENCES albums (id),
+                    PRIMARY KEY (user_id, uts, track_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS scrobbles_user_artist
+                    ON scrobbles (user_id, artist_id, uts);
+                CREATE TABLE IF NOT EXISTS loved_tracks (
+                    user_id INTEGER NOT NULL REFERENCES users (id),
+                    track_id INTEGER NOT NULL REFERENCES tracks (id),
+                    uts INTEGER,
+                    PRIMARY KEY (user_id, track_id)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS library_artists (
+                    user_id INTEGER NOT NULL REFERENCES users (id),
+                    artist_id INTEGER NOT NULL REFERENCES artists (id),
+                    playcount INTEGER NOT NULL,
+                    PRIMARY KEY (user_id, artist_id)
+                ) WITHOUT ROWID;
+                """
+            )
+
+    def __contains__(self, user: str) -> bool:
+        return self.last_timestamp(user) is not None
+
+    def _fetch(self, query: str, parameters: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def _id(self, table: str, name: str, artist_id: int | None = None) -> int:
+        """Gets the ID of a row, inserting it if needed. It must be called
+        in a transaction holding the lock."""
+        if artist_id is None:
+            columns, values = 'name', (name,)
+        else:
+            columns, values = 'artist_id, name', (artist_id, name)
+        condition = ' AND '.join(
+            f'{column} = ?' for column in columns.split(', ')
+        )
+        self._connection.execute(
+            f'INSERT OR IGNORE INTO {table} ({columns})'
+            f' VALUES ({", ".join("?" * len(values))})',
+            values,
+        )
+        return self._connection.execute(
+            f'SELECT id FROM {table} WHERE {condition}', values
+        ).fetchone()[0]
+
+    def _insert(
+        self,
+        query: str,
+        user: str,
+        items: Iterable[dict],
+        row: Callable[[int, dict], tuple | None],
+    ) -> int:
+        """Inserts the rows of some items in batches, one transaction per
+        batch, and gets the number of rows inserted."""
+        added = 0
+        for batch in batched(items, STORE_BATCH_SIZE):
+            with self._lock, self._connection:
+                user_id = self._id('users', user)
+                rows = [row(user_id, item) for item in batch]
+                added += self._connection.executemany(
+                    query, [row for row in rows if row is not None]
+                ).rowcount
+        return added
+
+    def _artist_id(self, item: dict) -> int:
+        artist = item.get('artist') or {}
+        if isinstance(artist, dict):
+            artist = artist.get('name', artist.get('#text', ''))
+        return self._id('artists', artist)
+
+    def users(self) -> list[str]:
+        """Gets the users with scrobbles in the store.
+
+        Returns:
+            list[str]: The usernames.
+        """
+        return [
+            name
+            for (name,) in self._fetch(
+                'SELECT name FROM users WHERE EXISTS'
+                ' (SELECT 1 FROM scrobbles WHERE user_id = users.id)'
+                ' ORDER BY id'
+            )
+        ]
+
+    def last_timestamp(self, user: str) -> int | None:
+        """Gets the high-water mark of a user.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            int | None: The UNIX timestamp of the latest stored scrobble of
+                the user, or None if there is none.
+        """
+        return self._fetch(
+            'SELECT MAX(uts) FROM scrobbles'
+            ' JOIN users ON users.id = scrobbles.user_id WHERE users.name = ?',
+            (user,),
+        )[0][0]
+
+    def add(self, user: str, scrobbles: Iterable[dict]) -> int:
+        """Merges scrobbles of a user into the store.
+
+        Scrobbles already stored and the track that is playing now are
+        skipped. The scrobbles are inserted in batches of
+        `STORE_BATCH_SIZE`, each in a transaction.
+
+        Args:
+            user (str): The username.
+            scrobbles (Iterable[dict]): The tracks as sent by
+                `user.getRecentTracks`, in the regular or the `extended`
+                format.
+
+        Returns:
+            int: The number of scrobbles added.
+        """
+
+        def _row(user_id: int, item: dict) -> tuple | None:
+            if is_now_playing(item):
+                return None
+            artist_id = self._artist_id(item)
+            album = (item.get('album') or {}).get('#text')
+            return (
+                user_id,
+                int(item['date']['uts']),
+                self._id('tracks', item['name'], artist_id),
+                artist_id,
+                self._id('albums', album, artist_id) if album else None,
+            )
+
+        return self._insert(
+            'INSERT OR IGNORE INTO scrobbles'
+            ' (user_id, uts, track_id, artist_id, album_id)'
+            ' VALUES (?, ?, ?, ?, ?)',
+            user,
+            scrobbles,
+            _row,
+        )
+
+    def add_loved_tracks(self, user: str, tracks: Iterable[dict]) -> int:
+        """Merges the loved tracks of a user into the store.
+
+        Args:
+            user (str): The username.
+            tracks (Iterable[dict]): The tracks as sent by
+                `user.getLovedTracks`.
+
+        Returns:
+            int: The number of loved tracks added.
+        """
+
+        def _row(user_id: int, item: dict) -> tuple:
+            date = item.get('date')
+            return (
+                user_id,
+                self._id('tracks', item['name'], self._artist_id(item)),
+                int(date['uts']) if date else None,
+            )
+
+        return self._insert(
+            'INSERT OR IGNORE INTO loved_tracks (user_id, track_id, uts)'
+            ' VALUES (?, ?, ?)',
+            user,
+            tracks,
+            _row,
+        )
+
+    def add_library_artists(self, user: str, artists: Iterable[dict]) -> int:
+        """Merges the library of a user into the store.
+
+        The playcount of an artist already stored is replaced.
+
+        Args:
+            user (str): The username.
+            artists (Iterable[dict]): The artists as sent by
+                `library.getArtists`.
+
+        Returns:
+            int: The number of artists added or updated.
+        """
+
+        def _row(user_id: int, item: dict) -> tuple:
+            return (
+                user_id,
+                self._id('artists', item['name']),
+                int(item.get('playcount') or 0),
+            )
+
+        return self._insert(
+            'INSERT OR REPLACE INTO library_artists'
+            ' (user_id, artist_id, playcount) VALUES (?, ?, ?)',
+            user,
+            artists,
+            _row,
+        )
+
+    def get(  # noqa PLR0917
+        self,
+        user: str,
+        timestamp_from: int | None = None,
+        timestamp_to: int | None = None,
+        artist: str | None = None,
+        amount: int | None = None,
+    ) -> list[dict]:
+        """Gets the stored scrobbles of a user.
+
+        Args:
+            user (str): The username.
+            timestamp_from (int, optional): The UNIX timestamp of the start
+                of the range, included. Defaults to None.
+            timestamp_to (int, optional): The UNIX timestamp of the end of
+                the range, excluded. Defaults to None.
+            artist (str, optional): Keeps only the scrobbles of an artist.
+                Defaults to None.
+            amount (int, optional): The maximum number of scrobbles. If
+                None, all of them. Defaults to None.
+
+        Returns:
+            list[dict]: The scrobbles, from the latest to the oldest, with
+                the `name`, `artist`, `album` and `date` as sent by the
+                LastFM API.
+        """
+        condition, parameters = _where(
+            user, timestamp_from, timestamp_to, artist
+        )
+        rows = self._fetch(
+            'SELECT scrobbles.uts, tracks.name, artists.name, albums.name'
+            ' FROM scrobbles'
+            ' JOIN users ON users.id = scrobbles.user_id'
+            ' JOIN tracks ON tracks.id = scrobbles.track_id'
+            ' JOIN artists ON artists.id = scrobbles.artist_id'
+            ' LEFT JOIN albums ON albums.id = scrobbles.album_id'
+            f' WHERE {condition} ORDER BY scrobbles.uts DESC LIMIT ?',
+            (*parameters, -1 if amount is None else amount),
+        )
+        return [
+            {
+                'name': name,
+                'artist': {'#text': artist_name},
+                'album': {'#text': album or ''},
+                'date': {'uts': str(uts)},
+            }
+            for uts, name, artist_name, album in rows
+        ]
+
+    def columns(self, user: str) -> ScrobbleColumns:
+        """Gets the stored scrobbles of a user as columnar buffers.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            ScrobbleColumns: The scrobbles, from the oldest to the latest.
+        """
+        columns = ScrobbleColumns()
+        for uts, artist, album, track in self._fetch(
+            'SELECT scrobbles.uts, artists.name, albums.name, tracks.name'
+            ' FROM scrobbles'
+            ' JOIN users ON users.id = scrobbles.user_id'
+            ' JOIN tracks ON tracks.id = scrobbles.track_id'
+            ' JOIN artists ON artists.id = scrobbles.artist_id'
+            ' LEFT JOIN albums ON albums.id = scrobbles.album_id'
+            ' WHERE users.name = ? ORDER BY scrobbles.uts',
+            (user,),
+        ):
+            columns.add(uts, artist, album or '', track)
+        return columns
+
+    def count(
+        self,
+        user: str,
+        timestamp_from: int | None = None,
+        timestamp_to: int | None = None,
+        artist: str | None = None,
+    ) -> int:
+        """Counts the stored scrobbles of a user.
+
+        Args:
+            user (str): The username.
+            timestamp_from (int, optional): The UNIX timestamp of the start
+                of the range, included. Defaults to None.
+            timestamp_to (int, optional): The UNIX timestamp of the end of
+                the range, excluded. Defaults to None.
+            artist (str, optional): Counts only the scrobbles of an artist.
+                Defaults to None.
+
+        Returns:
+            int: The number of scrobbles.
+        """
+        condition, parameters = _where(
+            user, timestamp_from, timestamp_to, artist
+        )
+        return self._fetch(
+            'SELECT COUNT(*) FROM scrobbles'
+            ' JOIN users ON users.id = scrobbles.user_id'
+            ' JOIN artists ON artists.id = scrobbles.artist_id'
+            f' WHERE {condition}',
+            parameters,
+        )[0][0]
+
+    def top(  # noqa PLR0917
+        self,
+        user: str,
+        chart: T_TopChart = 'artists',
+        timestamp_from: int | None = None,
+        timestamp_to: int | None = None,
+        amount: int = 10,
+    ) -> list[dict]:
+        """Gets the most played artists, albums or tracks of a user.
+
+        Args:
+            user (str): The username.
+            chart (T_TopChart, optional): The chart. Defaults to 'artists'.
+            timestamp_from (int, optional): The UNIX timestamp of the start
+                of the range, included. Defaults to None.
+            timestamp_to (int, optional): The UNIX timestamp of the end of
+                the range, excluded. Defaults to None.
+            amount (int, optional): The number of items. Defaults to 10.
+
+        Returns:
+            list[dict]: The `name` of each item, with the `artist` of albums
+                and tracks, and its `playcount`, from the most played.
+        """
+        condition, parameters = _where(
+            user, timestamp_from, timestamp_to, None
+        )
+        if chart == 'artists':
+            join = 'JOIN artists ON artists.id = scrobbles.artist_id'
+            names, group = 'artists.name, NULL', 'scrobbles.artist_id'
+        else:
+            column = f'scrobbles.{chart[:-1]}_id'
+            join = (
+                f'JOIN {chart} ON {chart}.id = {column}'
+                f' JOIN artists ON artists.id = {chart}.artist_id'
+            )
+            names, group = f'{chart}.name, artists.name', column
+        rows = self._fetch(
+            f'SELECT {names}, COUNT(*) AS playcount FROM scrobbles'
+            f' JOIN users ON users.id = scrobbles.user_id {join}'
+            f' WHERE {condition} GROUP BY {group}'
+            ' ORDER BY playcount DESC, MIN(scrobbles.uts) LIMIT ?',
+            (*parameters, amount),
+        )
+        return [
+            {'name': name, 'playcount': playcount}
+            if artist is None
+            else {'name': name, 'artist': artist, 'playcount': playcount}
+            for name, artist, playcount in rows
+        ]
+
+    def loved_tracks(self, user: str) -> list[dict]:
+        """Gets the stored loved tracks of a user.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            list[dict]: The `name`, `artist` and `uts` of each loved track,
+                from the latest.
+        """
+        rows = self._fetch(
+            'SELECT tracks.name, artists.name, loved_tracks.uts'
+            ' FROM loved_tracks'
+            ' JOIN users ON users.id = loved_tracks.user_id'
+            ' JOIN tracks ON tracks.id = loved_tracks.track_id'
+            ' JOIN artists ON artists.id = tracks.artist_id'
+            ' WHERE users.name = ? ORDER BY loved_tracks.uts DESC',
+            (user,),
+        )
+        return [
+            {'name': name, 'artist': artist, 'uts': uts}
+            for name, artist, uts in rows
+        ]
+
+    def library_artists(self, user: str) -> list[dict]:
+        """Gets the stored library of a user.
+
+        Args:
+            user (str): The username.
+
+        Returns:
+            list[dict]: The `name` and `playcount` of each artist, from the
+                most played.
+        """
+        rows = self._fetch(
+            'SELECT artists.name, library_artists.playcount'
+            ' FROM library_artists'
+            ' JOIN users ON users.id = library_artists.user_id'
+            ' JOIN artists ON artists.id = library_artists.artist_id'
+            ' WHERE users.name = ? ORDER BY library_artists.playcount DESC',
+            (user,),
+        )
+        return [
+            {'name': name, 'playcount': playcount} for name, playcount in rows
+        ]
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._connection.close()
+
+
+def _where(
+    user: str,
+    timestamp_from: int | None,
+    timestamp_to: int | None,
+    artist: str | None,
+) -> tuple[str, tuple]:
+    """Gets the condition and the parameters of a query of scrobbles, in
+    the range from `timestamp_from`, included, to `timestamp_to`, excluded,
+    as in `ScrobbleColumns.top`."""
+    conditions = ['users.name = ?']
+    parameters: list = [user]
+    if timestamp_from is not None:
+        conditions.append('scrobbles.uts >= ?')
+        parameters.append(timestamp_from)
+    if timestamp_to is not None:
+        conditions.append('scrobbles.uts < ?')
+        parameters.append(timestamp_to)
+    if artist is not None:
+        conditions.append('artists.name = ?')
+        parameters.append(artist)
+    return ' AND '.join(conditions), tuple(parameters)
+
+
+# T_ScrobbleStore is a type alias for any local store of scrobbles.
+T_ScrobbleStore = MemoryScrobbleStore | SQLiteScrobbleStore
@@ -0,0 +1,323 @@
+import base64
+import heapq
+import json
+import time
+from array import array
+from pathlib import Path
+from typing import Iterable, Literal
+
+from pylastfmapi.columnar import StringDictionary
+from pylastfmapi.constants import (
+    TAG_GETSIMILAR,
+    TAG_GETTOPALBUMS,
+    TAG_GETTOPARTISTS,
+    TAG_GETTOPTRACKS,
+    TAG_INDEX_AMOUNT,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.typehints import T_TopChart
+from pylastfmapi.utils import (
+    entity_key,
+    iter_concurrently,
+    parse_entity_key,
+)
+
+# The endpoint and the keys of the list of items of each chart of a tag.
+CHARTS: dict[str, tuple[str, str, str]] = {
+    'artists': (TAG_GETTOPARTISTS, 'topartists', 'artist'),
+    'albums': (TAG_GETTOPALBUMS, 'albums', 'album'),
+    'tracks': (TAG_GETTOPTRACKS, 'tracks', 'track'),
+}
+
+
+class TagIndex:
+    """An inverted index of tags to the artists, albums and tracks.
+
+    Each tag keeps the IDs of the entities of its top charts, with a weight
+    from 1 for the first entity of a chart down to `1 / n` for the last of
+    `n`, and the names of its similar tags. The postings of a tag are typed
+    arrays of `int32` IDs and `float32` weights, and the entities are
+    dictionary encoded, so the index stays compact for large tag sets.
+    Tags are matched ignoring the case.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self.entities = {chart: StringDictionary() for chart in CHARTS}
+        self.postings: dict[str, dict[str, tuple[array, array]]] = {}
+        self.similar: dict[str, list[str]] = {}
+        self.updated: dict[str, float] = {}
+
+    def __contains__(self, tag: str) -> bool:
+        return tag.casefold() in self.updated
+
+    def __len__(self) -> int:
+        return len(self.updated)
+
+    def add(
+        self,
+        tag: str,
+        charts: dict[str, list[dict]],
+        similar: list[dict],
+    ) -> None:
+        """Adds a tag to the index, replacing its previous postings.
+
+        Args:
+            tag (str): The name of the tag.
+            charts (dict[str, list[dict]]): The items of the top charts of
+                the tag, as sent by the LastFM API, by chart name. A
+                missing chart keeps its previous postings.
+            similar (list[dict]): The similar tags, as sent by the LastFM
+                API.
+        """
+        tag = tag.casefold()
+        postings = self.postings.setdefault(tag, {})
+        for chart, items in charts.items():
+            ids, weights = array('i'), array('f')
+            for position, item in enumerate(items):
+                ids.append(self.entities[chart].encode(entity_key(item)))
+                weights.append((len(items) - position) / len(items))
+            postings[chart] = (ids, weights)
+        self.similar[tag] = [item['name'].casefold() for item in similar]
+        self.updated[tag] = time.time()
+
+    def stale(
+        self, tags: Iterable[str], max_age: float | None = None
+    ) -> list[str]:
+        """Gets the tags that are missing from the index or out of date.
+
+        Args:
+            tags (Iterable[str]): The names of the tags.
+            max_age (float, optional): The age, in seconds, after which an
+                indexed tag is out of date. If None, indexed tags are never
+                out of date. Defaults to None.
+
+        Returns:
+            list[str]: The tags to fetch, without duplicates.
+        """
+        now = time.time()
+        return [
+            tag
+            for tag in dict.fromkeys(tag.casefold() for tag in tags)
+            if tag not in self.updated
+            or (max_age is not None and now - self.updated[tag] > max_age)
+        ]
+
+    def scores(
+        self,
+        tag: str,
+        chart: T_TopChart = 'artists',
+        similar_weight: float = 0,
+    ) -> dict[int, float]:
+        """Gets the weight of each entity of a chart for a tag.
+
+        Args:
+            tag (str): The name of the tag.
+            chart (T_TopChart, optional): The chart of the entities.
+                Defaults to 'artists'.
+            similar_weight (float, optional): The factor applied to the
+                weights of the indexed similar tags, added to the weights
+                of the tag. If 0, the similar tags are ignored. Defaults to
+                0.
+
+        Returns:
+            dict[int, float]: The weight of each entity ID.
+        """
+        tag = tag.casefold()
+        tags = [(tag, 1.0)]
+        if similar_weight:
+            tags.extend(
+                (name, similar_weight) for name in self.similar.get(tag, [])
+            )
+
+        scores: dict[int, float] = {}
+        for name, factor in tags:
+            ids, weights = self.postings.get(name, {}).get(chart, ((), ()))
+            for entity, weight in zip(ids, weights):
+                scores[entity] = scores.get(entity, 0) + factor * weight
+        return scores
+
+    def top(  # noqa PLR0917
+        self,
+        tags: Iterable[str],
+        chart: T_TopChart = 'artists',
+        amount: int = 10,
+        mode: Literal['union', 'intersection'] = 'union',
+        similar_weight: float = 0,
+    ) -> list[dict]:
+        """Gets the entities most associated with some tags.
+
+        Args:
+            tags (Iterable[str]): The names of the tags.
+            chart (T_TopChart, optional): The chart of the entities.
+                Defaults to 'artists'.
+            amount (int, optional): The number of entities. Defaults to 10.
+            mode (Literal['union', 'intersection'], optional): If 'union',
+                the entities of any tag are ranked, and if 'intersection',
+                only the entities of every tag. Defaults to 'union'.
+            similar_weight (float, optional): The factor applied to the
+                weights of the similar tags of each tag, as in `scores`.
+                Defaults to 0.
+
+        Returns:
+            list[dict]: The `name` of each entity, with the `artist` of
+                albums and tracks, and its `weight`, the sum of its weights
+                for the tags, from the highest.
+        """
+        groups = [self.scores(tag, chart, similar_weight) for tag in tags]
+        if not groups:
+            return []
+
+        totals: dict[int, float] = {}
+        if mode == 'intersection':
+            common = set(min(groups, key=len))
+            for group in groups:
+                common.intersection_update(group)
+            groups = [
+                {entity: group[entity] for entity in common}
+                for group in groups
+            ]
+        for group in groups:
+            for entity, weight in group.items():
+                totals[entity] = totals.get(entity, 0) + weight
+
+        return [
+            {
+                **parse_entity_key(self.entities[chart].decode(entity)),
+                'weight': weight,
+            }
+            for entity, weight in heapq.nlargest(
+                amount, totals.items(), key=lambda total: total[1]
+            )
+        ]
+
+    def refresh(  # noqa PLR0917
+        self,
+        request_controller: RequestController,
+        tags: Iterable[str],
+        amount: int = TAG_INDEX_AMOUNT,
+        max_age: float | None = None,
+        workers: int = WORKERS,
+    ) -> int:
+        """Fetches the missing and out of date tags into the index.
+
+        The top artists, albums and tracks and the similar tags of each tag
+        are fetched concurrently under the rate limit of the
+        `RequestController`. A tag is updated once all its requests are
+        complete, and a tag with a failed request or without items in any
+        of its charts keeps its previous postings and is not marked as
+        updated, so it's fetched again by the next refresh.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            tags (Iterable[str]): The names of the tags.
+            amount (int, optional): The number of items of each chart.
+                Defaults to `TAG_INDEX_AMOUNT`.
+            max_age (float, optional): The age, in seconds, after which an
+                indexed tag is fetched again, as in `stale`. Defaults to
+                None.
+            workers (int, optional): The number of requests sent
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            int: The number of tags updated.
+        """
+
+        def _request(key: tuple[str, str]) -> list[dict]:
+            tag, chart = key
+            if chart == 'similar':
+                response = request_controller.request({
+                    'method': TAG_GETSIMILAR,
+                    'tag': tag,
+                })
+                return response.json()['similartags']['tag']
+            method, parent_key, list_key = CHARTS[chart]
+            return request_controller.get_paginated_data(
+                {'method': method, 'tag': tag}, parent_key, list_key, amount
+            )
+
+        keys = [
+            (tag, chart)
+            for tag in self.stale(tags, max_age)
+            for chart in (*CHARTS, 'similar')
+        ]
+        results: dict[str, dict[str, list[dict]]] = {}
+        failed: set[str] = set()
+        updated = 0
+        for (tag, chart), items in iter_concurrently(_request, keys, workers):
+            if isinstance(items, Exception):
+                failed.add(tag)
+            results.setdefault(tag, {})[chart] = items
+            if len(results[tag]) == len(CHARTS) + 1:
+                charts = results.pop(tag)
+                if tag not in failed and any(
+                    charts[chart] for chart in CHARTS
+                ):
+                    similar = charts.pop('similar')
+                    self.add(tag, charts, similar)
+                    updated += 1
+        return updated
+
+    def save(self, path: str | Path) -> None:
+        """Saves the index in a JSON file.
+
+        Args:
+            path (str | Path): The path of the file.
+        """
+
+        def _encode(values: array) -> str:
+            return base64.b64encode(values.tobytes()).decode()
+
+        Path(path).write_text(
+            json.dumps({
+                'entities': {
+                    chart: entities.values
+                    for chart, entities in self.entities.items()
+                },
+                'postings': {
+                    tag: {
+                        chart: [_encode(ids), _encode(weights)]
+                        for chart, (ids, weights) in charts.items()
+                    }
+                    for tag, charts in self.postings.items()
+                },
+                'similar': self.similar,
+                'updated': self.updated,
+            }),
+            encoding='utf-8',
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'TagIndex':
+        """Loads an index saved with `save`.
+
+        Args:
+            path (str | Path): The path of the file.
+
+        Returns:
+            TagIndex: The index.
+        """
+
+        def _decode(typecode: str, values: str) -> array:
+            decoded = array(typecode)
+            decoded.frombytes(base64.b64decode(values))
+            return decoded
+
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        index = cls()
+        index.entities = {
+            chart: StringDictionary(values)
+            for chart, values in data['entities'].items()
+        }
+        index.postings = {
+            tag: {
+                chart: (_decode('i', ids), _decode('f', weights))
+                for chart, (ids, weights) in charts.items()
+            }
+            for tag, charts in data['postings'].items()
+        }
+        index.similar = data['similar']
+        index.updated = data['updated']
+        return index
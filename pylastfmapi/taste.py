@@ -0,0 +1,304 @@
+from array import array
+from typing import Any, Iterable, Iterator
+
+from pylastfmapi.columnar import StringDictionary
+from pylastfmapi.constants import (
+    TASTE_AMOUNT,
+    TASTE_BLOCK_SIZE,
+    USER_GETTOPARTISTS,
+    WORKERS,
+)
+from pylastfmapi.request import RequestController
+from pylastfmapi.typehints import T_Period
+from pylastfmapi.utils import import_optional, iter_concurrently
+
+
+class TasteMatrix:
+    """A sparse user by artist matrix of playcounts in compressed sparse rows.
+
+    The artists of the user with the ID `id` are stored in `indices`, with
+    their playcounts in `weights`, from `indptr[id]` to `indptr[id + 1]`.
+    The compatibility of two users is the cosine similarity of their rows,
+    and the similarities of every pair are computed a block of users at a
+    time, so the memory used is bounded by the size of the block and not by
+    the square of the number of users. Requires the optional `numpy`
+    dependency to score the users.
+    """
+
+    def __init__(  # noqa PLR0917
+        self,
+        users: list[str],
+        artists: StringDictionary,
+        indptr: array,
+        indices: array,
+        weights: array,
+    ) -> None:
+        """Initializes the matrix from its arrays.
+
+        Args:
+            users (list[str]): The username of each row, by ID.
+            artists (StringDictionary): The names of the artists, the
+                columns of the matrix.
+            indptr (array): The start of the artists of each user in
+                `indices` (`int64`), with the number of entries at the end.
+            indices (array): The IDs of the artists (`int32`).
+            weights (array): The playcount of each entry (`float32`).
+        """
+        self.users = users
+        self.artists = artists
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.failed: list[str] = []
+        self._ids = {user: row for row, user in enumerate(users)}
+        self._normalized: Any = None
+        self._columns: Any = None
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def __contains__(self, user: str) -> bool:
+        return user in self._ids
+
+    @classmethod
+    def from_charts(
+        cls, charts: Iterable[tuple[str, list[dict]]]
+    ) -> 'TasteMatrix':
+        """Builds the matrix from the top artists of each user.
+
+        Args:
+            charts (Iterable[tuple[str, list[dict]]]): The username and the
+                top artists of each user, as sent by `user.getTopArtists`.
+
+        Returns:
+            TasteMatrix: The matrix, with one row per user in order.
+        """
+        users: list[str] = []
+        artists = StringDictionary()
+        indptr, indices, weights = array('q', [0]), array('i'), array('f')
+        for user, items in charts:
+            users.append(user)
+            for item in items:
+                indices.append(artists.encode(item['name']))
+                weights.append(float(item.get('playcount') or 0))
+            indptr.append(len(indices))
+        return cls(users, artists, indptr, indices, weights)
+
+    @classmethod
+    def fetch(  # noqa PLR0917
+        cls,
+        request_controller: RequestController,
+        users: Iterable[str],
+        period: T_Period = 'overall',
+        amount: int = TASTE_AMOUNT,
+        workers: int = WORKERS,
+    ) -> 'TasteMatrix':
+        """Fetches the top artists of many users concurrently.
+
+        Each user is requested once, under the rate limit of the
+        `RequestController`. A user whose request fails is kept in
+        `failed` instead of the matrix.
+
+        Args:
+            request_controller (RequestController): The controller used to
+                send the requests.
+            users (Iterable[str]): The usernames.
+            period (T_Period, optional): The period of the top artists.
+                Defaults to 'overall'.
+            amount (int, optional): The number of top artists of each user.
+                Defaults to `TASTE_AMOUNT`.
+            workers (int, optional): The number of users fetched
+                concurrently. Defaults to `WORKERS`.
+
+        Returns:
+            TasteMatrix: The matrix, with the users in the order their
+                requests complete.
+        """
+
+        def _request(user: str) -> list[dict]:
+            return request_controller.get_paginated_data(
+                {'method': USER_GETTOPARTISTS, 'user': user, 'period': period},
+                'topartists',
+                'artist',
+                amount,
+            )
+
+        charts = []
+        failed = []
+        for user, items in iter_concurrently(
+            _request, dict.fromkeys(users), workers
+        ):
+            if isinstance(items, Exception):
+                failed.append(user)
+            else:
+                charts.append((user, items))
+        matrix = cls.from_charts(charts)
+        matrix.failed = failed
+        return matrix
+
+    def _prepare(self) -> tuple[Any, Any, Any, Any]:
+        """Gets the rows normalized to unit length and the same entries in
+        compressed sparse columns, computing them once."""
+        np = import_optional('numpy')
+        indptr = np.frombuffer(self.indptr, dtype=np.int64)
+        indices = np.frombuffer(self.indices, dtype=np.int32)
+        if self._normalized is None:
+            weights = np.frombuffer(self.weights, dtype=np.float32)
+            rows = np.repeat(np.arange(len(self.users)), np.diff(indptr))
+            norms = np.sqrt(
+                np.bincount(
+                    rows,
+                    weights=weights.astype(np.float64) ** 2,
+                    minlength=len(self.users),
+                )
+            )
+            norms[norms == 0] = 1
+            self._normalized = (weights / norms[rows]).astype(np.float32)
+
+            order = np.argsort(indices, kind='stable')
+            colptr = np.zeros(len(self.artists) + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(indices, minlength=len(self.artists)),
+                out=colptr[1:],
+            )
+            self._columns = (colptr, rows[order], self._normalized[order])
+        return indptr, indices, self._normalized, self._columns
+
+    def _scores(self, start: int, end: int) -> Any:
+        """Computes the similarities of the users from `start` to `end`,
+        excluded, to every user.
+
+        Each entry of the block is paired with every entry of the column of
+        its artist, gathered at once from the compressed sparse columns, and
+        the products of the pairs are summed into the cell of their two
+        users, so only the users sharing an artist are visited."""
+        np = import_optional('numpy')
+        indptr, indices, weights, (colptr, col_rows, col_weights) = (
+            self._prepare()
+        )
+        block = slice(indptr[start], indptr[end])
+        rows = np.repeat(
+            np.arange(end - start), np.diff(indptr[start : end + 1])
+        )
+        columns = indices[block]
+        counts = colptr[columns + 1] - colptr[columns]
+        # The position in the columns of each pair is the start of the
+        # column of its entry plus its offset inside the column.
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        others = np.repeat(colptr[columns], counts) + offsets
+
+        cells = np.repeat(rows, counts) * len(self.users) + col_rows[others]
+        scores = np.bincount(
+            cells,
+            weights=np.repeat(weights[block], counts) * col_weights[others],
+            minlength=(end - start) * len(self.users),
+        )
+        return scores.astype(np.float32).reshape(end - start, len(self.users))
+
+    def similarity(self, user: str, other: str) -> float:
+        """Computes the compatibility of two users.
+
+        Args:
+            user (str): The username of a user of the matrix.
+            other (str): The username of another user of the matrix.
+
+        Returns:
+            float: The cosine similarity of the top artists of the users,
+                from 0 to 1.
+
+        Raises:
+            KeyError: If a user is not in the matrix.
+        """
+        row = self._ids[user]
+        return float(self._scores(row, row + 1)[0, self._ids[other]])
+
+    def blocks(
+        self, block_size: int = TASTE_BLOCK_SIZE
+    ) -> Iterator[tuple[int, Any]]:
+        """Computes the similarities of every pair of users, by blocks.
+
+        Args:
+            block_size (int, optional): The number of users of each block.
+                Each block takes `block_size * len(self)` floats. Defaults to
+                `TASTE_BLOCK_SIZE`.
+
+        Yields:
+            tuple[int, numpy.ndarray]: The ID of the first user of the block
+                and the cosine similarities of its users to every user
+                (`float32`), one row per user of the block.
+        """
+        for start in range(0, len(self.users), block_size):
+            end = min(start + block_size, len(self.users))
+            yield start, self._scores(start, end)
+
+    def most_similar(
+        self, amount: int = 10, block_size: int = TASTE_BLOCK_SIZE
+    ) -> Iterator[tuple[str, list[tuple[str, float]]]]:
+        """Finds the most compatible users of every user.
+
+        Args:
+            amount (int, optional): The number of users kept for each user.
+                Defaults to 10.
+            block_size (int, optional): The number of users scored at once,
+                as in `blocks`. Defaults to `TASTE_BLOCK_SIZE`.
+
+        Yields:
+            tuple[str, list[tuple[str, float]]]: The username of each user
+                and the usernames of the other users sharing artists with
+                it, with their cosine similarity, from the most similar.
+        """
+        np = import_optional('numpy')
+        for start, scores in self.blocks(block_size):
+            rows = np.arange(len(scores))
+            scores[rows, start + rows] = 0
+            for row, row_scores in enumerate(scores):
+                yield (
+                    self.users[start + row],
+                    [
+                        (self.users[other], score)
+                        for other, score in _ranked(row_scores, amount)
+                    ],
+                )
+
+    def similar(self, user: str, amount: int = 10) -> list[tuple[str, float]]:
+        """Finds the most compatible users of a user.
+
+        Args:
+            user (str): The username of a user of the matrix.
+            amount (int, optional): The number of users. Defaults to 10.
+
+        Returns:
+            list[tuple[str, float]]: The usernames of the other users
+                sharing artists with the user, with their cosine
+                similarity, from the most similar.
+
+        Raises:
+            KeyError: If the user is not in the matrix.
+        """
+        row = self._ids[user]
+        scores = self._scores(row, row + 1)[0]
+        scores[row] = 0
+        return [
+            (self.users[other], score)
+            for other, score in _ranked(scores, amount)
+        ]
+
+
+def _ranked(scores: Any, amount: int) -> list[tuple[int, float]]:
+    """Gets the IDs of the highest positive scores of a row, with their
+    scores, from the highest."""
+    np = import_optional('numpy')
+    amount = min(amount, len(scores))
+    if amount <= 0:
+        return []
+    candidates = np.argpartition(-scores, amount - 1)[:amount]
+    return sorted(
+        (
+            (other, float(scores[other]))
+            for other in candidates.tolist()
+            if scores[other] > 0
+        ),
+        key=lambda score: (-score[1], score[0]),
+    )
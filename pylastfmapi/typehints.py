@@ -12,6 +12,15 @@ The period used in user methods
 - '12month': Represents the past 12 months.
 """
 
+T_TopChart = Literal['artists', 'albums', 'tracks']
+"""
+The top charts of a user, fetched by `get_users_top_charts`
+
+- 'artists': The top artists, as in `get_user_top_artists`.
+- 'albums': The top albums, as in `get_user_top_albums`.
+- 'tracks': The top tracks, as in `get_user_top_tracks`.
+"""
+
 T_ISO3166CountryNames = Literal[
     'Afghanistan',
     'Albania',
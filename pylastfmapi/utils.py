@@ -1,6 +1,20 @@
+import importlib
+import unicodedata
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
+from types import ModuleType
+from typing import Any, Callable, Hashable, Iterable, Iterator
 
-from pylastfmapi.exceptions import LastFMException
+import requests
+
+from pylastfmapi.constants import LIMIT, WORKERS
+from pylastfmapi.exceptions import LastFMException, RequestErrorException
 
 
 def get_timestamp(
@@ -68,3 +82,297 @@ def get_timestamp(
     else:
         timestamp_from, timestamp_to = None, None
     return timestamp_from, timestamp_to
+
+
+def project_fields(data: Any, fields: list[str] | None) -> Any:
+    """
+    Keep only the given fields of an item, or of each item of a list.
+
+    Nested fields are given with their keys joined by dots, like
+    `'date.uts'` or `'artist.name'`, and keep the nested structure of the
+    original item. Fields that are not present in an item are skipped.
+
+    Args:
+        data (dict | list[dict]): An item, or a list of items, from the
+            LastFM API response.
+        fields (list[str]): The fields to keep. If `None` or empty, the
+            data is returned untouched.
+
+    Returns:
+        The projected item, or list of projected items.
+
+    """
+    if not fields:
+        return data
+    if isinstance(data, list):
+        return [project_fields(item, fields) for item in data]
+
+    projected: dict = {}
+    for field in fields:
+        *parents, key = field.split('.')
+        value, target = data, projected
+        for parent in parents:
+            value = value.get(parent) if isinstance(value, dict) else None
+            if not isinstance(value, dict):
+                break
+            target = target.setdefault(parent, {})
+        else:
+            if key in value:
+                target[key] = value[key]
+    return projected
+
+
+def import_optional(module: str) -> ModuleType:
+    """
+    Import an optional dependency of the package.
+
+    Features like the NumPy and Arrow exports depend on packages that are
+    not installed with `pylastfmapi` by default. They are installed with
+    the extra of the same name, like `pip install pylastfmapi[numpy]`.
+
+    Args:
+        module (str): The name of the module to import.
+
+    Returns:
+        The imported module.
+
+    Raises:
+        LastFMException: If the module is not installed.
+
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise LastFMException(
+            f'The "{module}" package is required for this feature, '
+            f'install it with "pip install pylastfmapi[{module}]": {e}'
+        )
+
+
+def intern_strings(data: Any, strings: dict[str, str]) -> Any:
+    """
+    Replace the strings of an item with a shared instance of each value.
+
+    The JSON decoder creates a new string object for every value it reads,
+    so an artist name repeated in thousands of scrobbles is stored thousands
+    of times. Passing the same `strings` pool across the items of a request
+    keeps a single instance of each distinct key and value.
+
+    Args:
+        data (Any): An item, or a list of items, from the LastFM API
+            response.
+        strings (dict[str, str]): The pool of shared strings, updated with
+            the new strings found in `data`.
+
+    Returns:
+        The item, or list of items, with its strings shared with the pool.
+
+    """
+    if isinstance(data, str):
+        return strings.setdefault(data, data)
+    if isinstance(data, dict):
+        return {
+            strings.setdefault(key, key): intern_strings(value, strings)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [intern_strings(item, strings) for item in data]
+    return data
+
+
+def is_now_playing(item: dict) -> bool:
+    """
+    Check if a track from `user.getRecentTracks` is playing now.
+
+    The track that is playing now is sent as the first item of the list,
+    flagged in `@attr` and without a `date`, so it is not a scrobble yet.
+
+    Args:
+        item (dict): The track as sent by the LastFM API.
+
+    Returns:
+        bool: True if the track is playing now.
+
+    """
+    return (
+        item.get('@attr', {}).get('nowplaying') == 'true' or 'date' not in item
+    )
+
+
+def scrobble_key(item: dict) -> tuple[int, str, str]:
+    """
+    Get a key that identifies a scrobble of a user.
+
+    A user can't scrobble the same track twice at the same second, so the
+    timestamp with the artist and track names identifies the scrobble in
+    both the regular and the `extended` format.
+
+    Args:
+        item (dict): The scrobbled track as sent by the LastFM API.
+
+    Returns:
+        tuple[int, str, str]: The UNIX timestamp, the artist name and the
+            track name.
+
+    """
+    artist = item.get('artist') or {}
+    return (
+        int(item['date']['uts']),
+        artist.get('name', artist.get('#text', '')),
+        item.get('name', ''),
+    )
+
+
+def entity_key(item: dict) -> str:
+    """
+    Get the key of an artist, album or track from the API.
+
+    Albums and tracks are identified by their artist name and their own
+    name, separated by a tab, and artists by their name only.
+
+    Args:
+        item (dict): The artist, album or track as sent by the LastFM API.
+
+    Returns:
+        str: The key of the item.
+
+    """
+    artist = item.get('artist')
+    if artist is None:
+        return item['name']
+    if isinstance(artist, dict):
+        artist = artist.get('name', artist.get('#text', ''))
+    return f'{artist}\t{item["name"]}'
+
+
+def parse_entity_key(key: str) -> dict:
+    """
+    Get the names of an artist, album or track from its key.
+
+    Args:
+        key (str): The key, as in `entity_key`.
+
+    Returns:
+        dict: The `name` of the item, with the `artist` of albums and
+            tracks.
+
+    """
+    artist, separator, name = key.rpartition('\t')
+    if not separator:
+        return {'name': name}
+    return {'name': name, 'artist': artist}
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize the name of an artist, album or track for matching.
+
+    The case, the accents and the punctuation are ignored, and the
+    whitespace is collapsed, so 'Röyksopp' and 'royksopp' are the same.
+
+    Args:
+        name (str): The name.
+
+    Returns:
+        str: The normalized name.
+
+    """
+    name = unicodedata.normalize('NFKD', name.casefold())
+    return ' '.join(
+        ''.join(
+            character if character.isalnum() else ' '
+            for character in name
+            if not unicodedata.combining(character)
+        ).split()
+    )
+
+
+def unique_scrobbles(
+    items: Iterable[dict], window: int = LIMIT
+) -> Iterator[dict]:
+    """
+    Drop the now playing track and the repeated scrobbles of a history.
+
+    When a scrobble is added to a history while it is paged, every page
+    boundary after it shifts by one, and the last scrobble of a page is
+    sent again as the first one of the next page. Only the keys of the
+    last `window` scrobbles are kept, which is enough for the shifts that
+    happen while a page is read.
+
+    Args:
+        items (Iterable[dict]): The tracks as sent by
+            `user.getRecentTracks`, across all pages.
+        window (int, optional): The number of recent keys to remember.
+            Defaults to `LIMIT`, the size of a page.
+
+    Yields:
+        dict: The scrobbles, in the same order, without duplicates.
+
+    """
+    recent: deque[tuple[int, str, str]] = deque(maxlen=window)
+    seen: set[tuple[int, str, str]] = set()
+    for item in items:
+        if is_now_playing(item):
+            continue
+        key = scrobble_key(item)
+        if key in seen:
+            continue
+        if len(recent) == window:
+            seen.discard(recent[0])
+        recent.append(key)
+        seen.add(key)
+        yield item
+
+
+def iter_concurrently(
+    function: Callable[[Any], Any],
+    keys: Iterable[Hashable],
+    workers: int = WORKERS,
+) -> Iterator[tuple[Any, Any]]:
+    """
+    Call a function for each distinct key in a pool of threads.
+
+    The keys are read lazily and only a few calls are pending at a time,
+    so large iterables of keys are not loaded in memory. A key repeated in
+    the iterable is called only once.
+
+    Args:
+        function (Callable): The function called with each key.
+        keys (Iterable[Hashable]): The keys.
+        workers (int, optional): The number of threads. Defaults to
+            `WORKERS`.
+
+    Yields:
+        tuple[Any, Any]: Each key with the result of its call, as soon as
+            it is complete. If the call raised a `LastFMException`, a
+            `RequestErrorException` or a request error, the exception is
+            yielded as the result instead of being raised.
+
+    """
+    seen: set[Hashable] = set()
+    keys = iter(keys)
+    pending: dict[Future, Hashable] = {}
+
+    with ThreadPoolExecutor(workers) as executor:
+        while True:
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+                pending[executor.submit(function, key)] = key
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except (
+                    LastFMException,
+                    RequestErrorException,
+                    requests.RequestException,
+                ) as error:
+                    result = error
+                yield pending.pop(future), result
@@ -1,8 +1,24 @@
+from functools import partial
+
 import pytest
+import requests_cache
 
 from pylastfmapi.client import LastFM
 
 
+@pytest.fixture(autouse=True)
+def http_cache(monkeypatch, tmp_path):
+    """Installs the cache of the requests in `tmp_path`, so no test leaves
+    a cache file in the checkout."""
+    monkeypatch.setattr(
+        requests_cache,
+        'install_cache',
+        partial(requests_cache.install_cache, tmp_path / 'http_cache'),
+    )
+    yield
+    requests_cache.uninstall_cache()
+
+
 @pytest.fixture
 def setup_request_mock(mocker):
     def _setup_request_mock(return_value):
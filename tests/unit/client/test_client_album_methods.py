@@ -6,8 +6,11 @@ from pylastfmapi.constants import (
     ALBUM_GETTAGS,
     ALBUM_GETTOPTAGS,
     ALBUM_SEARCH,
+    SEARCH_INDEX_AMOUNT,
 )
-from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.exceptions import LastFMException, RequestErrorException
+from pylastfmapi.models import Album
+from pylastfmapi.search import SearchIndex
 
 #########################################################################
 # GET ALBUM INFO
@@ -34,6 +37,49 @@ def test_get_album_info(setup_request_mock):
     assert response == return_value['album']
 
 
+def test_get_album_info_with_fields(setup_request_mock):
+    album = 'albumname'
+    artist = 'artistname'
+    return_value = {
+        'album': {
+            'name': 'Album Name',
+            'artist': 'Artist Name',
+            'image': [{'#text': 'url', 'size': 'small'}],
+            'tracks': {'track': [{'name': 'Track Name'}]},
+        }
+    }
+    client, mock_request_controller = setup_request_mock(return_value)
+    ##
+    response = client.get_album_info(
+        album=album, artist=artist, fields=['name', 'tracks.track']
+    )
+    ##
+    assert response == {
+        'name': 'Album Name',
+        'tracks': {'track': [{'name': 'Track Name'}]},
+    }
+
+
+def test_get_album_info_typed(setup_request_mock):
+    album = 'albumname'
+    artist = 'artistname'
+    return_value = {
+        'album': {
+            'name': 'Album Name',
+            'artist': 'Artist Name',
+            'listeners': '100',
+            'playcount': '1000',
+        }
+    }
+    client, _ = setup_request_mock(return_value)
+    ##
+    response = client.get_album_info(album=album, artist=artist, typed=True)
+    ##
+    assert response == Album(
+        name='Album Name', artist='Artist Name', playcount=1000, listeners=100
+    )
+
+
 @pytest.mark.parametrize(
     ('artist', 'album', 'mbid'),
     [
@@ -102,6 +148,52 @@ def test_get_album_info_with_parameters(setup_request_mock):
     assert response == return_value['album']
 
 
+#########################################################################
+# GET ALBUM INFO MANY
+#########################################################################
+
+
+def test_get_album_info_many(setup_request_mock):
+    return_value = {'album': {'name': 'Album Name', 'artist': 'Artist Name'}}
+    client, mock_request_controller = setup_request_mock(return_value)
+    albums = [('artistname', 'albumname'), 'mbid', ('artistname', 'albumname')]
+    ##
+    response = dict(client.get_album_info_many(albums, workers=2))
+    ##
+    assert response == {
+        ('artistname', 'albumname'): return_value['album'],
+        'mbid': return_value['album'],
+    }
+    assert mock_request_controller.request.call_count == 2  # noqa: PLR2004
+    mock_request_controller.request.assert_any_call({
+        'method': ALBUM_GETINFO,
+        'album': None,
+        'artist': None,
+        'mbid': 'mbid',
+        'autocorrect': False,
+        'lang': 'en',
+        'username': None,
+    })
+
+
+def test_get_album_info_many_with_error(mocker, setup_request_mock):
+    client, mock_request_controller = setup_request_mock({})
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {'album': {'name': 'Album Name'}}
+    error = RequestErrorException('Something wrong, error 6: Not found')
+
+    def _request(payload):
+        if payload['mbid'] == 'mbid2':
+            raise error
+        return mock_response
+
+    mock_request_controller.request.side_effect = _request
+    ##
+    response = dict(client.get_album_info_many(['mbid1', 'mbid2'], typed=True))
+    ##
+    assert response == {'mbid1': Album(name='Album Name'), 'mbid2': error}
+
+
 #########################################################################
 # GET ALBUM TAGS
 #########################################################################
@@ -319,6 +411,8 @@ def test_search_album(setup_search_mock):
         'albummatches',
         'album',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -340,5 +434,30 @@ def test_search_album_with_parameters(setup_search_mock):
         'albummatches',
         'album',
         amount,
+        fields=None,
+        model=None,
+    )
+    assert response == return_value
+
+
+def test_search_album_with_index(setup_search_mock):
+    album = 'albumname'
+    return_value = [
+        {'name': 'Album Name', 'artist': 'Artist Name', 'url': 'url'},
+    ]
+    index = SearchIndex()
+    client, mock_request_controller = setup_search_mock(return_value)
+    ##
+    response = client.search_album(album=album, index=index)
+    ##
+    mock_request_controller.get_search_data.assert_called_once_with(
+        {'method': ALBUM_SEARCH, 'album': album},
+        'albummatches',
+        'album',
+        SEARCH_INDEX_AMOUNT,
     )
     assert response == return_value
+    assert client.search_album(
+        'album nam', amount=1, fields=['name'], index=index
+    ) == [{'name': 'Album Name'}]
+    mock_request_controller.get_search_data.assert_called_once()
@@ -10,8 +10,10 @@ from pylastfmapi.constants import (
     ARTIST_GETTOPTAGS,
     ARTIST_GETTOPTRACKS,
     ARTIST_SEARCH,
+    SEARCH_INDEX_AMOUNT,
 )
 from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.search import SearchIndex
 
 #########################################################################
 # GET ARTIST INFO
@@ -91,6 +93,34 @@ def test_get_artist_info_with_parameters(setup_request_mock):
     assert response == return_value['artist']
 
 
+#########################################################################
+# GET ARTIST INFO MANY
+#########################################################################
+
+
+@pytest.mark.parametrize(
+    ('mbid', 'key', 'params'),
+    [
+        (False, 'artistname', {'artist': 'artistname', 'mbid': None}),
+        (True, 'mbid', {'artist': None, 'mbid': 'mbid'}),
+    ],
+)
+def test_get_artist_info_many(setup_request_mock, mbid, key, params):
+    return_value = {'artist': {'name': 'Artist Name'}}
+    client, mock_request_controller = setup_request_mock(return_value)
+    ##
+    response = list(client.get_artist_info_many([key, key], mbid=mbid))
+    ##
+    mock_request_controller.request.assert_called_once_with({
+        'method': ARTIST_GETINFO,
+        **params,
+        'autocorrect': False,
+        'lang': 'en',
+        'username': None,
+    })
+    assert response == [(key, return_value['artist'])]
+
+
 #########################################################################
 # GET ARTIST TAGS
 #########################################################################
@@ -275,6 +305,8 @@ def test_get_artist_top_albums(setup_paginated_mock):
         'topalbums',
         'album',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -309,6 +341,8 @@ def test_get_artist_top_albums_without_artist_name_with_mbid(
         'topalbums',
         'album',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -334,6 +368,8 @@ def test_get_artist_top_albums_with_parameters(setup_paginated_mock):
         'topalbums',
         'album',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -360,6 +396,8 @@ def test_get_artist_top_tracks(setup_paginated_mock):
         'toptracks',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -394,6 +432,8 @@ def test_get_artist_top_tracks_without_artist_name_with_mbid(
         'toptracks',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -419,6 +459,8 @@ def test_get_artist_top_tracks_with_parameters(setup_paginated_mock):
         'toptracks',
         'track',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -494,6 +536,26 @@ def test_get_artist_similar_with_parameters(setup_request_mock):
     assert response == return_value['similarartists']['artist']
 
 
+# #########################################################################
+# # GET ARTIST SIMILAR GRAPH
+# #########################################################################
+
+
+def test_get_artist_similar_graph(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_build = mocker.patch('pylastfmapi.client.build_artist_graph')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_artist_similar_graph(
+        ['artistname'], max_depth=1, amount=10
+    )
+    ##
+    mock_build.assert_called_with(
+        client.request_controller, ['artistname'], 1, 10_000, 10, 4
+    )
+    assert response == mock_build.return_value
+
+
 # #########################################################################
 # # SEARCH ARTIST
 # #########################################################################
@@ -520,6 +582,8 @@ def test_search_artist(mocker):
         'artistmatches',
         'artist',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -541,8 +605,43 @@ def test_search_artist_with_parameters(setup_search_mock):
         'artistmatches',
         'artist',
         amount,
+        fields=None,
+        model=None,
+    )
+    assert response == return_value
+
+
+def test_search_artist_with_index(setup_search_mock):
+    return_value = [
+        {'name': 'Radio Moscow', 'listeners': '10000'},
+        {'name': 'Radiohead', 'listeners': '5000000'},
+    ]
+    index = SearchIndex()
+    client, mock_request_controller = setup_search_mock(return_value)
+    ##
+    response = client.search_artist(artist='radio', amount=2, index=index)
+    ##
+    mock_request_controller.get_search_data.assert_called_once_with(
+        {'method': ARTIST_SEARCH, 'artist': 'radio'},
+        'artistmatches',
+        'artist',
+        2,
     )
     assert response == return_value
+    assert client.search_artist('Radiohed', 1, index=index) == [
+        return_value[1]
+    ]
+    mock_request_controller.get_search_data.assert_called_once()
+    assert client.search_artist('radio', index=index) == [
+        return_value[1],
+        return_value[0],
+    ]
+    mock_request_controller.get_search_data.assert_called_with(
+        {'method': ARTIST_SEARCH, 'artist': 'radio'},
+        'artistmatches',
+        'artist',
+        SEARCH_INDEX_AMOUNT,
+    )
 
 
 # #########################################################################
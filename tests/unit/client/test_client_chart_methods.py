@@ -17,7 +17,12 @@ def test_get_top_artists(setup_paginated_mock):
     response = client.get_top_artists()
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': CHART_GETTOPARTISTS}, 'artists', 'artist', None
+        {'method': CHART_GETTOPARTISTS},
+        'artists',
+        'artist',
+        None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -31,7 +36,12 @@ def test_get_top_artists_with_parameters(setup_paginated_mock):
     response = client.get_top_artists(amount=amount)
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': CHART_GETTOPARTISTS}, 'artists', 'artist', amount
+        {'method': CHART_GETTOPARTISTS},
+        'artists',
+        'artist',
+        amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -49,7 +59,12 @@ def test_get_top_tags(setup_paginated_mock):
     response = client.get_top_tags()
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': CHART_GETTOPTAGS}, 'tags', 'tag', None
+        {'method': CHART_GETTOPTAGS},
+        'tags',
+        'tag',
+        None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -63,7 +78,12 @@ def test_get_top_tags_with_parameters(setup_paginated_mock):
     response = client.get_top_tags(amount=amount)
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': CHART_GETTOPTAGS}, 'tags', 'tag', amount
+        {'method': CHART_GETTOPTAGS},
+        'tags',
+        'tag',
+        amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -81,7 +101,12 @@ def test_get_top_tracks(setup_paginated_mock):
     response = client.get_top_tracks()
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': CHART_GETTOPTRACKS}, 'tracks', 'track', None
+        {'method': CHART_GETTOPTRACKS},
+        'tracks',
+        'track',
+        None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -95,6 +120,11 @@ def test_get_top_tracks_with_parameters(setup_paginated_mock):
     response = client.get_top_tracks(amount=amount)
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': CHART_GETTOPTRACKS}, 'tracks', 'track', amount
+        {'method': CHART_GETTOPTRACKS},
+        'tracks',
+        'track',
+        amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
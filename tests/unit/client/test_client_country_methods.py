@@ -1,7 +1,9 @@
+from pylastfmapi.client import LastFM
 from pylastfmapi.constants import (
     GEO_GETOPTRACKS,
     GEO_GETTOPARTISTS,
 )
+from pylastfmapi.geo import GeoSnapshot
 
 # #########################################################################
 # # GET COUNTRY TOP ARTISTS
@@ -20,6 +22,8 @@ def test_get_country_top_artists(setup_paginated_mock):
         'topartists',
         'artist',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -37,10 +41,30 @@ def test_get_country_top_artists_with_parameters(setup_paginated_mock):
         'topartists',
         'artist',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
 
+# #########################################################################
+# # GET COUNTRIES TOP CHART
+# #########################################################################
+
+
+def test_get_countries_top_chart(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_fetch = mocker.patch.object(GeoSnapshot, 'fetch')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_countries_top_chart('tracks', ['Brazil'], 10)
+    ##
+    mock_fetch.assert_called_with(
+        client.request_controller, 'tracks', ['Brazil'], 10, 4
+    )
+    assert response == mock_fetch.return_value
+
+
 # #########################################################################
 # # GET COUNTRY TOP TRACKS
 # #########################################################################
@@ -58,6 +82,8 @@ def test_get_country_top_tracks(setup_paginated_mock):
         'tracks',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -78,5 +104,7 @@ def test_get_country_top_tracks_with_parameters(setup_paginated_mock):
         'tracks',
         'track',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
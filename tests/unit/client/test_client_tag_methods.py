@@ -1,3 +1,4 @@
+from pylastfmapi.client import LastFM
 from pylastfmapi.constants import (
     TAG_GETINFO,
     TAG_GETSIMILAR,
@@ -5,6 +6,8 @@ from pylastfmapi.constants import (
     TAG_GETTOPARTISTS,
     TAG_GETTOPTRACKS,
 )
+from pylastfmapi.cooccurrence import TagCooccurrence
+from pylastfmapi.tags import TagIndex
 
 #########################################################################
 # GET TAG INFO
@@ -67,6 +70,74 @@ def test_get_tag_similar(setup_request_mock):
     assert response == return_value['similartags']['tag']
 
 
+# #########################################################################
+# # BUILD TAG INDEX
+# #########################################################################
+
+
+def test_build_tag_index(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_refresh = mocker.patch.object(TagIndex, 'refresh')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.build_tag_index(['rock'], max_age=3600)
+    ##
+    mock_refresh.assert_called_with(
+        client.request_controller, ['rock'], 100, 3600, 4
+    )
+    assert isinstance(response, TagIndex)
+
+
+def test_build_tag_index_refresh(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_refresh = mocker.patch.object(TagIndex, 'refresh')
+    client = LastFM('user_agent_test', 'api_key_test')
+    index = TagIndex()
+    ##
+    response = client.build_tag_index(['rock'], index=index, workers=2)
+    ##
+    mock_refresh.assert_called_with(
+        client.request_controller, ['rock'], 100, None, 2
+    )
+    assert response is index
+
+
+# #########################################################################
+# # BUILD TAG COOCCURRENCE
+# #########################################################################
+
+
+def test_build_tag_cooccurrence(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_refresh = mocker.patch.object(TagCooccurrence, 'refresh')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.build_tag_cooccurrence(
+        ['Artist'], [('Artist', 'Track')], amount=5
+    )
+    ##
+    mock_refresh.assert_called_with(
+        client.request_controller, ['Artist'], [('Artist', 'Track')], 5, 4
+    )
+    assert isinstance(response, TagCooccurrence)
+
+
+def test_build_tag_cooccurrence_extend(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_refresh = mocker.patch.object(TagCooccurrence, 'refresh')
+    client = LastFM('user_agent_test', 'api_key_test')
+    cooccurrence = TagCooccurrence()
+    ##
+    response = client.build_tag_cooccurrence(
+        ['Artist'], cooccurrence=cooccurrence, workers=2
+    )
+    ##
+    mock_refresh.assert_called_with(
+        client.request_controller, ['Artist'], (), 10, 2
+    )
+    assert response is cooccurrence
+
+
 # #########################################################################
 # # GET TAG TOP ALBUMS
 # #########################################################################
@@ -88,6 +159,8 @@ def test_get_tag_top_albums(setup_paginated_mock):
         'albums',
         'album',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -109,6 +182,8 @@ def test_get_tag_top_albums_with_parameters(setup_paginated_mock):
         'albums',
         'album',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -134,6 +209,8 @@ def test_get_tag_top_artists(setup_paginated_mock):
         'topartists',
         'artist',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -155,6 +232,8 @@ def test_get_tag_top_artists_with_parameters(setup_paginated_mock):
         'topartists',
         'artist',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -180,6 +259,8 @@ def test_get_tag_top_tracks(setup_paginated_mock):
         'tracks',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -201,5 +282,7 @@ def test_get_tag_top_tracks_with_parameters(setup_paginated_mock):
         'tracks',
         'track',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
@@ -2,6 +2,7 @@ import pytest
 
 from pylastfmapi.client import LastFM
 from pylastfmapi.constants import (
+    SEARCH_INDEX_AMOUNT,
     TRACK_GETCORRECTION,
     TRACK_GETINFO,
     TRACK_GETSIMILAR,
@@ -9,7 +10,9 @@ from pylastfmapi.constants import (
     TRACK_GETTOPTAGS,
     TRACK_SEARCH,
 )
+from pylastfmapi.corrections import CorrectionIndex
 from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.search import SearchIndex
 
 #########################################################################
 # GET TRACK INFO
@@ -99,6 +102,32 @@ def test_get_track_info_with_parameters(setup_request_mock):
     assert response == return_value['track']
 
 
+#########################################################################
+# GET TRACK INFO MANY
+#########################################################################
+
+
+def test_get_track_info_many(setup_request_mock):
+    return_value = {'track': {'name': 'Track Name'}}
+    client, mock_request_controller = setup_request_mock(return_value)
+    ##
+    response = list(
+        client.get_track_info_many(
+            [('artistname', 'trackname')], fields=['name']
+        )
+    )
+    ##
+    mock_request_controller.request.assert_called_once_with({
+        'method': TRACK_GETINFO,
+        'track': 'trackname',
+        'artist': 'artistname',
+        'mbid': None,
+        'autocorrect': False,
+        'username': None,
+    })
+    assert response == [(('artistname', 'trackname'), {'name': 'Track Name'})]
+
+
 #########################################################################
 # GET TRACK TAGS
 #########################################################################
@@ -396,6 +425,8 @@ def test_search_track(setup_search_mock):
         'trackmatches',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -414,10 +445,32 @@ def test_search_track_with_parameters(setup_search_mock):
         'trackmatches',
         'track',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
 
+def test_search_track_with_index(setup_search_mock):
+    track = 'trackname'
+    artist = 'artistname'
+    return_value = [{'name': 'trackname', 'artist': 'artistname'}]
+    index = SearchIndex()
+    client, mock_request_controller = setup_search_mock(return_value)
+    ##
+    response = client.search_track(track=track, artist=artist, index=index)
+    ##
+    mock_request_controller.get_search_data.assert_called_once_with(
+        {'method': TRACK_SEARCH, 'track': track, 'artist': artist},
+        'trackmatches',
+        'track',
+        SEARCH_INDEX_AMOUNT,
+    )
+    assert response == return_value
+    assert client.search_track(track, artist, 1, index=index) == return_value
+    mock_request_controller.get_search_data.assert_called_once()
+
+
 # #########################################################################
 # # GET TRACK CORRECTION
 # #########################################################################
@@ -442,3 +495,37 @@ def test_get_track_correction(setup_request_mock):
         'artist': artist,
     })
     assert response == return_value['corrections']['correction']['track']
+
+
+# #########################################################################
+# # BUILD CORRECTION INDEX
+# #########################################################################
+
+
+def test_build_correction_index(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_refresh = mocker.patch.object(CorrectionIndex, 'refresh')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.build_correction_index(['Artist'], [('Artist', 'Track')])
+    ##
+    mock_refresh.assert_called_with(
+        client.request_controller, ['Artist'], [('Artist', 'Track')], 4
+    )
+    assert isinstance(response, CorrectionIndex)
+
+
+def test_build_correction_index_extend(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_refresh = mocker.patch.object(CorrectionIndex, 'refresh')
+    client = LastFM('user_agent_test', 'api_key_test')
+    index = CorrectionIndex()
+    ##
+    response = client.build_correction_index(
+        tracks=[('Artist', 'Track')], index=index, workers=2
+    )
+    ##
+    mock_refresh.assert_called_with(
+        client.request_controller, (), [('Artist', 'Track')], 2
+    )
+    assert response is index
@@ -2,6 +2,7 @@ from datetime import datetime
 
 import pytest
 
+from pylastfmapi.charts import WEEK
 from pylastfmapi.client import LastFM
 from pylastfmapi.constants import (
     LIBRARY_GETARTISTS,
@@ -20,6 +21,11 @@ from pylastfmapi.constants import (
     USER_GETWEEKLYTRACKCHART,
 )
 from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.models import Artist, User
+from pylastfmapi.sink import JSONLinesSink
+from pylastfmapi.store import MemoryScrobbleStore
+from pylastfmapi.taste import TasteMatrix
+from pylastfmapi.utils import unique_scrobbles
 
 # #########################################################################
 # # GET USER FRIENDS
@@ -43,6 +49,8 @@ def test_get_user_friends(setup_paginated_mock):
         'friends',
         'user',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -68,6 +76,8 @@ def test_get_user_friends_with_parameters(setup_paginated_mock):
         'friends',
         'user',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -92,6 +102,52 @@ def test_get_user_info(setup_request_mock):
     assert response == return_value['user']
 
 
+def test_get_user_friends_with_fields(setup_paginated_mock):
+    user = 'username'
+    fields = ['name']
+    return_value = [{'name': 'friend Name'}]
+
+    client, mock_request_controller = setup_paginated_mock(return_value)
+    ##
+    _ = client.get_user_friends(user=user, fields=fields)
+    ##
+    mock_request_controller.get_paginated_data.assert_called_with(
+        {
+            'method': USER_GETFRIENDS,
+            'user': user,
+            'recenttracks': False,
+        },
+        'friends',
+        'user',
+        None,
+        fields=fields,
+        model=None,
+    )
+
+
+def test_get_user_friends_typed(setup_paginated_mock):
+    user = 'username'
+    return_value = [User(name='friend Name')]
+
+    client, mock_request_controller = setup_paginated_mock(return_value)
+    ##
+    response = client.get_user_friends(user=user, typed=True)
+    ##
+    mock_request_controller.get_paginated_data.assert_called_with(
+        {
+            'method': USER_GETFRIENDS,
+            'user': user,
+            'recenttracks': False,
+        },
+        'friends',
+        'user',
+        None,
+        fields=None,
+        model=User,
+    )
+    assert response == return_value
+
+
 # #########################################################################
 # # GET USER LOVED TRACKS
 # #########################################################################
@@ -113,6 +169,10 @@ def test_get_user_loved_tracks(setup_paginated_mock):
         'lovedtracks',
         'track',
         None,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
     )
     assert response == return_value
 
@@ -134,6 +194,10 @@ def test_get_user_loved_tracks_with_parameters(setup_paginated_mock):
         'lovedtracks',
         'track',
         amount,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
     )
     assert response == return_value
 
@@ -152,7 +216,14 @@ def test_get_user_library_artists(setup_paginated_mock):
     response = client.get_user_library_artists(user=user)
     ##
     mock_request_controller.get_paginated_data.assert_called_with(
-        {'method': LIBRARY_GETARTISTS, 'user': user}, 'artists', 'artist', None
+        {'method': LIBRARY_GETARTISTS, 'user': user},
+        'artists',
+        'artist',
+        None,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
     )
     assert response == return_value
 
@@ -171,6 +242,10 @@ def test_get_user_library_artists_with_parameters(setup_paginated_mock):
         'artists',
         'artist',
         amount,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
     )
     assert response == return_value
 
@@ -202,6 +277,8 @@ def test_get_user_personal_tags_type_artist(setup_paginated_mock):
         'artists',
         'artist',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -231,6 +308,8 @@ def test_get_user_personal_tags_type_artist_with_parameters(
         'artists',
         'artist',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -257,6 +336,8 @@ def test_get_user_personal_tags_type_album(setup_paginated_mock):
         'albums',
         'album',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -286,6 +367,8 @@ def test_get_user_personal_tags_type_album_with_parameters(
         'albums',
         'album',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -312,6 +395,8 @@ def test_get_user_personal_tags_type_track(setup_paginated_mock):
         'tracks',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -341,6 +426,8 @@ def test_get_user_personal_tags_type_track_with_parameters(
         'tracks',
         'track',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -367,6 +454,8 @@ def test_get_user_top_albums(setup_paginated_mock):
         'topalbums',
         'album',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -392,6 +481,8 @@ def test_get_user_top_albums_with_parameters(setup_paginated_mock):
         'topalbums',
         'album',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -418,6 +509,8 @@ def test_get_user_top_artists(setup_paginated_mock):
         'topartists',
         'artist',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -443,6 +536,8 @@ def test_get_user_top_artists_with_parameters(setup_paginated_mock):
         'topartists',
         'artist',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -469,6 +564,8 @@ def test_get_user_top_tracks(setup_paginated_mock):
         'toptracks',
         'track',
         None,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
@@ -494,10 +591,97 @@ def test_get_user_top_tracks_with_parameters(setup_paginated_mock):
         'toptracks',
         'track',
         amount,
+        fields=None,
+        model=None,
     )
     assert response == return_value
 
 
+# #########################################################################
+# # GET USERS TOP CHARTS
+# #########################################################################
+
+
+def test_get_users_top_charts(setup_paginated_mock):
+    return_value = [{'name': 'Artist Name'}]
+    client, mock_request_controller = setup_paginated_mock(return_value)
+    ##
+    response = dict(
+        client.get_users_top_charts(
+            ['user1', 'user2', 'user1'], period='7day', amount=10, workers=2
+        )
+    )
+    ##
+    assert set(response) == {
+        (user, chart)
+        for user in ('user1', 'user2')
+        for chart in ('artists', 'albums', 'tracks')
+    }
+    assert mock_request_controller.get_paginated_data.call_count == 6  # noqa: PLR2004
+    mock_request_controller.get_paginated_data.assert_any_call(
+        {
+            'method': USER_GETTOPALBUMS,
+            'user': 'user2',
+            'period': '7day',
+        },
+        'topalbums',
+        'album',
+        10,
+        fields=None,
+        model=None,
+    )
+
+
+def test_get_users_top_charts_with_sink(
+    mocker, setup_paginated_mock, tmp_path
+):
+    client, mock_request_controller = setup_paginated_mock([])
+    error = LastFMException('User not found')
+
+    def _get_paginated_data(payload, *args, **kwargs):
+        if payload['user'] == 'user2':
+            raise error
+        return [{'name': payload['user']}]
+
+    mock_request_controller.get_paginated_data.side_effect = (
+        _get_paginated_data
+    )
+    sink = JSONLinesSink(tmp_path / 'charts.jsonl')
+    sink.write('user1', 'overall', 'artists', [])
+    ##
+    response = dict(
+        client.get_users_top_charts(
+            ['user1', 'user2'], charts=['artists', 'tracks'], sink=sink
+        )
+    )
+    ##
+    assert response == {
+        ('user1', 'tracks'): [{'name': 'user1'}],
+        ('user2', 'artists'): error,
+        ('user2', 'tracks'): error,
+    }
+    assert ('user1', 'overall', 'tracks') in sink
+    assert ('user2', 'overall', 'tracks') not in sink
+
+
+# #########################################################################
+# # GET USERS TASTE MATRIX
+# #########################################################################
+
+
+def test_get_users_taste_matrix(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_fetch = mocker.patch.object(TasteMatrix, 'fetch')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_users_taste_matrix(['user1', 'user2'], '7day', 50)
+    ##
+    mock_fetch.assert_called_with(
+        client.request_controller, ['user1', 'user2'], '7day', 50, 4
+    )
+    assert response == mock_fetch.return_value
+
+
 # #########################################################################
 # # GET USER TOP TAGS
 # #########################################################################
@@ -792,6 +976,67 @@ def test_get_user_recent_tracks(setup_paginated_mock):
         'recenttracks',
         'track',
         None,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
+        item_filter=None,
+    )
+    assert response == return_value
+
+
+def test_get_user_recent_tracks_with_intern(setup_paginated_mock):
+    user = 'username'
+    return_value = [{'name': 'Track Name'}, {'name': 'Track Name'}]
+
+    client, mock_request_controller = setup_paginated_mock(return_value)
+    ##
+    response = client.get_user_recent_tracks(user=user, intern=True)
+    ##
+    mock_request_controller.get_paginated_data.assert_called_with(
+        {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': None,
+            'to': None,
+            'extended': False,
+        },
+        'recenttracks',
+        'track',
+        None,
+        fields=None,
+        model=None,
+        intern=True,
+        checkpoint=None,
+        item_filter=None,
+    )
+    assert response == return_value
+
+
+def test_get_user_recent_tracks_with_snapshot(mocker, setup_paginated_mock):
+    user = 'username'
+    return_value = [{'name': 'Track Name'}]
+    mocker.patch('time.time', return_value=1700000000.5)
+    client, mock_request_controller = setup_paginated_mock(return_value)
+    ##
+    response = client.get_user_recent_tracks(user=user, snapshot=True)
+    ##
+    mock_request_controller.get_paginated_data.assert_called_with(
+        {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': None,
+            'to': 1700000000,
+            'extended': False,
+        },
+        'recenttracks',
+        'track',
+        None,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
+        item_filter=unique_scrobbles,
     )
     assert response == return_value
 
@@ -832,5 +1077,284 @@ def test_get_user_recent_tracks_with_parameters(mocker, setup_paginated_mock):
         'recenttracks',
         'track',
         amount,
+        fields=None,
+        model=None,
+        intern=False,
+        checkpoint=None,
+        item_filter=None,
     )
     assert response == return_value
+
+
+def test_get_user_recent_tracks_columns(mocker):
+    user = 'username'
+    MockRequestController = mocker.patch(
+        'pylastfmapi.client.RequestController', autospec=True
+    )
+    mock_request_controller = MockRequestController.return_value
+    mock_request_controller.iter_paginated_data.return_value = iter([
+        {
+            'name': 'Track Name',
+            'artist': {'#text': 'Artist Name'},
+            'album': {'#text': 'Album Name'},
+            '@attr': {'nowplaying': 'true'},
+        },
+        {
+            'name': 'Track Name',
+            'artist': {'#text': 'Artist Name'},
+            'album': {'#text': 'Album Name'},
+            'date': {'uts': '1700000000'},
+        },
+    ])
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_user_recent_tracks_columns(user=user, amount=10)
+    ##
+    mock_request_controller.iter_paginated_data.assert_called_with(
+        {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': None,
+            'to': None,
+        },
+        'recenttracks',
+        'track',
+        10,
+    )
+    assert list(response.timestamps) == [1700000000]
+    assert response.artists.values == ['Artist Name']
+    assert response.albums.values == ['Album Name']
+    assert response.tracks.values == ['Track Name']
+
+
+#########################################################################
+# BACKFILL USER RECENT TRACKS
+#########################################################################
+
+
+def test_backfill_user_recent_tracks(mocker):
+    user = 'username'
+    date_from = '2023-04-10'
+    date_to = '2023-04-12'
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    MockBackfill = mocker.patch('pylastfmapi.client.Backfill', autospec=True)
+    MockBackfill.return_value.__iter__.return_value = iter([
+        {'name': 'Track Name'}
+    ])
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.backfill_user_recent_tracks(
+        user=user, date_from=date_from, date_to=date_to, workers=2
+    )
+    ##
+    MockBackfill.assert_called_with(
+        client.request_controller,
+        user,
+        int(datetime.strptime(date_from, '%Y-%m-%d').timestamp()),
+        int(datetime.strptime(date_to, '%Y-%m-%d').timestamp()),
+        2,
+        None,
+    )
+    assert list(response) == [{'name': 'Track Name'}]
+
+
+#########################################################################
+# SYNC USER RECENT TRACKS
+#########################################################################
+
+
+def _scrobble(name, uts):
+    return {
+        'name': name,
+        'artist': {'#text': 'Artist Name'},
+        'date': {'uts': str(uts)},
+    }
+
+
+def test_sync_user_recent_tracks(mocker):
+    user = 'username'
+    store = MemoryScrobbleStore()
+    MockRequestController = mocker.patch(
+        'pylastfmapi.client.RequestController', autospec=True
+    )
+    mock_request_controller = MockRequestController.return_value
+    mock_request_controller.iter_paginated_data.return_value = iter([
+        {'name': 'Now Playing', '@attr': {'nowplaying': 'true'}},
+        _scrobble('Track 2', 1700000200),
+        _scrobble('Track 1', 1700000100),
+    ])
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.sync_user_recent_tracks(user=user, store=store)
+    ##
+    mock_request_controller.iter_paginated_data.assert_called_with(
+        {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': None,
+            'extended': False,
+        },
+        'recenttracks',
+        'track',
+        None,
+    )
+    assert response == 2  # noqa: PLR2004
+    assert store.last_timestamp(user) == 1700000200  # noqa: PLR2004
+
+
+def test_sync_user_recent_tracks_from_last_timestamp(mocker):
+    user = 'username'
+    store = MemoryScrobbleStore()
+    store.add(user, [_scrobble('Track 1', 1700000100)])
+    MockRequestController = mocker.patch(
+        'pylastfmapi.client.RequestController', autospec=True
+    )
+    mock_request_controller = MockRequestController.return_value
+    mock_request_controller.iter_paginated_data.return_value = iter([
+        _scrobble('Track 2', 1700000200),
+        _scrobble('Track 1', 1700000100),
+    ])
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.sync_user_recent_tracks(user=user, store=store)
+    ##
+    mock_request_controller.iter_paginated_data.assert_called_with(
+        {
+            'method': USER_GETRECENTTRACKS,
+            'user': user,
+            'from': 1700000100,
+            'extended': False,
+        },
+        'recenttracks',
+        'track',
+        None,
+    )
+    assert response == 1
+    assert [item['name'] for item in store.get(user)] == ['Track 2', 'Track 1']
+
+
+def test_get_user_local_top_chart():
+    user = 'username'
+    store = MemoryScrobbleStore()
+    store.add(
+        user,
+        [
+            _scrobble('Track 3', 1700086400),
+            _scrobble('Track 2', 1700000200),
+            _scrobble('Track 1', 1700000100),
+            _scrobble('Track 1', 1699999999),
+        ],
+    )
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_user_local_top_chart(
+        user,
+        store,
+        'tracks',
+        datetime.fromtimestamp(1700000100).strftime('%Y-%m-%d %H:%M'),
+        datetime.fromtimestamp(1700086400).strftime('%Y-%m-%d %H:%M'),
+        fields=['name', 'playcount'],
+    )
+    ##
+    assert response == [
+        {'name': 'Track 1', 'playcount': '1'},
+        {'name': 'Track 2', 'playcount': '1'},
+    ]
+
+
+def test_get_user_local_top_chart_typed():
+    user = 'username'
+    store = MemoryScrobbleStore()
+    store.add(user, [_scrobble('Track 1', 1700000100)])
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_user_local_top_chart(user, store, typed=True)
+    ##
+    assert response == [Artist(name='Artist Name', playcount=1, rank=1)]
+
+
+def test_get_user_local_top_chart_with_invalid_dates():
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    with pytest.raises(LastFMException):
+        client.get_user_local_top_chart(
+            'username', MemoryScrobbleStore(), date_from='2024-01-01'
+        )
+
+
+#########################################################################
+# CRAWL USER FRIENDS
+#########################################################################
+
+
+def test_crawl_user_friends(mocker):
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    MockCrawler = mocker.patch(
+        'pylastfmapi.client.FriendsCrawler', autospec=True
+    )
+    MockCrawler.return_value.__iter__.return_value = iter([
+        ('username', 0, [{'name': 'friend'}])
+    ])
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.crawl_user_friends(
+        ['username'], 'edges.tsv', max_depth=1, workers=2
+    )
+    ##
+    MockCrawler.assert_called_with(
+        client.request_controller,
+        ['username'],
+        'edges.tsv',
+        1,
+        10_000,
+        2,
+        None,
+        None,
+    )
+    assert list(response) == [('username', 0, [{'name': 'friend'}])]
+
+
+#########################################################################
+# GET USER WEEKLY CHART HISTORY
+#########################################################################
+
+
+def test_get_user_weekly_chart_history(mocker):
+    date_from = '2023-04-10'
+    date_to = '2023-04-24'
+    mocker.patch('pylastfmapi.client.RequestController', autospec=True)
+    mock_fetch = mocker.patch('pylastfmapi.client.ChartHistory.fetch')
+    client = LastFM('user_agent_test', 'api_key_test')
+    ##
+    response = client.get_user_weekly_chart_history(
+        'username', date_from, date_to, 'albums', amount=10
+    )
+    ##
+    timestamp_from = int(datetime.strptime(date_from, '%Y-%m-%d').timestamp())
+    mock_fetch.assert_called_with(
+        client.request_controller,
+        'username',
+        [
+            (timestamp_from, timestamp_from + WEEK - 1),
+            (timestamp_from + WEEK, timestamp_from + 2 * WEEK - 1),
+        ],
+        'albums',
+        10,
+        4,
+    )
+    assert response == mock_fetch.return_value
+
+
+@pytest.mark.parametrize(
+    ('date_from', 'date_to', 'amount'),
+    [(None, None, None), ('2023-04-10', '2023-04-24', MAX_WEEKLY_CHART + 1)],
+)
+def test_get_user_weekly_chart_history_with_wrong_parameters(
+    setup_request_mock, date_from, date_to, amount
+):
+    client, _ = setup_request_mock({})
+    ##
+    with pytest.raises(LastFMException):
+        client.get_user_weekly_chart_history(
+            'username', date_from, date_to, amount=amount
+        )
@@ -0,0 +1,127 @@
+import pytest
+
+from pylastfmapi.backfill import Backfill, split_window
+from pylastfmapi.checkpoint import FileCheckpoint
+from pylastfmapi.request import RequestController
+
+HISTORY = [
+    {
+        'name': f'Track {uts}',
+        'artist': {'#text': 'Artist Name'},
+        'date': {'uts': str(uts)},
+    }
+    for uts in range(1000, 0, -10)
+]
+
+
+@pytest.fixture
+def mock_history(mocker):
+    """Serves `user.getRecentTracks` pages of `HISTORY` by `from` and `to`."""
+
+    def _request(payload):
+        items = [
+            item
+            for item in HISTORY
+            if payload['from'] <= int(item['date']['uts']) <= payload['to']
+        ]
+        start = (payload['page'] - 1) * payload['limit']
+        response = mocker.Mock()
+        response.from_cache = True
+        response.json.return_value = {
+            'recenttracks': {
+                'track': [
+                    {'name': 'Now Playing', '@attr': {'nowplaying': 'true'}},
+                    *items[start : start + payload['limit']],
+                ],
+                '@attr': {
+                    'total': str(len(items)),
+                    'totalPages': str(-(-len(items) // payload['limit'])),
+                },
+            }
+        }
+        return response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+    mocker.patch('pylastfmapi.backfill.LIMIT', 5)
+    return mock_request
+
+
+#########################################################################
+# split_window
+#########################################################################
+
+
+def test_split_window():
+    ##
+    response = split_window((0, 100), 4)
+    ##
+    assert response == [(0, 25), (25, 50), (50, 75), (75, 100)]
+
+
+def test_split_window_shorter_than_count():
+    ##
+    response = split_window((0, 2), 4)
+    ##
+    assert response == [(0, 1), (1, 2)]
+
+
+#########################################################################
+# Backfill
+#########################################################################
+
+
+def test_backfill(mock_history):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    backfill = Backfill(controller, 'user', 0, 1000, window_pages=2)
+    ##
+    response = list(backfill)
+    ##
+    assert [item['date']['uts'] for item in response] == [
+        str(uts) for uts in range(10, 1001, 10)
+    ]
+    assert len(backfill.plan()) == 10  # noqa: PLR2004
+
+
+def test_backfill_splits_dense_windows(mock_history):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    backfill = Backfill(controller, 'user', 0, 1000, window_pages=2)
+    backfill.plan = lambda: [(0, 500), (500, 1000)]
+    ##
+    response = list(backfill)
+    ##
+    assert len(response) == len(HISTORY)
+    assert backfill.fetch_window((0, 500)) == {
+        'split': split_window((0, 500), 5)
+    }
+
+
+def test_backfill_from_registration(mocker):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    mock_info = mocker.Mock()
+    mock_info.json.return_value = {'user': {'registered': {'unixtime': '500'}}}
+    mock_page = mocker.Mock()
+    mock_page.json.return_value = {
+        'recenttracks': {'track': [], '@attr': {'total': '0'}}
+    }
+    mocker.patch.object(
+        RequestController, 'request', side_effect=[mock_info, mock_page]
+    )
+    backfill = Backfill(controller, 'user', timestamp_to=1000)
+    ##
+    response = backfill.plan()
+    ##
+    assert response == [(500, 1000)]
+
+
+def test_backfill_with_checkpoint(tmp_path, mock_history):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    checkpoint = FileCheckpoint(tmp_path / 'checkpoint.jsonl')
+    expected = list(Backfill(controller, 'user', 0, 1000, 2, checkpoint))
+    mock_history.reset_mock()
+    ##
+    response = list(Backfill(controller, 'user', 0, 1000, 2, checkpoint))
+    ##
+    assert response == expected
+    mock_history.assert_not_called()
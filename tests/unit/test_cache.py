@@ -0,0 +1,147 @@
+import pytest
+
+from pylastfmapi.cache import SearchCache
+from pylastfmapi.constants import ARTIST_SEARCH, TRACK_SEARCH
+
+ARTISTS = [
+    {'name': 'Radiohead', 'listeners': '5000000'},
+    {'name': 'Radio Moscow', 'listeners': '10000'},
+    {'name': 'Ra Ra Riot', 'listeners': '300000'},
+    {'name': 'Dead Radio', 'listeners': '100'},
+]
+
+
+def _payload(query, method=ARTIST_SEARCH, **params):
+    return {'method': method, 'artist': query, **params}
+
+
+@pytest.fixture
+def mock_clock(mocker):
+    """Sets the clock of the cache, in seconds."""
+    return mocker.patch('pylastfmapi.cache.time.monotonic', return_value=0)
+
+
+@pytest.fixture
+def cache(mock_clock):
+    cache = SearchCache(ttl=60, size=10)
+    cache.set(_payload('Ra'), 'artist', ARTISTS, complete=True)
+    return cache
+
+
+#########################################################################
+# SearchCache
+#########################################################################
+
+
+def test_search_cache_get(cache):
+    ##
+    response = cache.get(_payload('ra'), 'artist', None)
+    ##
+    assert response == ARTISTS
+    assert response is not ARTISTS
+    assert cache.get(_payload(' RA!'), 'artist', 2) == ARTISTS[:2]
+
+
+def test_search_cache_get_longer_prefix(cache):
+    ##
+    response = cache.get(_payload('Radio'), 'artist', None)
+    ##
+    assert response == [ARTISTS[0], ARTISTS[1], ARTISTS[3]]
+    assert cache.get(_payload('radio m'), 'artist', None) == [ARTISTS[1]]
+    assert cache.get(_payload('radiohead!'), 'artist', 1) == [ARTISTS[0]]
+    assert cache.get(_payload('zz'), 'artist', None) is None
+    assert len(cache) == 1
+
+
+def test_search_cache_get_incomplete(cache):
+    cache.set(_payload('Dead'), 'artist', ARTISTS[3:], complete=False)
+    ##
+    response = cache.get(_payload('dead'), 'artist', 1)
+    ##
+    assert response == ARTISTS[3:]
+    assert cache.get(_payload('dead'), 'artist', 2) is None
+    assert cache.get(_payload('dead'), 'artist', None) is None
+    assert cache.get(_payload('dead r'), 'artist', None) is None
+
+
+def test_search_cache_get_other_parameters(cache):
+    cache.set(
+        {'method': TRACK_SEARCH, 'track': 'Creep', 'artist': 'Radiohead'},
+        'track',
+        [{'name': 'Creep', 'artist': 'Radiohead'}],
+        complete=True,
+    )
+    ##
+    response = cache.get(
+        {'method': TRACK_SEARCH, 'track': 'creep', 'artist': 'TLC'},
+        'track',
+        None,
+    )
+    ##
+    assert response is None
+    assert (
+        cache.get(
+            {'method': TRACK_SEARCH, 'track': 'Cre', 'artist': 'Radiohead'},
+            'track',
+            None,
+        )
+        is None
+    )
+    assert (
+        cache.get(
+            {
+                'method': TRACK_SEARCH,
+                'track': 'Creep Live',
+                'artist': 'Radiohead',
+            },
+            'track',
+            None,
+        )
+        == []
+    )
+    assert cache.get(
+        {'method': TRACK_SEARCH, 'track': 'Creep', 'artist': 'Radiohead'},
+        'track',
+        None,
+    ) == [{'name': 'Creep', 'artist': 'Radiohead'}]
+    assert cache.get(_payload('ra', method=TRACK_SEARCH), 'artist', 1) is None
+
+
+def test_search_cache_ttl(mock_clock, cache):
+    mock_clock.return_value = 60
+    ##
+    response = cache.get(_payload('ra'), 'artist', None)
+    ##
+    assert response is None
+    assert len(cache) == 0
+
+
+def test_search_cache_size(cache):
+    riot = [{'name': f'Ra Ra Riot {index}'} for index in range(6)]
+    cache.get(_payload('ra'), 'artist', None)
+    cache.set(_payload('Dead'), 'artist', ARTISTS[3:], complete=True)
+    cache.set(_payload('Moscow'), 'artist', ARTISTS[1:2], complete=True)
+    cache.get(_payload('ra'), 'artist', None)
+    ##
+    cache.set(_payload('Riot'), 'artist', riot, complete=True)
+    ##
+    assert cache.get(_payload('dead'), 'artist', None) is None
+    assert cache.get(_payload('moscow'), 'artist', None) is None
+    assert cache.get(_payload('ra'), 'artist', None) == ARTISTS
+    assert cache.get(_payload('riot'), 'artist', None) == riot
+
+
+def test_search_cache_too_many_items(cache):
+    ##
+    cache.set(_payload('R'), 'artist', ARTISTS * 3, complete=True)
+    ##
+    assert cache.get(_payload('r'), 'artist', None) is None
+    assert cache.get(_payload('ra'), 'artist', None) == ARTISTS
+
+
+def test_search_cache_clear(cache):
+    ##
+    cache.clear()
+    ##
+    assert len(cache) == 0
+    assert cache.get(_payload('ra'), 'artist', None) is None
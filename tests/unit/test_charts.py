@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from pylastfmapi.charts import WEEK, ChartHistory, week_windows
+from pylastfmapi.constants import USER_GETWEEKLYTRACKCHART
+from pylastfmapi.exceptions import RequestErrorException
+from pylastfmapi.request import RequestController
+
+
+@pytest.fixture
+def history():
+    history = ChartHistory([(0, WEEK - 1), (WEEK, 2 * WEEK - 1)])
+    history.add(1, [{'name': 'A', 'playcount': '3'}])
+    history.add(
+        0, [{'name': 'B', 'playcount': '2'}, {'name': 'A', 'playcount': '1'}]
+    )
+    return history
+
+
+#########################################################################
+# week_windows
+#########################################################################
+
+
+def test_week_windows():
+    ##
+    response = week_windows(100, 100 + 2 * WEEK + 10)
+    ##
+    assert response == [
+        (100, 100 + WEEK - 1),
+        (100 + WEEK, 100 + 2 * WEEK - 1),
+        (100 + 2 * WEEK, 100 + 2 * WEEK + 10),
+    ]
+
+
+#########################################################################
+# ChartHistory
+#########################################################################
+
+
+def test_chart_history_get(history):
+    ##
+    response = history.get(0)
+    ##
+    assert response == [
+        {'name': 'B', 'playcount': 2},
+        {'name': 'A', 'playcount': 1},
+    ]
+    assert len(history) == 3  # noqa: PLR2004
+
+
+def test_chart_history_to_numpy(history):
+    ##
+    response = history.to_numpy()
+    ##
+    np.testing.assert_array_equal(response['matrix'], [[1, 2], [3, 0]])
+    assert response['matrix'].dtype == np.int32
+    assert response['weeks'].tolist() == [[0, WEEK - 1], [WEEK, 2 * WEEK - 1]]
+    assert response['entities'].tolist() == ['A', 'B']
+
+
+def test_chart_history_fetch(mocker):
+    def _request(payload):
+        if payload['from'] == WEEK:
+            raise RequestErrorException('Something wrong, error 8')
+        response = mocker.Mock()
+        response.json.return_value = {
+            'weeklytrackchart': {
+                'track': {
+                    'name': 'Track',
+                    'artist': {'#text': 'Artist'},
+                    'playcount': '5',
+                }
+            }
+        }
+        return response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    windows = week_windows(0, 3 * WEEK)
+    ##
+    history = ChartHistory.fetch(
+        controller, 'username', windows, 'tracks', workers=2
+    )
+    ##
+    mock_request.assert_any_call({
+        'method': USER_GETWEEKLYTRACKCHART,
+        'user': 'username',
+        'limit': None,
+        'from': 0,
+        'to': WEEK - 1,
+    })
+    assert history.failed == [windows[1]]
+    assert history.get(2) == [
+        {'name': 'Track', 'artist': 'Artist', 'playcount': 5}
+    ]
+    assert history.get(1) == []
@@ -0,0 +1,97 @@
+import pytest
+
+from pylastfmapi.checkpoint import (
+    FileCheckpoint,
+    SQLiteCheckpoint,
+    checkpoint_key,
+    iter_json_lines,
+)
+
+#########################################################################
+# FileCheckpoint and SQLiteCheckpoint
+#########################################################################
+
+
+@pytest.mark.parametrize(
+    'checkpoint_class', [FileCheckpoint, SQLiteCheckpoint]
+)
+def test_checkpoint(tmp_path, checkpoint_class):
+    checkpoint = checkpoint_class(tmp_path / 'checkpoint')
+    ##
+    checkpoint.set('key1', {'items': [1, 2]})
+    checkpoint.set('key2', [1, 2])
+    checkpoint.set('key1', {'items': [3]})
+    ##
+    assert checkpoint.get('key1') == {'items': [3]}
+    assert checkpoint.get('key2') == [1, 2]
+    assert checkpoint.get('key3') is None
+    assert checkpoint.get('key3', 'default') == 'default'
+    assert 'key2' in checkpoint
+    assert len(checkpoint) == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    'checkpoint_class', [FileCheckpoint, SQLiteCheckpoint]
+)
+def test_checkpoint_reload(tmp_path, checkpoint_class):
+    checkpoint_class(tmp_path / 'checkpoint').set('key', 'value')
+    ##
+    checkpoint = checkpoint_class(tmp_path / 'checkpoint')
+    ##
+    assert checkpoint.get('key') == 'value'
+
+
+def test_file_checkpoint_with_incomplete_line(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    FileCheckpoint(path).set('key1', 'value')
+    with path.open('a') as file:
+        file.write('{"key": "key2", "val')
+    ##
+    checkpoint = FileCheckpoint(path)
+    checkpoint.set('key3', 'value')
+    ##
+    assert 'key2' not in checkpoint
+    assert FileCheckpoint(path).get('key3') == 'value'
+
+
+#########################################################################
+# iter_json_lines
+#########################################################################
+
+
+def test_iter_json_lines(tmp_path):
+    path = tmp_path / 'lines.jsonl'
+    path.write_text('{"a": 1}\n[2]\n{"a": ', encoding='utf-8')
+    ##
+    response = list(iter_json_lines(path))
+    ##
+    assert response == [(0, {'a': 1}), (9, [2])]
+    assert path.read_text(encoding='utf-8') == '{"a": 1}\n[2]\n'
+    assert list(iter_json_lines(tmp_path / 'new.jsonl')) == []
+    assert (tmp_path / 'new.jsonl').exists()
+
+
+#########################################################################
+# checkpoint_key
+#########################################################################
+
+
+def test_checkpoint_key():
+    ##
+    response = checkpoint_key({
+        'user': 'username',
+        'method': 'user.getRecentTracks',
+        'from': None,
+        'page': 2,
+    })
+    ##
+    assert response == checkpoint_key({
+        'method': 'user.getRecentTracks',
+        'page': 2,
+        'user': 'username',
+    })
+    assert response != checkpoint_key({
+        'method': 'user.getRecentTracks',
+        'page': 3,
+        'user': 'username',
+    })
@@ -0,0 +1,191 @@
+import pytest
+
+from pylastfmapi.columnar import ScrobbleColumns, StringDictionary
+from pylastfmapi.exceptions import LastFMException
+
+
+@pytest.fixture
+def columns():
+    columns = ScrobbleColumns()
+    columns.extend([
+        {
+            'name': 'Track 1',
+            'artist': {'#text': 'Artist 1'},
+            'album': {'#text': 'Album 1'},
+            'date': {'uts': '1700000300'},
+        },
+        {
+            'name': 'Track 2',
+            'artist': {'name': 'Artist 2', 'url': 'url'},
+            'album': {'#text': 'Album 2'},
+            'date': {'uts': '1700000200'},
+        },
+        {
+            'name': 'Track 1',
+            'artist': {'#text': 'Artist 1'},
+            'album': {'#text': 'Album 1'},
+            'date': {'uts': '1700000100'},
+        },
+    ])
+    return columns
+
+
+#########################################################################
+# StringDictionary
+#########################################################################
+
+
+def test_string_dictionary_encode():
+    dictionary = StringDictionary()
+    ##
+    ids = [dictionary.encode(value) for value in ['a', 'b', 'a', 'c']]
+    ##
+    assert ids == [0, 1, 0, 2]
+    assert dictionary.values == ['a', 'b', 'c']
+    assert len(dictionary) == 3  # noqa: PLR2004
+
+
+def test_string_dictionary_get_and_decode():
+    dictionary = StringDictionary(['a', 'b'])
+    ##
+    assert dictionary.get('b') == 1
+    assert dictionary.get('c') is None
+    assert 'c' not in dictionary
+    assert dictionary.decode(0) == 'a'
+
+
+#########################################################################
+# ScrobbleColumns
+#########################################################################
+
+
+def test_scrobble_columns_extend(columns):
+    ##
+    assert len(columns) == 3  # noqa: PLR2004
+    assert list(columns.timestamps) == [1700000300, 1700000200, 1700000100]
+    assert list(columns.artist_ids) == [0, 1, 0]
+    assert list(columns.album_ids) == [0, 1, 0]
+    assert list(columns.track_ids) == [0, 1, 0]
+    assert columns.artists.values == ['Artist 1', 'Artist 2']
+
+
+def test_scrobble_columns_skips_now_playing():
+    columns = ScrobbleColumns()
+    item = {
+        'name': 'Track 1',
+        'artist': {'#text': 'Artist 1'},
+        'album': {'#text': 'Album 1'},
+        '@attr': {'nowplaying': 'true'},
+    }
+    ##
+    response = columns.append(item)
+    ##
+    assert response is False
+    assert len(columns) == 0
+
+
+def test_scrobble_columns_to_numpy(columns):
+    np = pytest.importorskip('numpy')
+    ##
+    response = columns.to_numpy()
+    ##
+    assert response['timestamp'].dtype == np.int64
+    assert response['artist_id'].dtype == np.int32
+    assert response['artists'][response['artist_id']].tolist() == [
+        'Artist 1',
+        'Artist 2',
+        'Artist 1',
+    ]
+
+
+def test_scrobble_columns_to_arrow(columns):
+    pa = pytest.importorskip('pyarrow')
+    ##
+    response = columns.to_arrow()
+    ##
+    assert response.column_names == ['timestamp', 'artist', 'album', 'track']
+    assert response.schema.field('timestamp').type == pa.int64()
+    assert response.column('timestamp').to_pylist() == [
+        1700000300,
+        1700000200,
+        1700000100,
+    ]
+    assert response.column('track').to_pylist() == [
+        'Track 1',
+        'Track 2',
+        'Track 1',
+    ]
+
+
+@pytest.mark.parametrize(
+    ('chart', 'expected'),
+    [
+        (
+            'artists',
+            [
+                {'name': 'Artist 1', 'playcount': '2', '@attr': {'rank': '1'}},
+                {'name': 'Artist 2', 'playcount': '1', '@attr': {'rank': '2'}},
+            ],
+        ),
+        (
+            'tracks',
+            [
+                {
+                    'name': 'Track 1',
+                    'artist': {'name': 'Artist 1'},
+                    'playcount': '2',
+                    '@attr': {'rank': '1'},
+                },
+                {
+                    'name': 'Track 2',
+                    'artist': {'name': 'Artist 2'},
+                    'playcount': '1',
+                    '@attr': {'rank': '2'},
+                },
+            ],
+        ),
+    ],
+)
+def test_scrobble_columns_top(columns, chart, expected):
+    ##
+    response = columns.top(chart)
+    ##
+    assert response == expected
+
+
+def test_scrobble_columns_top_in_range(columns):
+    columns.add(1700000400, 'Artist 2', '', 'Track 2')
+    columns.add(1700000500, 'Artist 2', 'Album 1', 'Track 3')
+    ##
+    response = columns.top('albums', 1700000200, 1700000500, amount=1)
+    ##
+    assert response == [
+        {
+            'name': 'Album 1',
+            'artist': {'name': 'Artist 1'},
+            'playcount': '1',
+            '@attr': {'rank': '1'},
+        }
+    ]
+    assert columns.top('albums', 1700000400) == [
+        {
+            'name': 'Album 1',
+            'artist': {'name': 'Artist 2'},
+            'playcount': '1',
+            '@attr': {'rank': '1'},
+        }
+    ]
+    assert not ScrobbleColumns().top('tracks')
+
+
+def test_scrobble_columns_without_optional_dependency(mocker, columns):
+    mocker.patch(
+        'pylastfmapi.utils.importlib.import_module',
+        side_effect=ImportError('No module named numpy'),
+    )
+    ##
+    with pytest.raises(
+        LastFMException,
+        match='The "numpy" package is required for this feature',
+    ):
+        _ = columns.to_numpy()
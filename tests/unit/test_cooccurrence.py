@@ -0,0 +1,185 @@
+import math
+
+import pytest
+
+from pylastfmapi.constants import ARTIST_GETTOPTAGS, TRACK_GETTOPTAGS
+from pylastfmapi.cooccurrence import TagCooccurrence
+from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.request import RequestController
+
+TAGS = {
+    'Artist A': {'Rock': 100, 'Indie': 50},
+    'Artist B': {'rock': 100, 'Pop': 100},
+    'Artist C': {'Pop': 100, 'Indie': 100},
+    'Artist D': {'Jazz': 100, 'seen live': 0},
+    'Artist A\tTrack': {'Indie': 100},
+}
+
+
+def _tags(key):
+    return [
+        {'name': name, 'count': count} for name, count in TAGS[key].items()
+    ]
+
+
+@pytest.fixture
+def cooccurrence():
+    cooccurrence = TagCooccurrence()
+    for key in ('Artist A', 'Artist B', 'Artist C', 'Artist D'):
+        cooccurrence.add(key, _tags(key))
+    return cooccurrence
+
+
+@pytest.fixture
+def mock_tags(mocker):
+    """Serves the top tags endpoints from `TAGS`."""
+
+    def _request(payload):
+        key = payload['artist']
+        if payload['method'] == TRACK_GETTOPTAGS:
+            key = f'{key}\t{payload["track"]}'
+        if key not in TAGS:
+            raise LastFMException('The artist you supplied could not be found')
+        response = mocker.Mock()
+        tags = _tags(key)
+        response.json.return_value = {
+            'toptags': {'tag': tags[0] if len(tags) == 1 else tags}
+        }
+        return response
+
+    return mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+
+
+#########################################################################
+# TagCooccurrence
+#########################################################################
+
+
+def test_tag_cooccurrence_add(cooccurrence):
+    ##
+    response = cooccurrence.add('Artist A', _tags('Artist A'))
+    ##
+    assert response is False
+    assert cooccurrence.tags.values == ['rock', 'indie', 'pop', 'jazz']
+    assert list(cooccurrence.weights) == [2, 1.5, 2, 1]
+    assert len(cooccurrence) == 4  # noqa: PLR2004
+    assert 'INDIE' in cooccurrence
+    assert 'seen live' not in cooccurrence
+
+
+def test_tag_cooccurrence_matrix(cooccurrence):
+    ##
+    indptr, indices, values = cooccurrence.matrix()
+    ##
+    assert indptr.tolist() == [0, 2, 4, 6, 6]
+    assert indices.tolist() == [1, 2, 0, 2, 0, 1]
+    assert values.tolist() == [0.5, 1, 0.5, 1, 1, 1]
+    assert cooccurrence.matrix() is cooccurrence.matrix()
+
+
+def test_tag_cooccurrence_count_and_pmi(cooccurrence):
+    ##
+    response = cooccurrence.count('Rock', 'indie')
+    ##
+    assert response == 0.5  # noqa: PLR2004
+    assert cooccurrence.count('rock', 'jazz') == 0
+    assert cooccurrence.count('rock', 'unknown') == 0
+    assert cooccurrence.pmi('rock', 'indie') == pytest.approx(
+        math.log(0.5 * 4 / (2 * 1.5))
+    )
+    assert cooccurrence.pmi('rock', 'jazz') is None
+
+
+def test_tag_cooccurrence_related(cooccurrence):
+    ##
+    response = cooccurrence.related('pop')
+    ##
+    assert [tag['name'] for tag in response] == ['indie', 'rock']
+    assert response[0] == {
+        'name': 'indie',
+        'count': 1,
+        'pmi': pytest.approx(math.log(4 / 3)),
+    }
+    assert cooccurrence.related('pop', min_count=1, amount=1) == response[:1]
+    assert cooccurrence.related('jazz') == []
+    assert cooccurrence.related('unknown') == []
+
+
+def test_tag_cooccurrence_related_by_count(cooccurrence):
+    cooccurrence.add('Artist E', [{'name': 'Rock', 'count': 100}])
+    cooccurrence.add(
+        'Artist F',
+        [
+            {'name': 'Rock', 'count': 100},
+            {'name': 'Indie', 'count': 100},
+        ],
+    )
+    ##
+    response = cooccurrence.related('rock', measure='count')
+    ##
+    assert [(tag['name'], tag['count']) for tag in response] == [
+        ('indie', 1.5),
+        ('pop', 1),
+    ]
+
+
+def test_tag_cooccurrence_refresh(mock_tags):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    cooccurrence = TagCooccurrence()
+    ##
+    added = cooccurrence.refresh(
+        controller,
+        ['Artist A', 'Artist B', 'Artist A', 'unknown'],
+        [('Artist A', 'Track')],
+        workers=2,
+    )
+    ##
+    assert added == 3  # noqa: PLR2004
+    assert cooccurrence.entities == {'Artist A', 'Artist B', 'Artist A\tTrack'}
+    mock_tags.assert_any_call({
+        'method': ARTIST_GETTOPTAGS,
+        'artist': 'Artist A',
+    })
+    mock_tags.assert_any_call({
+        'method': TRACK_GETTOPTAGS,
+        'artist': 'Artist A',
+        'track': 'Track',
+    })
+    assert cooccurrence.count('rock', 'pop') == 1
+
+
+def test_tag_cooccurrence_refresh_only_new_entities(mock_tags):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    cooccurrence = TagCooccurrence()
+    cooccurrence.refresh(controller, ['Artist A'])
+    mock_tags.reset_mock()
+    ##
+    added = cooccurrence.refresh(
+        controller, ['Artist A', 'Artist C'], amount=1
+    )
+    ##
+    assert added == 1
+    assert mock_tags.call_count == 1
+    assert cooccurrence.tags.values == ['rock', 'indie', 'pop']
+
+
+def test_tag_cooccurrence_save_and_load(tmp_path, cooccurrence):
+    path = tmp_path / 'cooccurrence.json'
+    ##
+    cooccurrence.save(path)
+    loaded = TagCooccurrence.load(path)
+    ##
+    assert loaded.tags.values == cooccurrence.tags.values
+    assert loaded.entities == cooccurrence.entities
+    assert loaded.related('pop') == cooccurrence.related('pop')
+    loaded.add(
+        'Artist E',
+        [
+            {'name': 'Rock', 'count': 100},
+            {'name': 'Jazz', 'count': 100},
+        ],
+    )
+    assert loaded.count('jazz', 'rock') == 1
+    assert loaded.count('rock', 'indie') == 0.5  # noqa: PLR2004
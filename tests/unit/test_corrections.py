@@ -0,0 +1,148 @@
+import pytest
+
+from pylastfmapi.constants import ARTIST_GETCORRECTION, TRACK_GETCORRECTION
+from pylastfmapi.corrections import CorrectionIndex
+from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.request import RequestController
+
+GUNS = {'name': "Guns N' Roses", 'mbid': 'guns-mbid', 'url': 'url'}
+CORRECTIONS = {
+    'guns and roses': {
+        'correction': {'artist': GUNS, '@attr': {'index': '0'}}
+    },
+    'Radiohead': '\n ',
+    'guns and roses\tmrbrownstone': {
+        'correction': {
+            'track': {
+                'name': 'Mr. Brownstone',
+                'mbid': '',
+                'url': 'url',
+                'artist': GUNS,
+            },
+            '@attr': {'index': '0', 'trackcorrected': '1'},
+        }
+    },
+}
+
+
+@pytest.fixture
+def index():
+    index = CorrectionIndex()
+    for key, correction in CORRECTIONS.items():
+        artist, separator, track = key.partition('\t')
+        index.add(artist, track if separator else None, correction)
+    return index
+
+
+@pytest.fixture
+def mock_corrections(mocker):
+    """Serves the correction endpoints from `CORRECTIONS`."""
+
+    def _request(payload):
+        key = payload['artist']
+        if payload['method'] == TRACK_GETCORRECTION:
+            key = f'{key}\t{payload["track"]}'
+        if key not in CORRECTIONS:
+            raise LastFMException('The artist you supplied could not be found')
+        response = mocker.Mock()
+        response.json.return_value = {'corrections': CORRECTIONS[key]}
+        return response
+
+    return mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+
+
+#########################################################################
+# CorrectionIndex
+#########################################################################
+
+
+def test_correction_index_get(index):
+    ##
+    response = index.get('guns and roses')
+    ##
+    assert response == ("Guns N' Roses", None, 'guns-mbid')
+    assert index.get('guns and roses', 'mrbrownstone') == (
+        "Guns N' Roses",
+        'Mr. Brownstone',
+        '',
+    )
+    assert index.get('Radiohead') == ('Radiohead', None, '')
+    assert index.get('Unknown') is None
+    assert index.get('Radiohead', 'Creep') is None
+    assert len(index) == 3  # noqa: PLR2004
+    assert 'guns and roses\tmrbrownstone' in index
+
+
+def test_correction_index_resolve(index):
+    ##
+    response = index.resolve('Unknown', 'Track')
+    ##
+    assert response == ('Unknown', 'Track', '')
+    assert index.resolve('guns and roses') == index.get('guns and roses')
+
+
+def test_correction_index_add_many_corrections():
+    index = CorrectionIndex()
+    ##
+    index.add(
+        'guns',
+        None,
+        {
+            'correction': [
+                {'artist': GUNS, '@attr': {'index': '0'}},
+                {'artist': {'name': 'Guns'}, '@attr': {'index': '1'}},
+            ]
+        },
+    )
+    ##
+    assert index.get('guns') == ("Guns N' Roses", None, 'guns-mbid')
+
+
+def test_correction_index_refresh(mock_corrections):
+    index = CorrectionIndex()
+    ##
+    response = index.refresh(
+        RequestController('user_agent_test', 'api_key_test'),
+        ['guns and roses', 'Radiohead', 'guns and roses', 'Unknown'],
+        [('guns and roses', 'mrbrownstone')] * 3,
+        workers=2,
+    )
+    ##
+    assert response == 3  # noqa: PLR2004
+    assert mock_corrections.call_count == 4  # noqa: PLR2004
+    mock_corrections.assert_any_call({
+        'method': ARTIST_GETCORRECTION,
+        'artist': 'guns and roses',
+    })
+    mock_corrections.assert_any_call({
+        'method': TRACK_GETCORRECTION,
+        'artist': 'guns and roses',
+        'track': 'mrbrownstone',
+    })
+    assert index.get('guns and roses', 'mrbrownstone')[1] == 'Mr. Brownstone'
+    assert 'Unknown' not in index
+
+
+def test_correction_index_refresh_only_new_names(mock_corrections, index):
+    ##
+    response = index.refresh(
+        RequestController('user_agent_test', 'api_key_test'),
+        ['guns and roses', 'Radiohead', 'Unknown'],
+    )
+    ##
+    assert response == 0
+    mock_corrections.assert_called_once_with({
+        'method': ARTIST_GETCORRECTION,
+        'artist': 'Unknown',
+    })
+
+
+def test_correction_index_save_and_load(tmp_path, index):
+    path = tmp_path / 'corrections.json'
+    ##
+    index.save(path)
+    response = CorrectionIndex.load(path)
+    ##
+    assert response.corrections == index.corrections
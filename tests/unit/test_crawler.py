@@ -0,0 +1,174 @@
+import pytest
+
+from pylastfmapi.checkpoint import SQLiteCheckpoint
+from pylastfmapi.constants import USER_GETFRIENDS
+from pylastfmapi.crawler import BloomFilter, FriendsCrawler
+from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.request import RequestController
+
+FRIENDS = {
+    'seed': ['a', 'b'],
+    'a': ['seed', 'c', 'd'],
+    'b': ['d', 'e'],
+    'c': ['f'],
+    'd': ['f', 'g'],
+    'e': [],
+    'f': ['h'],
+    'g': [],
+}
+
+
+@pytest.fixture
+def mock_friends(mocker):
+    """Serves `user.getFriends` from `FRIENDS`."""
+
+    def _get_paginated_data(payload, *args):
+        assert payload['method'] == USER_GETFRIENDS
+        if payload['user'] not in FRIENDS:
+            raise LastFMException('User not found')
+        return [
+            {'name': name, 'playcount': str(ord(name[0]))}
+            for name in FRIENDS[payload['user']]
+        ]
+
+    return mocker.patch.object(
+        RequestController,
+        'get_paginated_data',
+        side_effect=_get_paginated_data,
+    )
+
+
+def read_edges(path):
+    return [tuple(line.split('\t')) for line in path.read_text().splitlines()]
+
+
+#########################################################################
+# BloomFilter
+#########################################################################
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(1000)
+    ##
+    added = [bloom.add(f'user{index}') for index in range(1000)]
+    ##
+    assert all(added)
+    assert not bloom.add('user0')
+    assert all(f'user{index}' in bloom for index in range(1000))
+    false_positives = sum(f'other{index}' in bloom for index in range(1000))
+    assert false_positives < 50  # noqa: PLR2004
+
+
+def test_bloom_filter_from_bytes():
+    bloom = BloomFilter(100)
+    bloom.add('user')
+    ##
+    response = BloomFilter(100, bits=bloom.to_bytes())
+    ##
+    assert 'user' in response
+    assert 'other' not in response
+
+
+#########################################################################
+# FriendsCrawler
+#########################################################################
+
+
+def test_friends_crawler(mock_friends, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    edges_path = tmp_path / 'edges.tsv'
+    ##
+    response = list(
+        FriendsCrawler(controller, ['seed'], edges_path, workers=1)
+    )
+    ##
+    assert sorted((depth, user) for user, depth, _ in response) == [
+        (0, 'seed'),
+        (1, 'a'),
+        (1, 'b'),
+        (2, 'c'),
+        (2, 'd'),
+        (2, 'e'),
+    ]
+    assert sorted(read_edges(edges_path)) == sorted(
+        (user, friend)
+        for user in ('seed', 'a', 'b', 'c', 'd', 'e')
+        for friend in FRIENDS[user]
+    )
+
+
+def test_friends_crawler_with_limits(mock_friends, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = list(
+        FriendsCrawler(
+            controller,
+            ['seed'],
+            tmp_path / 'edges.tsv',
+            max_depth=1,
+            max_nodes=2,
+        )
+    )
+    ##
+    assert sorted(user for user, _, _ in response) == ['a', 'seed']
+
+
+def test_friends_crawler_with_priority(mock_friends, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    list(
+        FriendsCrawler(
+            controller,
+            ['seed'],
+            tmp_path / 'edges.tsv',
+            max_depth=3,
+            workers=1,
+            priority=lambda friend: -int(friend['playcount']),
+        )
+    )
+    ##
+    requested = [call.args[0]['user'] for call in mock_friends.call_args_list]
+    assert requested[:4] == ['seed', 'b', 'a', 'e']
+
+
+def test_friends_crawler_with_error(mock_friends, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = list(
+        FriendsCrawler(controller, ['seed', 'unknown'], tmp_path / 'edges')
+    )
+    ##
+    errors = [
+        user
+        for user, _, friends in response
+        if isinstance(friends, LastFMException)
+    ]
+    assert errors == ['unknown']
+
+
+def test_friends_crawler_resume(mock_friends, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    edges_path = tmp_path / 'edges.tsv'
+    checkpoint = SQLiteCheckpoint(':memory:')
+    crawler = FriendsCrawler(
+        controller,
+        ['seed'],
+        edges_path,
+        max_depth=3,
+        workers=1,
+        checkpoint=checkpoint,
+        save_interval=2,
+    )
+    first = []
+    for user, _, _ in crawler:
+        first.append(user)
+        if len(first) == 3:  # noqa: PLR2004
+            break
+    ##
+    second = [user for user, _, _ in crawler]
+    ##
+    assert sorted(first[:2] + second) == sorted(FRIENDS)
+    assert sorted(read_edges(edges_path)) == sorted(
+        (user, friend) for user in FRIENDS for friend in FRIENDS[user]
+    )
+    assert list(crawler) == []
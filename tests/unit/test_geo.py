@@ -0,0 +1,146 @@
+from math import ceil
+from typing import get_args
+
+import pytest
+
+from pylastfmapi.constants import GEO_GETOPTRACKS, GEO_SNAPSHOT_AMOUNT
+from pylastfmapi.exceptions import RequestErrorException
+from pylastfmapi.geo import GeoSnapshot
+from pylastfmapi.request import RequestController
+from pylastfmapi.typehints import T_ISO3166CountryNames
+
+
+def _artists(*names):
+    return [
+        {'name': name, 'listeners': str(1000 - rank)}
+        for rank, name in enumerate(names)
+    ]
+
+
+@pytest.fixture
+def snapshots():
+    previous = GeoSnapshot(created=1)
+    previous.add('Brazil', _artists('A', 'B', 'C'))
+    previous.add('Chile', _artists('A'))
+    current = GeoSnapshot(created=2)
+    current.add('Brazil', _artists('B', 'A', 'D'))
+    return previous, current
+
+
+#########################################################################
+# GeoSnapshot
+#########################################################################
+
+
+def test_geo_snapshot_get(snapshots):
+    _, current = snapshots
+    ##
+    response = current.get('Brazil')
+    ##
+    assert response == [
+        {'name': 'B', 'rank': 1, 'listeners': 1000},
+        {'name': 'A', 'rank': 2, 'listeners': 999},
+        {'name': 'D', 'rank': 3, 'listeners': 998},
+    ]
+    assert current.get('Chile') == []
+    assert len(current) == 3  # noqa: PLR2004
+
+
+def test_geo_snapshot_diff(snapshots):
+    previous, current = snapshots
+    ##
+    response = current.diff(previous)
+    ##
+    assert response == [
+        {
+            'country': 'Brazil',
+            'name': 'B',
+            'rank': 1,
+            'previous_rank': 2,
+            'change': 1,
+        },
+        {
+            'country': 'Brazil',
+            'name': 'A',
+            'rank': 2,
+            'previous_rank': 1,
+            'change': -1,
+        },
+        {
+            'country': 'Brazil',
+            'name': 'D',
+            'rank': 3,
+            'previous_rank': None,
+            'change': None,
+        },
+        {
+            'country': 'Brazil',
+            'name': 'C',
+            'rank': None,
+            'previous_rank': 3,
+            'change': None,
+        },
+    ]
+
+
+def test_geo_snapshot_save_and_load(snapshots, tmp_path):
+    _, current = snapshots
+    current.add('Chile', [{'name': 'Track', 'artist': {'name': 'A'}}])
+    ##
+    current.save(tmp_path / 'snapshot.json')
+    loaded = GeoSnapshot.load(tmp_path / 'snapshot.json')
+    ##
+    assert loaded.created == 2  # noqa: PLR2004
+    assert list(loaded.rows()) == list(current.rows())
+    assert loaded.get('Chile') == [
+        {'name': 'Track', 'artist': 'A', 'rank': 1, 'listeners': 0}
+    ]
+
+
+def test_geo_snapshot_to_arrow(snapshots):
+    _, current = snapshots
+    ##
+    table = current.to_arrow()
+    ##
+    assert table.column_names == ['country', 'rank', 'entity', 'listeners']
+    assert table.column('entity').to_pylist() == ['B', 'A', 'D']
+    assert table.column('listeners').to_pylist() == [1000, 999, 998]
+
+
+def test_geo_snapshot_fetch(mocker):
+    def _request(payload):
+        if payload['country'] == 'Chile':
+            raise RequestErrorException('Something wrong, error 6')
+        page, limit = payload['page'], payload['limit']
+        tracks = [
+            {'name': f'Track {rank}', 'artist': {'name': payload['country']}}
+            for rank in range(100)
+        ][(page - 1) * limit : page * limit]
+        response = mocker.Mock()
+        response.json.return_value = {
+            'tracks': {
+                'track': tracks,
+                '@attr': {'totalPages': str(ceil(100 / limit))},
+            }
+        }
+        return response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    snapshot = GeoSnapshot.fetch(controller, 'tracks')
+    ##
+    countries = get_args(T_ISO3166CountryNames)
+    assert mock_request.call_count == len(countries)
+    mock_request.assert_any_call({
+        'method': GEO_GETOPTRACKS,
+        'country': 'Brazil',
+        'limit': GEO_SNAPSHOT_AMOUNT,
+        'page': 1,
+    })
+    assert snapshot.failed == ['Chile']
+    assert len(snapshot) == (len(countries) - 1) * GEO_SNAPSHOT_AMOUNT
+    assert max(snapshot.ranks) == GEO_SNAPSHOT_AMOUNT
+    assert snapshot.get('Brazil')[0]['artist'] == 'Brazil'
@@ -0,0 +1,122 @@
+from array import array
+
+import pytest
+
+from pylastfmapi.constants import ARTIST_GETSIMILAR
+from pylastfmapi.exceptions import RequestErrorException
+from pylastfmapi.graph import ArtistGraph, build_artist_graph
+from pylastfmapi.request import RequestController
+
+SIMILAR = {
+    'Seed': [('A', 'mbid-a', '1'), ('B', '', '0.5')],
+    'A': [('seed', '', '0.9'), ('C', 'mbid-c', '0.8')],
+    'B': [('Other A', 'mbid-a', '0.7')],
+    'C': [('D', '', '0.6')],
+}
+
+
+@pytest.fixture
+def mock_similar(mocker):
+    """Serves `artist.getSimilar` from `SIMILAR`."""
+
+    def _request(payload):
+        assert payload['method'] == ARTIST_GETSIMILAR
+        if payload['artist'] not in SIMILAR:
+            raise RequestErrorException('Something wrong, error 6')
+        response = mocker.Mock()
+        response.json.return_value = {
+            'similarartists': {
+                'artist': [
+                    {'name': name, 'mbid': mbid, 'match': match}
+                    for name, mbid, match in SIMILAR[payload['artist']]
+                ]
+            }
+        }
+        return response
+
+    return mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+
+
+#########################################################################
+# build_artist_graph
+#########################################################################
+
+
+def test_build_artist_graph(mock_similar):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    graph = build_artist_graph(controller, ['Seed'], max_depth=2)
+    ##
+    assert graph.names == ['Seed', 'A', 'B', 'C']
+    assert graph.mbids == ['', 'mbid-a', '', 'mbid-c']
+    assert graph.edges == 5  # noqa: PLR2004
+    assert graph.neighbors('seed') == [('A', 1.0), ('B', 0.5)]
+    assert graph.neighbors('mbid-a') == [
+        ('Seed', pytest.approx(0.9)),
+        ('C', pytest.approx(0.8)),
+    ]
+    assert graph.neighbors('B') == [('A', pytest.approx(0.7))]
+    assert graph.neighbors('C') == []
+    assert 'D' not in graph
+    assert mock_similar.call_count == 3  # noqa: PLR2004
+
+
+def test_build_artist_graph_with_limits(mock_similar):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    graph = build_artist_graph(
+        controller, ['Seed', 'Unknown'], max_depth=3, max_nodes=3
+    )
+    ##
+    assert graph.neighbors('Unknown') == []
+    assert sum(bool(graph.neighbors(name)) for name in graph.names) == 2  # noqa: PLR2004
+    assert mock_similar.call_count == 3  # noqa: PLR2004
+
+
+#########################################################################
+# ArtistGraph
+#########################################################################
+
+
+def test_artist_graph_save_and_load(mock_similar, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    graph = build_artist_graph(controller, ['Seed'], max_depth=3)
+    ##
+    graph.save(tmp_path / 'graph')
+    loaded = ArtistGraph.load(tmp_path / 'graph')
+    ##
+    assert len(loaded) == len(graph)
+    assert loaded.edges == graph.edges
+    for name in graph.names:
+        assert loaded.neighbors(name) == graph.neighbors(name)
+    indices, weights = loaded.neighbor_ids(loaded.node('C'))
+    assert list(indices) == [loaded.node('D')]
+    assert list(weights) == [pytest.approx(0.6)]
+
+
+def test_artist_graph_close(mock_similar, tmp_path):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    build_artist_graph(controller, ['Seed'], max_depth=3).save(tmp_path)
+    ##
+    with ArtistGraph.load(tmp_path) as graph:
+        neighbors = graph.neighbors('C')
+        maps = list(graph._maps)
+    ##
+    assert neighbors == [('D', pytest.approx(0.6))]
+    assert len(maps) == 3  # noqa: PLR2004
+    assert all(file_map.closed for file_map in maps)
+    with pytest.raises(ValueError, match='released'):
+        graph.neighbors('C')
+    (tmp_path / 'indices.bin').unlink()
+
+
+def test_artist_graph_load_empty(tmp_path):
+    ArtistGraph(
+        ['Seed'], [''], array('q', [0, 0]), array('i'), array('f')
+    ).save(tmp_path)
+    ##
+    graph = ArtistGraph.load(tmp_path)
+    ##
+    assert graph.neighbors('Seed') == []
@@ -0,0 +1,166 @@
+import pytest
+
+from pylastfmapi.models import (
+    Album,
+    Artist,
+    Scrobble,
+    Tag,
+    Track,
+    User,
+    parse_result,
+)
+
+#########################################################################
+# Models
+#########################################################################
+
+
+def test_artist_from_dict():
+    data = {
+        'name': 'Artist Name',
+        'mbid': '',
+        'url': 'url',
+        'stats': {'listeners': '1000', 'playcount': '5000'},
+        'image': [{'#text': 'url', 'size': 'small'}],
+        '@attr': {'rank': '3'},
+    }
+    ##
+    response = Artist.from_dict(data)
+    ##
+    assert response == Artist(
+        name='Artist Name',
+        mbid=None,
+        url='url',
+        playcount=5000,
+        listeners=1000,
+        rank=3,
+    )
+
+
+def test_album_from_dict():
+    data = {
+        'name': 'Album Name',
+        'artist': {'mbid': 'mbid', '#text': 'Artist Name'},
+        'playcount': '12',
+    }
+    ##
+    response = Album.from_dict(data)
+    ##
+    assert response == Album(
+        name='Album Name', artist='Artist Name', playcount=12
+    )
+
+
+@pytest.mark.parametrize(
+    'artist', ['Artist Name', {'name': 'Artist Name', 'url': 'url'}]
+)
+def test_track_from_dict(artist):
+    data = {
+        'name': 'Track Name',
+        'artist': artist,
+        'duration': '240',
+        'listeners': '10',
+        'match': '0.5',
+    }
+    ##
+    response = Track.from_dict(data)
+    ##
+    assert response == Track(
+        name='Track Name',
+        artist='Artist Name',
+        listeners=10,
+        duration=240,
+        match=0.5,
+    )
+
+
+def test_scrobble_from_dict():
+    data = {
+        'name': 'Track Name',
+        'artist': {'#text': 'Artist Name', 'mbid': ''},
+        'album': {'#text': 'Album Name', 'mbid': ''},
+        'date': {'uts': '1700000000', '#text': '14 Nov 2023, 22:13'},
+        'loved': '1',
+    }
+    ##
+    response = Scrobble.from_dict(data)
+    ##
+    assert response == Scrobble(
+        name='Track Name',
+        artist='Artist Name',
+        album='Album Name',
+        uts=1700000000,
+        loved=True,
+    )
+
+
+def test_scrobble_from_dict_now_playing():
+    data = {
+        'name': 'Track Name',
+        'artist': {'#text': 'Artist Name'},
+        '@attr': {'nowplaying': 'true'},
+    }
+    ##
+    response = Scrobble.from_dict(data)
+    ##
+    assert response.uts is None
+    assert response.now_playing
+
+
+def test_tag_from_dict():
+    data = {'name': 'rock', 'count': 100, 'reach': '400', 'total': '9000'}
+    ##
+    response = Tag.from_dict(data)
+    ##
+    assert response == Tag(name='rock', count=100, reach=400, total=9000)
+
+
+def test_user_from_dict():
+    data = {
+        'name': 'username',
+        'realname': '',
+        'playcount': '1234',
+        'registered': {'unixtime': '1100000000', '#text': 1100000000},
+    }
+    ##
+    response = User.from_dict(data)
+    ##
+    assert response == User(
+        name='username', playcount=1234, registered=1100000000
+    )
+
+
+def test_models_use_slots():
+    ##
+    response = Track.from_dict({'name': 'Track Name'})
+    ##
+    assert not hasattr(response, '__dict__')
+
+
+#########################################################################
+# parse_result
+#########################################################################
+
+
+def test_parse_result_with_model():
+    data = [{'name': 'rock', 'count': '100'}, {'name': 'pop', 'count': '50'}]
+    ##
+    response = parse_result(data, model=Tag)
+    ##
+    assert response == [Tag(name='rock', count=100), Tag(name='pop', count=50)]
+
+
+def test_parse_result_with_fields_and_model():
+    data = {'name': 'Artist Name', 'url': 'url', 'mbid': 'mbid'}
+    ##
+    response = parse_result(data, ['name'], Artist)
+    ##
+    assert response == Artist(name='Artist Name')
+
+
+def test_parse_result_without_model():
+    data = {'name': 'Artist Name', 'url': 'url'}
+    ##
+    response = parse_result(data, ['name'])
+    ##
+    assert response == {'name': 'Artist Name'}
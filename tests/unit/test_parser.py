@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from pylastfmapi.parser import ItemStream
+
+
+def _chunks(document, size):
+    content = json.dumps(document).encode()
+    return [content[i : i + size] for i in range(0, len(content), size)]
+
+
+#########################################################################
+# ItemStream
+#########################################################################
+
+
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_item_stream_yields_items(size):
+    items = [
+        {'name': 'Track ç', 'playcount': 12, 'image': [{'#text': 'url'}]},
+        {'name': 'Track 2', 'playcount': 1234567},
+    ]
+    document = {
+        'parent': {'@attr': {'totalPages': '3'}, 'list': items},
+    }
+    ##
+    stream = ItemStream(_chunks(document, size), 'parent', 'list')
+    response = list(stream)
+    ##
+    assert response == items
+    assert stream.metadata == {'@attr': {'totalPages': '3'}}
+
+
+def test_item_stream_with_attributes_after_list():
+    document = {
+        'other': [1, 2, 3],
+        'parent': {'list': [{'name': 'item'}], '@attr': {'totalPages': 1}},
+    }
+    ##
+    stream = ItemStream(_chunks(document, 5), 'parent', 'list')
+    response = list(stream)
+    ##
+    assert response == [{'name': 'item'}]
+    assert stream.metadata == {'other': [1, 2, 3], '@attr': {'totalPages': 1}}
+
+
+def test_item_stream_with_tagging():
+    document = {
+        'taggings': {
+            'parent': {'list': [{'name': 'item'}]},
+            '@attr': {'totalPages': '1'},
+        }
+    }
+    ##
+    stream = ItemStream(_chunks(document, 3), 'parent', 'list')
+    response = list(stream)
+    ##
+    assert response == [{'name': 'item'}]
+    assert stream.metadata == {'@attr': {'totalPages': '1'}}
+
+
+def test_item_stream_with_single_object():
+    document = {'parent': {'list': {'name': 'item'}}}
+    ##
+    response = list(ItemStream(_chunks(document, 4), 'parent', 'list'))
+    ##
+    assert response == [{'name': 'item'}]
+
+
+def test_item_stream_with_empty_list():
+    document = {'parent': {'list': [], '@attr': {'totalPages': '0'}}}
+    ##
+    stream = ItemStream(_chunks(document, 4), 'parent', 'list')
+    response = list(stream)
+    ##
+    assert response == []
+    assert stream.metadata == {'@attr': {'totalPages': '0'}}
+
+
+def test_item_stream_with_error_document():
+    document = {'error': 6, 'message': 'User not found'}
+    ##
+    stream = ItemStream(_chunks(document, 4), 'parent', 'list')
+    response = list(stream)
+    ##
+    assert response == []
+    assert stream.metadata == {'error': 6, 'message': 'User not found'}
+
+
+def test_item_stream_with_truncated_document():
+    chunks = [b'{"parent": {"list": [{"name": "item"}, {"na']
+    ##
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = list(ItemStream(chunks, 'parent', 'list'))
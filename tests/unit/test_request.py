@@ -1,11 +1,18 @@
+import json
+import time
 from http import HTTPStatus
+from math import ceil
 from unittest.mock import call
 
 import pytest
 
+from pylastfmapi.cache import SearchCache
+from pylastfmapi.checkpoint import SQLiteCheckpoint
 from pylastfmapi.constants import LIMIT, LIMIT_SEARCH
 from pylastfmapi.exceptions import RequestErrorException
-from pylastfmapi.request import RequestController
+from pylastfmapi.models import Tag
+from pylastfmapi.request import RateLimiter, RequestController
+from pylastfmapi.utils import unique_scrobbles
 
 ##############################################################################
 # Test request
@@ -124,6 +131,76 @@ def test_request_with_error_message(mocker):
         _ = controller.request({'param1': 'parameter-test'})
 
 
+def test_request_does_not_change_payload(mock_request_get):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    _ = controller.request({'param1': 'parameter-test'})
+    ##
+    assert controller.payload == {'api_key': 'api_key_test', 'format': 'json'}
+
+
+##############################################################################
+# Test rate limit
+##############################################################################
+
+
+def test_rate_limiter_wait(mocker):
+    mocker.patch('time.monotonic', return_value=100.0)
+    mock_sleep = mocker.patch('time.sleep')
+    rate_limiter = RateLimiter(0.5)
+    ##
+    for _ in range(3):
+        rate_limiter.wait()
+    ##
+    assert mock_sleep.call_args_list == [call(0.5), call(1.0)]
+
+
+def test_rate_limiter_wait_after_interval(mocker):
+    mocker.patch('time.monotonic', side_effect=[100.0, 100.2, 200.0])
+    mock_sleep = mocker.patch('time.sleep')
+    rate_limiter = RateLimiter(0.5)
+    ##
+    for _ in range(3):
+        rate_limiter.wait()
+    ##
+    assert mock_sleep.call_args_list == [call(pytest.approx(0.3))]
+
+
+@pytest.mark.parametrize(('cached', 'waits'), [(True, 0), (False, 1)])
+def test_request_waits_for_rate_limiter(
+    mocker, mock_request_get, cached, waits
+):
+    rate_limiter = mocker.Mock(spec=RateLimiter)
+    mocker.patch.object(RequestController, 'is_cached', return_value=cached)
+    controller = RequestController(
+        'user_agent_test', 'api_key_test', rate_limiter=rate_limiter
+    )
+    ##
+    _ = controller.request({'param1': 'parameter-test'})
+    ##
+    assert rate_limiter.wait.call_count == waits
+
+
+def test_is_cached(mocker):
+    mock_cache = mocker.Mock()
+    mock_cache.contains.return_value = True
+    mocker.patch('requests_cache.get_cache', return_value=mock_cache)
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.is_cached({'method': 'test'})
+    ##
+    assert response is True
+    request = mock_cache.contains.call_args.kwargs['request']
+    assert request.params == {'method': 'test'}
+
+
+def test_is_cached_without_cache(mocker):
+    mocker.patch('requests_cache.get_cache', return_value=None)
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    assert controller.is_cached({'method': 'test'}) is False
+
+
 ##############################################################################
 # Test request_all_pages
 ##############################################################################
@@ -312,11 +389,7 @@ def test_request_all_pages_amount_higher_than_limit_lower_than_total(mocker):
         [
             call({'method': 'method-name', 'limit': LIMIT, 'page': 1}),
             call({'method': 'method-name', 'limit': LIMIT, 'page': 2}),
-            call({
-                'method': 'method-name',
-                'limit': amount % LIMIT,
-                'page': 3,
-            }),
+            call({'method': 'method-name', 'limit': LIMIT, 'page': 3}),
         ],
     )
     assert len(response) == 3  # noqa: PLR2004
@@ -403,6 +476,53 @@ def test_request_all_pages_with_tagging(mocker):
     assert len(_list) == amount
 
 
+def test_request_all_pages_with_checkpoint(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    total_pages = 3
+    checkpoint = SQLiteCheckpoint(':memory:')
+
+    def _mock_response(page):
+        mock_response = mocker.Mock()
+        mock_response.from_cache = True
+        mock_response.json.return_value = {
+            'parent': {
+                'list': [{'name': f'item{page}'}],
+                '@attr': {'totalPages': total_pages},
+            }
+        }
+        return mock_response
+
+    mock_request = mocker.patch.object(RequestController, 'request')
+    mock_request.side_effect = [
+        _mock_response(1),
+        _mock_response(2),
+        RequestErrorException('Something wrong'),
+    ]
+    controller = RequestController(user_agent_test, api_key_test)
+    with pytest.raises(RequestErrorException):
+        controller.request_all_pages(
+            {'method': 'test'}, 'parent', 'list', None, checkpoint
+        )
+    mock_request.side_effect = [_mock_response(3)]
+    ##
+    response = controller.request_all_pages(
+        {'method': 'test'}, 'parent', 'list', None, checkpoint
+    )
+    ##
+    mock_request.assert_called_with({
+        'method': 'test',
+        'limit': LIMIT,
+        'page': 3,
+    })
+    assert [page.json()['parent']['list'] for page in response] == [
+        [{'name': 'item1'}],
+        [{'name': 'item2'}],
+        [{'name': 'item3'}],
+    ]
+    assert len(checkpoint) == total_pages
+
+
 ##############################################################################
 # Test get_paginated_data
 ##############################################################################
@@ -435,7 +555,7 @@ def test_get_paginated_data(mocker):
     ##
     mock_request_all_pages.assert_called_once()
     mock_request_all_pages.assert_called_with(
-        payload, parent_key, list_key, amount
+        payload, parent_key, list_key, amount, None
     )
     assert response == [
         {'name': 'item1'},
@@ -451,6 +571,488 @@ def test_get_paginated_data(mocker):
     ]
 
 
+@pytest.mark.parametrize('amount', [LIMIT, LIMIT * 2, LIMIT + 1, 100])
+def test_get_paginated_data_amount(mocker, amount):
+    total = LIMIT * 3
+
+    def _request(payload):
+        start = (payload['page'] - 1) * payload['limit']
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            'parent': {
+                'list': [
+                    {'name': f'item{index}'}
+                    for index in range(
+                        start, min(start + payload['limit'], total)
+                    )
+                ],
+                '@attr': {'totalPages': ceil(total / payload['limit'])},
+            }
+        }
+        return mock_response
+
+    mocker.patch.object(RequestController, 'request', side_effect=_request)
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.get_paginated_data(
+        {'method': 'test'}, 'parent', 'list', amount
+    )
+    ##
+    assert response == [{'name': f'item{index}'} for index in range(amount)]
+
+
+def test_get_paginated_data_with_fields(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    mock_response = mocker.Mock().return_value
+    mock_response.json.return_value = {
+        'parent': {
+            'list': [
+                {'name': 'item1', 'date': {'uts': '1', '#text': 'date'}},
+                {'name': 'item2', 'image': []},
+            ]
+        }
+    }
+    mock_request_all_pages = mocker.patch.object(
+        RequestController, 'request_all_pages'
+    )
+    mock_request_all_pages.return_value = [mock_response] * 2
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = controller.get_paginated_data(
+        {'method': 'test'}, 'parent', 'list', None, fields=['name', 'date.uts']
+    )
+    ##
+    assert (
+        response
+        == [
+            {'name': 'item1', 'date': {'uts': '1'}},
+            {'name': 'item2'},
+        ]
+        * 2
+    )
+
+
+def test_get_paginated_data_with_intern(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    body = json.dumps({
+        'parent': {
+            'list': [
+                {'name': 'Track Name', 'artist': {'name': 'Artist Name'}},
+                {'name': 'Other Track', 'artist': {'name': 'Artist Name'}},
+            ]
+        }
+    })
+    mock_response = mocker.Mock().return_value
+    mock_response.json.side_effect = lambda: json.loads(body)
+    mock_request_all_pages = mocker.patch.object(
+        RequestController, 'request_all_pages'
+    )
+    mock_request_all_pages.return_value = [mock_response] * 2
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = controller.get_paginated_data(
+        {'method': 'test'}, 'parent', 'list', None, intern=True
+    )
+    ##
+    artists = {id(item['artist']['name']) for item in response}
+    assert len(artists) == 1
+    assert response[0]['name'] is response[2]['name']
+
+
+def test_get_paginated_data_with_item_filter(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    pages = [
+        [{'name': 'item3'}, {'name': 'item2'}],
+        [{'name': 'item2'}, {'name': 'item1'}],
+    ]
+    mock_responses = []
+    for items in pages:
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {'parent': {'list': items}}
+        mock_responses.append(mock_response)
+    mocker.patch.object(
+        RequestController, 'request_all_pages', return_value=mock_responses
+    )
+
+    def _unique(items):
+        seen = set()
+        for item in items:
+            if item['name'] not in seen:
+                seen.add(item['name'])
+                yield item
+
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = controller.get_paginated_data(
+        {'method': 'test'},
+        'parent',
+        'list',
+        None,
+        fields=['name'],
+        item_filter=_unique,
+    )
+    ##
+    assert response == [
+        {'name': 'item3'},
+        {'name': 'item2'},
+        {'name': 'item1'},
+    ]
+
+
+def test_stream_request_bypasses_the_cache(mocker):
+    mocker.patch('pylastfmapi.request.URL', 'url-test.com')
+    mocker.patch('requests_cache.install_cache', autospec=True)
+    mock_request_get = mocker.patch('requests.get', autospec=True)
+    mock_session = mocker.patch('pylastfmapi.request.OriginalSession')
+    mock_get = mock_session.return_value.__enter__.return_value.get
+    mock_get.return_value.status_code = HTTPStatus.OK
+    rate_limiter = mocker.Mock()
+    controller = RequestController(
+        'user_agent_test', 'api_key_test', rate_limiter=rate_limiter
+    )
+    ##
+    response = controller.stream_request({'param1': 'parameter-test'})
+    ##
+    assert response == mock_get.return_value
+    mock_get.assert_called_once_with(
+        'url-test.com',
+        headers={'user-agent': 'user_agent_test'},
+        params={
+            'api_key': 'api_key_test',
+            'format': 'json',
+            'param1': 'parameter-test',
+        },
+        stream=True,
+    )
+    mock_request_get.assert_not_called()
+    rate_limiter.wait.assert_called_once()
+
+
+def test_get_paginated_data_with_item_filter_fills_amount(mocker):
+    scrobbles = [
+        {
+            'name': 'Now Playing',
+            'artist': {'#text': 'A'},
+            '@attr': {'nowplaying': 'true'},
+        },
+        *(
+            {
+                'name': f'item{uts}',
+                'artist': {'#text': 'A'},
+                'date': {'uts': str(uts)},
+            }
+            for uts in range(6, 0, -1)
+        ),
+    ]
+
+    def _request(payload):
+        page, limit = payload['page'], payload['limit']
+        response = mocker.Mock()
+        response.json.return_value = {
+            'parent': {
+                'list': scrobbles[(page - 1) * limit : page * limit],
+                '@attr': {'totalPages': str(ceil(len(scrobbles) / limit))},
+            }
+        }
+        return response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.get_paginated_data(
+        {'method': 'test'},
+        'parent',
+        'list',
+        3,
+        fields=['name'],
+        item_filter=unique_scrobbles,
+    )
+    ##
+    assert response == [
+        {'name': 'item6'},
+        {'name': 'item5'},
+        {'name': 'item4'},
+    ]
+    assert mock_request.call_count == 2  # noqa: PLR2004
+    mock_request.assert_called_with({'method': 'test', 'limit': 3, 'page': 2})
+
+
+##############################################################################
+# Test iter_paginated_data
+##############################################################################
+
+
+def _mock_stream_response(mocker, content, from_cache=True):
+    mock_response = mocker.Mock()
+    mock_response.from_cache = from_cache
+    body = json.dumps(content).encode()
+    mock_response.iter_content.return_value = [
+        body[i : i + 10] for i in range(0, len(body), 10)
+    ]
+    return mock_response
+
+
+def test_iter_paginated_data(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    payload = {'method': 'method-name'}
+    total_pages = 3
+    mock_responses = [
+        _mock_stream_response(
+            mocker,
+            {
+                'parent': {
+                    'list': [{'name': f'item{page}'}] * 2,
+                    '@attr': {'totalPages': str(total_pages)},
+                }
+            },
+        )
+        for page in range(total_pages)
+    ]
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.side_effect = mock_responses
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(payload, 'parent', 'list', None)
+    )
+    ##
+    assert mock_stream_request.call_args_list == [
+        call({'method': 'method-name', 'limit': LIMIT, 'page': page})
+        for page in range(1, total_pages + 1)
+    ]
+    assert response == [
+        {'name': 'item0'},
+        {'name': 'item0'},
+        {'name': 'item1'},
+        {'name': 'item1'},
+        {'name': 'item2'},
+        {'name': 'item2'},
+    ]
+
+
+def test_iter_paginated_data_stops_at_amount(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    payload = {'method': 'method-name'}
+    amount = 3
+    mock_responses = [
+        _mock_stream_response(
+            mocker,
+            {
+                'parent': {
+                    'list': [{'name': 'item'}] * 2,
+                    '@attr': {'totalPages': '5'},
+                }
+            },
+        )
+        for _ in range(2)
+    ]
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.side_effect = mock_responses
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(payload, 'parent', 'list', amount)
+    )
+    ##
+    assert len(response) == amount
+    assert mock_stream_request.call_count == 2  # noqa: PLR2004
+    mock_stream_request.assert_called_with({
+        'method': 'method-name',
+        'limit': amount,
+        'page': 2,
+    })
+    mock_responses[1].close.assert_called_once()
+
+
+def test_iter_paginated_data_receive_page_with_no_data(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    payload = {'method': 'method-name'}
+    mock_responses = [
+        _mock_stream_response(
+            mocker,
+            {
+                'parent': {
+                    'list': [{'name': 'item'}],
+                    '@attr': {'totalPages': 3},
+                }
+            },
+        ),
+        _mock_stream_response(
+            mocker, {'parent': {'list': [], '@attr': {'totalPages': 3}}}
+        ),
+    ]
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.side_effect = mock_responses
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(payload, 'parent', 'list', None)
+    )
+    ##
+    assert response == [{'name': 'item'}]
+    assert mock_stream_request.call_count == 2  # noqa: PLR2004
+
+
+def test_iter_paginated_data_with_fields(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.return_value = _mock_stream_response(
+        mocker,
+        {
+            'parent': {
+                'list': [{'name': 'item', 'image': [], 'mbid': ''}],
+                '@attr': {'totalPages': 1},
+            }
+        },
+    )
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(
+            {'method': 'method-name'}, 'parent', 'list', None, fields=['name']
+        )
+    )
+    ##
+    assert response == [{'name': 'item'}]
+
+
+def test_iter_paginated_data_with_model(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.return_value = _mock_stream_response(
+        mocker,
+        {
+            'parent': {
+                'list': [{'name': 'rock', 'count': '100'}],
+                '@attr': {'totalPages': 1},
+            }
+        },
+    )
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(
+            {'method': 'method-name'}, 'parent', 'list', None, model=Tag
+        )
+    )
+    ##
+    assert response == [Tag(name='rock', count=100)]
+
+
+def test_iter_paginated_data_with_intern(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.return_value = _mock_stream_response(
+        mocker,
+        {
+            'parent': {
+                'list': [{'artist': 'Artist Name'}] * 3,
+                '@attr': {'totalPages': 1},
+            }
+        },
+    )
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(
+            {'method': 'method-name'}, 'parent', 'list', None, intern=True
+        )
+    )
+    ##
+    assert len({id(item['artist']) for item in response}) == 1
+
+
+def test_iter_paginated_data_with_item_filter(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.return_value = _mock_stream_response(
+        mocker,
+        {
+            'parent': {
+                'list': [
+                    {'name': 'skip'},
+                    {'name': 'item1'},
+                    {'name': 'item2'},
+                ],
+                '@attr': {'totalPages': 1},
+            }
+        },
+    )
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    response = list(
+        controller.iter_paginated_data(
+            {'method': 'method-name'},
+            'parent',
+            'list',
+            1,
+            item_filter=lambda items: (
+                item for item in items if item['name'] != 'skip'
+            ),
+        )
+    )
+    ##
+    assert response == [{'name': 'item1'}]
+
+
+def test_iter_paginated_data_with_error_message(mocker):
+    user_agent_test = 'user_agent_test'
+    api_key_test = 'api_key_test'
+    mock_stream_request = mocker.patch.object(
+        RequestController, 'stream_request'
+    )
+    mock_stream_request.return_value = _mock_stream_response(
+        mocker, {'error': 6, 'message': 'Error!'}
+    )
+    ###
+    controller = RequestController(user_agent_test, api_key_test)
+    ##
+    with pytest.raises(
+        RequestErrorException,
+        match='Something wrong, error 6: Error!',
+    ):
+        _ = list(
+            controller.iter_paginated_data(
+                {'method': 'method-name'}, 'parent', 'list', None
+            )
+        )
+
+
 ##############################################################################
 # Test request_search_pages
 ##############################################################################
@@ -493,37 +1095,30 @@ def test_request_search_pages(mocker):
     assert len(_list) == amount
 
 
-def test_request_search_pages_receive_page_with_no_data(mocker, capfd):
+def test_request_search_pages_receive_page_with_no_data(mocker):
     user_agent_test = 'user_agent_test'
     api_key_test = 'api_key_test'
     payload = {'method': 'method-name'}
     amount = LIMIT_SEARCH * 4
     total_pages = 4
-    # Mock request responses
-    mock_responses = []
-    for _ in range(total_pages - 1):
+
+    # The pages are requested concurrently, so the responses are chosen by
+    # page instead of by call order.
+    def _request(payload):
         mock_response = mocker.Mock()
         mock_response.status_code = HTTPStatus.OK
+        items = [2] * LIMIT_SEARCH if payload['page'] < total_pages else []
         mock_response.json.return_value = {
             'results': {
-                'parent': {
-                    'list': [2] * LIMIT_SEARCH,
-                },
+                'parent': {'list': items},
                 'opensearch:totalResults': total_pages * LIMIT_SEARCH,
             }
         }
-        mock_responses.append(mock_response)
-    mock_response = mocker.Mock()
-    mock_response.status_code = HTTPStatus.OK
-    mock_response.json.return_value = {
-        'results': {
-            'parent': {'list': [], '@attr': {'totalPages': total_pages}},
-            'opensearch:totalResults': total_pages * LIMIT_SEARCH,
-        }
-    }
-    mock_responses.append(mock_response)
-    mock_request = mocker.patch.object(RequestController, 'request')
-    mock_request.side_effect = mock_responses
+        return mock_response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
     ##
     controller = RequestController(user_agent_test, api_key_test)
     ##
@@ -539,6 +1134,110 @@ def test_request_search_pages_receive_page_with_no_data(mocker, capfd):
     assert len(_list) == amount - LIMIT_SEARCH
 
 
+def test_request_search_pages_in_order(mocker):
+    total_pages = 6
+
+    def _request(payload):
+        # The later pages complete first.
+        time.sleep((total_pages - payload['page']) / 100)
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            'results': {
+                'parent': {'list': [payload['page']] * LIMIT_SEARCH},
+                'opensearch:totalResults': total_pages * LIMIT_SEARCH,
+            }
+        }
+        return mock_response
+
+    mocker.patch.object(RequestController, 'request', side_effect=_request)
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.request_search_pages(
+        {'method': 'method-name'}, 'parent', 'list', None, workers=3
+    )
+    ##
+    assert [r.json()['results']['parent']['list'][0] for r in response] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+
+
+def test_request_search_pages_stops_after_empty_page(mocker):
+    served_pages = 3
+
+    def _request(payload):
+        mock_response = mocker.Mock()
+        items = [2] * LIMIT_SEARCH if payload['page'] <= served_pages else []
+        mock_response.json.return_value = {
+            'results': {
+                'parent': {'list': items},
+                'opensearch:totalResults': '500000',
+            }
+        }
+        return mock_response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.request_search_pages(
+        {'method': 'method-name'}, 'parent', 'list', None, workers=2
+    )
+    ##
+    assert len(response) == served_pages
+    # Only the pages already queued when the empty page came back are sent.
+    assert mock_request.call_count <= served_pages + 1 + 2 * 2
+
+
+def test_request_search_pages_with_error(mocker):
+    def _request(payload):
+        if payload['page'] == 2:  # noqa: PLR2004
+            raise RequestErrorException('Something wrong, error 8: Failed')
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            'results': {
+                'parent': {'list': [2] * LIMIT_SEARCH},
+                'opensearch:totalResults': 3 * LIMIT_SEARCH,
+            }
+        }
+        return mock_response
+
+    mocker.patch.object(RequestController, 'request', side_effect=_request)
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    with pytest.raises(RequestErrorException, match='error 8'):
+        controller.request_search_pages(
+            {'method': 'method-name'}, 'parent', 'list', None
+        )
+
+
+def test_request_search_pages_without_results(mocker):
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {
+        'results': {'parent': {'list': []}, 'opensearch:totalResults': '0'}
+    }
+    mock_request = mocker.patch.object(
+        RequestController, 'request', return_value=mock_response
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.request_search_pages(
+        {'method': 'method-name'}, 'parent', 'list', 100
+    )
+    ##
+    assert response == []
+    mock_request.assert_called_once_with({
+        'method': 'method-name',
+        'limit': LIMIT_SEARCH,
+        'page': 1,
+    })
+
+
 def test_request_search_pages_from_cache(mocker):
     user_agent_test = 'user_agent_test'
     api_key_test = 'api_key_test'
@@ -658,6 +1357,7 @@ def test_request_search_pages_amount_higher_than_limit_lower_than_total(
             call({'method': 'method-name', 'limit': LIMIT_SEARCH, 'page': 2}),
             call({'method': 'method-name', 'limit': LIMIT_SEARCH, 'page': 3}),
         ],
+        any_order=True,
     )
     assert len(response) == 3  # noqa: PLR2004
     _list = []
@@ -706,6 +1406,7 @@ def test_request_search_pages_amount_higher_than_limit_higher_than_total(
             call({'method': 'method-name', 'limit': LIMIT_SEARCH, 'page': 3}),
             call({'method': 'method-name', 'limit': LIMIT_SEARCH, 'page': 4}),
         ],
+        any_order=True,
     )
     assert len(response) == total_pages
     _list = []
@@ -752,27 +1453,39 @@ def test_clear_cache_(mocker):
 ##############################################################################
 
 
+def _search_responses(mocker, pages, parent_key='parent', list_key='list'):
+    """Builds a mocked search response for each list of item names."""
+    mock_responses = []
+    for names in pages:
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            'results': {
+                parent_key: {list_key: [{'name': name} for name in names]},
+                'opensearch:totalResults': str(
+                    sum(len(names) for names in pages)
+                ),
+            }
+        }
+        mock_responses.append(mock_response)
+    return mock_responses
+
+
 def test_get_search_data(mocker):
     user_agent_test = 'user_agent_test'
     api_key_test = 'api_key_test'
 
-    amount_responses = 5
     payload = {'method': 'test'}
     parent_key = 'parent'
     list_key = 'list'
     amount = 10
 
-    mock_response = mocker.Mock().return_value
-    mock_response.json.return_value = {
-        'results': {
-            parent_key: {list_key: [{'name': 'item1'}, {'name': 'item2'}]}
-        }
-    }
-    mock_responses = [mock_response] * amount_responses
     mock_request_search_pages = mocker.patch.object(
         RequestController, 'request_search_pages'
     )
-    mock_request_search_pages.return_value = mock_responses
+    mock_request_search_pages.return_value = _search_responses(
+        mocker,
+        [[f'item{page}-{index}' for index in range(2)] for page in range(5)],
+    )
 
     ###
     controller = RequestController(user_agent_test, api_key_test)
@@ -786,16 +1499,9 @@ def test_get_search_data(mocker):
         payload, parent_key, list_key, amount
     )
     assert response == [
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
+        {'name': f'item{page}-{index}'}
+        for page in range(5)
+        for index in range(2)
     ]
 
 
@@ -804,23 +1510,18 @@ def test_get_search_data_amount_not_divisible_by_limit(mocker):
     user_agent_test = 'user_agent_test'
     api_key_test = 'api_key_test'
 
-    amount_responses = 5
     payload = {'method': 'test'}
     parent_key = 'parent'
     list_key = 'list'
     amount = 9
 
-    mock_response = mocker.Mock().return_value
-    mock_response.json.return_value = {
-        'results': {
-            parent_key: {list_key: [{'name': 'item1'}, {'name': 'item2'}]}
-        }
-    }
-    mock_responses = [mock_response] * amount_responses
     mock_request_search_pages = mocker.patch.object(
         RequestController, 'request_search_pages'
     )
-    mock_request_search_pages.return_value = mock_responses
+    mock_request_search_pages.return_value = _search_responses(
+        mocker,
+        [[f'item{page}-{index}' for index in range(2)] for page in range(5)],
+    )
 
     ###
     controller = RequestController(user_agent_test, api_key_test)
@@ -833,14 +1534,146 @@ def test_get_search_data_amount_not_divisible_by_limit(mocker):
     mock_request_search_pages.assert_called_with(
         payload, parent_key, list_key, amount
     )
+    assert (
+        response
+        == [
+            {'name': f'item{page}-{index}'}
+            for page in range(5)
+            for index in range(2)
+        ][:amount]
+    )
+
+
+def test_get_search_data_amount_divisible_by_limit(mocker):
+    mocker.patch('pylastfmapi.request.LIMIT_SEARCH', 2)
+    mocker.patch.object(
+        RequestController,
+        'request_search_pages',
+        return_value=_search_responses(mocker, [['a', 'b'], ['c', 'd']]),
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.get_search_data(
+        {'method': 'test'}, 'parent', 'list', 4
+    )
+    ##
     assert response == [
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
-        {'name': 'item2'},
-        {'name': 'item1'},
+        {'name': 'a'},
+        {'name': 'b'},
+        {'name': 'c'},
+        {'name': 'd'},
+    ]
+
+
+def test_get_search_data_drops_repeated_items(mocker):
+    mocker.patch.object(
+        RequestController,
+        'request_search_pages',
+        return_value=_search_responses(
+            mocker, [['a', 'b', 'c'], ['c', 'd', 'a'], ['e', 'f', 'g']]
+        ),
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.get_search_data(
+        {'method': 'test'}, 'parent', 'list', 5
+    )
+    ##
+    assert response == [
+        {'name': 'a'},
+        {'name': 'b'},
+        {'name': 'c'},
+        {'name': 'd'},
+        {'name': 'e'},
     ]
+
+
+def test_get_search_data_drops_repeated_items_by_url(mocker):
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = {
+        'results': {
+            'parent': {
+                'list': [
+                    {'name': 'Nirvana', 'url': 'url/Nirvana'},
+                    {'name': 'Nirvana', 'url': 'url/+noredirect/Nirvana'},
+                    {'name': 'Nirvana', 'url': 'url/Nirvana'},
+                ]
+            },
+            'opensearch:totalResults': '3',
+        }
+    }
+    mocker.patch.object(
+        RequestController, 'request_search_pages', return_value=[mock_response]
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = controller.get_search_data(
+        {'method': 'test'}, 'parent', 'list', None
+    )
+    ##
+    assert [item['url'] for item in response] == [
+        'url/Nirvana',
+        'url/+noredirect/Nirvana',
+    ]
+
+
+def test_get_search_data_with_search_cache(mocker):
+    mock_request_search_pages = mocker.patch.object(
+        RequestController,
+        'request_search_pages',
+        return_value=_search_responses(
+            mocker,
+            [['Radiohead', 'Ra Ra Riot', 'Dead Radio']],
+            list_key='artist',
+        ),
+    )
+    controller = RequestController(
+        'user_agent_test', 'api_key_test', search_cache=SearchCache()
+    )
+    controller.get_search_data(
+        {'method': 'test', 'artist': 'ra'}, 'parent', 'artist', None
+    )
+    ##
+    response = controller.get_search_data(
+        {'method': 'test', 'artist': 'Radio'},
+        'parent',
+        'artist',
+        None,
+        fields=['name'],
+    )
+    ##
+    mock_request_search_pages.assert_called_once_with(
+        {'method': 'test', 'artist': 'ra'}, 'parent', 'artist', None
+    )
+    assert response == [{'name': 'Radiohead'}, {'name': 'Dead Radio'}]
+
+
+def test_get_search_data_with_incomplete_search_cache(mocker):
+    mock_responses = _search_responses(
+        mocker, [['Radiohead', 'Ra Ra Riot']], list_key='artist'
+    )
+    mock_responses[0].json.return_value['results'][
+        'opensearch:totalResults'
+    ] = '100'
+    mock_request_search_pages = mocker.patch.object(
+        RequestController, 'request_search_pages', return_value=mock_responses
+    )
+    controller = RequestController(
+        'user_agent_test', 'api_key_test', search_cache=SearchCache()
+    )
+    controller.get_search_data(
+        {'method': 'test', 'artist': 'ra'}, 'parent', 'artist', 2
+    )
+    ##
+    response = controller.get_search_data(
+        {'method': 'test', 'artist': 'RA'}, 'parent', 'artist', 1
+    )
+    controller.get_search_data(
+        {'method': 'test', 'artist': 'radio'}, 'parent', 'artist', 1
+    )
+    ##
+    assert response == [{'name': 'Radiohead'}]
+    assert mock_request_search_pages.call_count == 2  # noqa: PLR2004
+    mock_request_search_pages.assert_called_with(
+        {'method': 'test', 'artist': 'radio'}, 'parent', 'artist', 1
+    )
@@ -0,0 +1,205 @@
+import pytest
+
+from pylastfmapi.constants import ARTIST_SEARCH, TRACK_SEARCH
+from pylastfmapi.request import RequestController
+from pylastfmapi.search import SearchIndex
+
+ARTISTS = [
+    {'name': 'Radiohead', 'listeners': '5000000', 'mbid': 'a', 'url': 'u'},
+    {'name': 'Radio Moscow', 'listeners': '10000', 'streamable': '0'},
+    {'name': 'Röyksopp', 'listeners': '1000000'},
+]
+TRACKS = [
+    {'name': 'Creep', 'artist': {'name': 'Radiohead'}, 'playcount': '5'},
+    {'name': 'Creep', 'artist': 'TLC', 'listeners': '100'},
+]
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.add('artists', ARTISTS)
+    index.add('tracks', TRACKS)
+    return index
+
+
+#########################################################################
+# SearchIndex
+#########################################################################
+
+
+def test_search_index_add(index):
+    ##
+    response = index.add(
+        'artists',
+        [
+            {'name': 'Radiohead', 'listeners': '1'},
+            {'name': 'Massive Attack', 'listeners': '2000000'},
+        ],
+    )
+    ##
+    assert response == 1
+    assert len(index) == 6  # noqa: PLR2004
+    assert index.search('artists', 'radiohead')[0] == (
+        {'name': 'Radiohead', 'listeners': '5000000'},
+        1,
+    )
+    assert index.search('tracks', 'creep', artist='radiohead') == [
+        ({'name': 'Creep', 'artist': 'Radiohead'}, 1)
+    ]
+
+
+def test_search_index_search_prefix(index):
+    ##
+    response = index.search('artists', 'radio')
+    ##
+    assert [item['name'] for item, _ in response] == [
+        'Radiohead',
+        'Radio Moscow',
+        'Röyksopp',
+    ]
+    assert [similarity for _, similarity in response[:2]] == [1, 1]
+    assert index.search('artists', 'radio', amount=1) == response[:1]
+
+
+def test_search_index_search_ignores_case_and_accents(index):
+    ##
+    response = index.search('artists', 'ROYKSOPP', amount=1)
+    ##
+    assert response == [({'name': 'Röyksopp', 'listeners': '1000000'}, 1)]
+
+
+def test_search_index_search_typo(index):
+    ##
+    response = index.search('artists', 'Radiohed')
+    ##
+    assert response[0] == (ARTISTS[0], 0.875)
+
+
+def test_search_index_search_without_results(index):
+    assert index.search('artists', 'zzz') == []
+    assert index.search('artists', '') == []
+    assert index.search('albums', 'radio') == []
+
+
+def test_search_index_lookup(index):
+    ##
+    response = index.lookup('artists', 'Radiohed', amount=1)
+    ##
+    assert response == [ARTISTS[0]]
+    assert index.lookup('artists', 'Radiohed', amount=2) is None
+    assert index.lookup('artists', 'Radiohed', amount=None) is None
+    assert index.lookup('artists', 'Radoihead', amount=1) is None
+    assert index.lookup(
+        'artists', 'Radoihead', amount=1, min_similarity=0.5
+    ) == [ARTISTS[0]]
+
+
+def test_search_index_find_locally(mocker, index):
+    mock_search = mocker.patch.object(RequestController, 'get_search_data')
+    ##
+    response = index.find(
+        RequestController('user_agent_test', 'api_key_test'),
+        'artists',
+        'radio',
+        amount=1,
+    )
+    ##
+    assert response == [ARTISTS[0]]
+    mock_search.assert_not_called()
+
+
+def test_search_index_find_from_the_api(mocker, index):
+    return_value = [{'name': 'Creep', 'artist': 'Stone Temple Pilots'}]
+    mock_search = mocker.patch.object(
+        RequestController, 'get_search_data', return_value=return_value
+    )
+    request_controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    response = index.find(
+        request_controller, 'tracks', 'Creep', artist='Stone Temple Pilots'
+    )
+    ##
+    mock_search.assert_called_once_with(
+        {
+            'method': TRACK_SEARCH,
+            'track': 'Creep',
+            'artist': 'Stone Temple Pilots',
+        },
+        'trackmatches',
+        'track',
+        None,
+    )
+    assert response == return_value
+    assert (
+        index.lookup('tracks', 'creep', amount=1, artist='stone temple pilots')
+        == return_value
+    )
+
+
+@pytest.mark.parametrize('amount', [3, None])
+def test_search_index_find_merges_local_and_api(mocker, index, amount):
+    return_value = [
+        {'name': 'Radio Moscow', 'listeners': '10000', 'url': 'u'},
+        {'name': 'Radiohead', 'listeners': '5000000', 'url': 'u'},
+        {'name': 'Radio Birdman', 'listeners': '50000', 'url': 'u'},
+    ]
+    mock_search = mocker.patch.object(
+        RequestController, 'get_search_data', return_value=return_value
+    )
+    ##
+    response = index.find(
+        RequestController('user_agent_test', 'api_key_test'),
+        'artists',
+        'radio',
+        amount=amount,
+    )
+    ##
+    mock_search.assert_called_once_with(
+        {'method': ARTIST_SEARCH, 'artist': 'radio'},
+        'artistmatches',
+        'artist',
+        amount,
+    )
+    assert [item['name'] for item in response] == [
+        'Radiohead',
+        'Radio Moscow',
+        'Radio Birdman',
+    ]
+    assert len(index) == 6  # noqa: PLR2004
+
+
+def test_search_index_find_low_confidence(mocker, index):
+    mock_search = mocker.patch.object(
+        RequestController, 'get_search_data', return_value=[]
+    )
+    ##
+    response = index.find(
+        RequestController('user_agent_test', 'api_key_test'),
+        'artists',
+        'Portishead',
+        amount=5,
+    )
+    ##
+    mock_search.assert_called_once_with(
+        {'method': ARTIST_SEARCH, 'artist': 'Portishead'},
+        'artistmatches',
+        'artist',
+        5,
+    )
+    assert response == []
+
+
+def test_search_index_save_and_load(tmp_path, index):
+    path = tmp_path / 'index.json'
+    ##
+    index.save(path)
+    response = SearchIndex.load(path)
+    ##
+    assert len(response) == len(index)
+    assert response.search('artists', 'radio') == index.search(
+        'artists', 'radio'
+    )
+    assert response.search('tracks', 'creep') == index.search(
+        'tracks', 'creep'
+    )
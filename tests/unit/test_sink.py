@@ -0,0 +1,42 @@
+import json
+
+from pylastfmapi.models import Artist
+from pylastfmapi.sink import JSONLinesSink
+
+#########################################################################
+# JSONLinesSink
+#########################################################################
+
+
+def test_json_lines_sink(tmp_path):
+    path = tmp_path / 'charts.jsonl'
+    sink = JSONLinesSink(path)
+    ##
+    sink.write('user1', '7day', 'artists', [{'name': 'Artist'}])
+    sink.write('user1', '7day', 'tracks', [Artist(name='Artist', rank=1)])
+    ##
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines[0] == {
+        'user': 'user1',
+        'period': '7day',
+        'chart': 'artists',
+        'items': [{'name': 'Artist'}],
+    }
+    assert lines[1]['items'][0]['rank'] == 1
+    assert ('user1', '7day', 'tracks') in sink
+    assert ('user1', 'overall', 'tracks') not in sink
+    assert len(sink) == 2  # noqa: PLR2004
+
+
+def test_json_lines_sink_reload_with_incomplete_line(tmp_path):
+    path = tmp_path / 'charts.jsonl'
+    JSONLinesSink(path).write('user1', 'overall', 'artists', [])
+    with path.open('a') as file:
+        file.write('{"user": "user2", "per')
+    ##
+    sink = JSONLinesSink(path)
+    sink.write('user3', 'overall', 'artists', [])
+    ##
+    assert ('user1', 'overall', 'artists') in sink
+    assert ('user2', 'overall', 'artists') not in sink
+    assert len(path.read_text().splitlines()) == 2  # noqa: PLR2004
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from pylastfmapi.columnar import ScrobbleColumns
+from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.stats import (
+    DAY,
+    HOUR,
+    day_of_week,
+    distinct_growth,
+    hour_of_day,
+    local_timestamps,
+    sessions,
+    streaks,
+)
+
+# 2024-01-01 00:00:00 UTC, a Monday.
+MONDAY = 1704067200
+
+
+@pytest.fixture
+def columns():
+    columns = ScrobbleColumns()
+    for uts, artist, album, track in [
+        (MONDAY + 2 * DAY + HOUR, 'Artist 2', 'Album 2', 'Track 3'),
+        (MONDAY + HOUR, 'Artist 1', 'Album 1', 'Track 1'),
+        (MONDAY + HOUR + 600, 'Artist 1', '', 'Track 2'),
+        (MONDAY + DAY + 2 * HOUR, 'Artist 2', 'Album 1', 'Track 1'),
+        (MONDAY + HOUR + 1200, 'Artist 1', 'Album 1', 'Track 1'),
+    ]:
+        columns.add(uts, artist, album, track)
+    return columns
+
+
+def test_local_timestamps_follows_daylight_saving_time():
+    # 2024-03-10 07:00 UTC is 2:00 EST, when New York moved to EDT.
+    timestamps = np.array([1710054000 - 1, 1710054000], dtype=np.int64)
+    ##
+    response = local_timestamps(timestamps, 'America/New_York')
+    ##
+    assert (timestamps - response).tolist() == [5 * HOUR, 4 * HOUR]
+    assert local_timestamps(timestamps).tolist() == timestamps.tolist()
+
+
+def test_local_timestamps_with_unknown_timezone():
+    ##
+    with pytest.raises(LastFMException, match='Unknown timezone'):
+        local_timestamps(np.array([MONDAY]), 'Mars/Olympus_Mons')
+
+
+def test_hour_of_day(columns):
+    ##
+    response = hour_of_day(columns)
+    ##
+    assert response.tolist() == [0, 4, 1] + [0] * 21
+    assert hour_of_day(columns, 'America/Sao_Paulo')[22:].tolist() == [4, 1]
+
+
+def test_day_of_week(columns):
+    ##
+    response = day_of_week(columns)
+    ##
+    assert response.tolist() == [3, 1, 1, 0, 0, 0, 0]
+    assert day_of_week(columns, 'America/Sao_Paulo').tolist() == [
+        1,
+        1,
+        0,
+        0,
+        0,
+        0,
+        3,
+    ]
+
+
+def test_sessions(columns):
+    ##
+    response = sessions(columns, gap=600)
+    ##
+    assert response['start'].tolist() == [
+        MONDAY + HOUR,
+        MONDAY + DAY + 2 * HOUR,
+        MONDAY + 2 * DAY + HOUR,
+    ]
+    assert response['end'].tolist() == [
+        MONDAY + HOUR + 1200,
+        MONDAY + DAY + 2 * HOUR,
+        MONDAY + 2 * DAY + HOUR,
+    ]
+    assert response['scrobbles'].tolist() == [3, 1, 1]
+    assert sessions(columns, gap=599)['scrobbles'].tolist() == [1, 1, 1, 1, 1]
+
+
+def test_streaks(columns):
+    columns.add(MONDAY + 5 * DAY, 'Artist 1', 'Album 1', 'Track 1')
+    ##
+    response = streaks(columns)
+    ##
+    assert response['start'].astype(str).tolist() == [
+        '2024-01-01',
+        '2024-01-06',
+    ]
+    assert response['days'].tolist() == [3, 1]
+    assert streaks(columns, 'America/Sao_Paulo')['start'].astype(
+        str
+    ).tolist() == ['2023-12-31', '2024-01-05']
+
+
+@pytest.mark.parametrize(
+    ('chart', 'expected'),
+    [
+        ('artists', [1, 1, 1, 2, 2]),
+        ('albums', [1, 1, 1, 2, 3]),
+        ('tracks', [1, 2, 2, 3, 4]),
+    ],
+)
+def test_distinct_growth(columns, chart, expected):
+    ##
+    response = distinct_growth(columns, chart)
+    ##
+    assert response['timestamp'].tolist() == sorted(columns.timestamps)
+    assert response['distinct'].tolist() == expected
+
+
+def test_stats_without_scrobbles():
+    columns = ScrobbleColumns()
+    ##
+    response = sessions(columns)
+    ##
+    assert not response['start'].size
+    assert not streaks(columns)['days'].size
+    assert not distinct_growth(columns)['distinct'].size
+    assert not hour_of_day(columns).sum()
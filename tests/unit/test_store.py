@@ -0,0 +1,256 @@
+import pytest
+
+from pylastfmapi.store import MemoryScrobbleStore, SQLiteScrobbleStore
+
+
+def _scrobble(name, uts, artist='Artist Name', album='Album Name'):
+    return {
+        'name': name,
+        'artist': {'#text': artist},
+        'album': {'#text': album},
+        'date': {'uts': str(uts)},
+    }
+
+
+@pytest.fixture
+def sqlite_store(mocker):
+    mocker.patch('pylastfmapi.store.STORE_BATCH_SIZE', 2)
+    store = SQLiteScrobbleStore(':memory:')
+    store.add(
+        'user',
+        [
+            {'name': 'Now Playing', '@attr': {'nowplaying': 'true'}},
+            _scrobble('Track 1', 100, 'Artist A', 'Album A'),
+            _scrobble('Track 2', 200, 'Artist A', 'Album B'),
+            _scrobble('Track 1', 300, 'Artist A', 'Album A'),
+            _scrobble('Track 3', 400, 'Artist B', ''),
+        ],
+    )
+    store.add('other', [_scrobble('Track 3', 500, 'Artist B')])
+    return store
+
+
+#########################################################################
+# MemoryScrobbleStore
+#########################################################################
+
+
+def test_memory_scrobble_store_add():
+    store = MemoryScrobbleStore()
+    ##
+    response = store.add(
+        'user',
+        [
+            {'name': 'Now Playing', '@attr': {'nowplaying': 'true'}},
+            _scrobble('Track 1', 1700000100),
+            _scrobble('Track 2', 1700000200),
+        ],
+    )
+    ##
+    assert response == 2  # noqa: PLR2004
+    assert store.last_timestamp('user') == 1700000200  # noqa: PLR2004
+    assert [item['name'] for item in store.get('user')] == [
+        'Track 2',
+        'Track 1',
+    ]
+
+
+def test_memory_scrobble_store_add_skips_stored_scrobbles():
+    store = MemoryScrobbleStore()
+    store.add('user', [_scrobble('Track 1', 1700000100)])
+    ##
+    response = store.add(
+        'user',
+        [
+            _scrobble('Track 1', 1700000100),
+            _scrobble('Track 1', 1700000100, artist='Other Artist'),
+        ],
+    )
+    ##
+    assert response == 1
+    assert len(store.get('user')) == 2  # noqa: PLR2004
+
+
+def test_memory_scrobble_store_without_scrobbles():
+    store = MemoryScrobbleStore()
+    ##
+    assert store.last_timestamp('user') is None
+    assert store.get('user') == []
+    assert 'user' not in store
+    assert store.users() == []
+
+
+def test_memory_scrobble_store_users():
+    store = MemoryScrobbleStore()
+    store.add('user1', [_scrobble('Track 1', 1700000100)])
+    store.add('user2', [_scrobble('Track 1', 1700000200)])
+    ##
+    assert store.users() == ['user1', 'user2']
+    assert store.last_timestamp('user1') == 1700000100  # noqa: PLR2004
+    assert 'user2' in store
+
+
+def test_memory_scrobble_store_columns():
+    store = MemoryScrobbleStore()
+    store.add('user', [_scrobble('Track 2', 200), _scrobble('Track 1', 100)])
+    ##
+    response = store.columns('user')
+    ##
+    assert list(response.timestamps) == [100, 200]
+    assert response.tracks.values == ['Track 1', 'Track 2']
+    assert not store.columns('unknown')
+
+
+#########################################################################
+# SQLiteScrobbleStore
+#########################################################################
+
+
+def test_sqlite_scrobble_store_add(sqlite_store):
+    ##
+    response = sqlite_store.add(
+        'user',
+        [
+            _scrobble('Track 3', 400, 'Artist B', ''),
+            {
+                'name': 'Track 4',
+                'artist': {'name': 'Artist B', 'url': ''},
+                'date': {'uts': '600'},
+            },
+        ],
+    )
+    ##
+    assert response == 1
+    assert sqlite_store.last_timestamp('user') == 600  # noqa: PLR2004
+    assert sqlite_store.users() == ['user', 'other']
+    assert 'user' in sqlite_store
+    assert 'unknown' not in sqlite_store
+    assert sqlite_store.last_timestamp('unknown') is None
+
+
+def test_sqlite_scrobble_store_get(sqlite_store):
+    ##
+    response = sqlite_store.get('user', timestamp_from=200, amount=2)
+    ##
+    assert response == [
+        {
+            'name': 'Track 3',
+            'artist': {'#text': 'Artist B'},
+            'album': {'#text': ''},
+            'date': {'uts': '400'},
+        },
+        {
+            'name': 'Track 1',
+            'artist': {'#text': 'Artist A'},
+            'album': {'#text': 'Album A'},
+            'date': {'uts': '300'},
+        },
+    ]
+    assert [item['date']['uts'] for item in sqlite_store.get('user')] == [
+        '400',
+        '300',
+        '200',
+        '100',
+    ]
+
+
+def test_sqlite_scrobble_store_columns(sqlite_store):
+    ##
+    response = sqlite_store.columns('user')
+    ##
+    assert list(response.timestamps) == [100, 200, 300, 400]
+    assert response.albums.values == ['Album A', 'Album B', '']
+    assert response.top('albums', 100, 400) == [
+        {
+            'name': 'Album A',
+            'artist': {'name': 'Artist A'},
+            'playcount': '2',
+            '@attr': {'rank': '1'},
+        },
+        {
+            'name': 'Album B',
+            'artist': {'name': 'Artist A'},
+            'playcount': '1',
+            '@attr': {'rank': '2'},
+        },
+    ]
+
+
+def test_sqlite_scrobble_store_count(sqlite_store):
+    ##
+    response = sqlite_store.count('user', artist='Artist A', timestamp_to=250)
+    ##
+    assert response == 2  # noqa: PLR2004
+    assert sqlite_store.count('user') == 4  # noqa: PLR2004
+    assert sqlite_store.count('unknown') == 0
+
+
+def test_sqlite_scrobble_store_range_excludes_the_end(sqlite_store):
+    ##
+    response = sqlite_store.get('user', timestamp_from=200, timestamp_to=400)
+    ##
+    assert [item['date']['uts'] for item in response] == ['300', '200']
+    assert sqlite_store.count('user', 200, 400) == 2  # noqa: PLR2004
+    assert sqlite_store.top('user', 'artists', 200, 400) == [
+        {'name': 'Artist A', 'playcount': 2}
+    ]
+    assert sqlite_store.columns('user').top('artists', 200, 400) == [
+        {'name': 'Artist A', 'playcount': '2', '@attr': {'rank': '1'}}
+    ]
+
+
+@pytest.mark.parametrize(
+    ('chart', 'expected'),
+    [
+        (
+            'artists',
+            [
+                {'name': 'Artist A', 'playcount': 3},
+                {'name': 'Artist B', 'playcount': 1},
+            ],
+        ),
+        (
+            'albums',
+            [
+                {'name': 'Album A', 'artist': 'Artist A', 'playcount': 2},
+                {'name': 'Album B', 'artist': 'Artist A', 'playcount': 1},
+            ],
+        ),
+        (
+            'tracks',
+            [
+                {'name': 'Track 1', 'artist': 'Artist A', 'playcount': 2},
+                {'name': 'Track 2', 'artist': 'Artist A', 'playcount': 1},
+            ],
+        ),
+    ],
+)
+def test_sqlite_scrobble_store_top(sqlite_store, chart, expected):
+    ##
+    response = sqlite_store.top('user', chart, amount=2)
+    ##
+    assert response == expected
+
+
+def test_sqlite_scrobble_store_loved_tracks_and_library(tmp_path):
+    store = SQLiteScrobbleStore(tmp_path / 'store.db')
+    loved = [
+        {'name': 'Track', 'artist': {'name': 'Artist'}, 'date': {'uts': '1'}},
+        {'name': 'Other', 'artist': {'name': 'Artist'}, 'date': {'uts': '2'}},
+    ]
+    ##
+    added = store.add_loved_tracks('user', loved + loved)
+    store.add_library_artists('user', [{'name': 'Artist', 'playcount': '3'}])
+    store.add_library_artists('user', [{'name': 'Artist', 'playcount': '5'}])
+    store.close()
+    ##
+    store = SQLiteScrobbleStore(tmp_path / 'store.db')
+    assert added == 2  # noqa: PLR2004
+    assert store.loved_tracks('user') == [
+        {'name': 'Other', 'artist': 'Artist', 'uts': 2},
+        {'name': 'Track', 'artist': 'Artist', 'uts': 1},
+    ]
+    assert store.library_artists('user') == [
+        {'name': 'Artist', 'playcount': 5}
+    ]
+    assert store.users() == []
@@ -0,0 +1,176 @@
+from math import ceil
+
+import pytest
+
+from pylastfmapi.constants import (
+    TAG_GETSIMILAR,
+    TAG_GETTOPARTISTS,
+    TAG_INDEX_AMOUNT,
+)
+from pylastfmapi.exceptions import LastFMException
+from pylastfmapi.request import RequestController
+from pylastfmapi.tags import CHARTS, TagIndex
+
+TAGS = {
+    'rock': {
+        'artist': ['Artist A', 'Artist B'],
+        'similar': ['Indie'],
+    },
+    'indie': {
+        'artist': ['Artist B', 'Artist C', 'Artist D', 'Artist E'],
+        'similar': [],
+    },
+    'empty': {
+        'artist': [],
+        'similar': ['Rock'],
+    },
+}
+
+
+@pytest.fixture
+def mock_tags(mocker):
+    """Serves the tag endpoints from `TAGS`, a page at a time."""
+
+    def _request(payload):
+        if payload['tag'] not in TAGS:
+            raise LastFMException('Tag not found')
+        tag = TAGS[payload['tag']]
+        response = mocker.Mock()
+        if payload['method'] == TAG_GETSIMILAR:
+            response.json.return_value = {
+                'similartags': {
+                    'tag': [{'name': name} for name in tag['similar']]
+                }
+            }
+            return response
+        _, parent_key, list_key = next(
+            keys for keys in CHARTS.values() if keys[0] == payload['method']
+        )
+        if list_key == 'artist':
+            items = [{'name': name} for name in tag['artist']]
+        else:
+            items = [
+                {'name': f'{list_key} {index}', 'artist': {'name': 'Artist A'}}
+                for index in range(2 if tag['artist'] else 0)
+            ]
+        page, limit = payload['page'], payload['limit']
+        response.json.return_value = {
+            parent_key: {
+                list_key: items[(page - 1) * limit : page * limit],
+                '@attr': {'totalPages': str(max(ceil(len(items) / limit), 1))},
+            }
+        }
+        return response
+
+    return mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+
+
+@pytest.fixture
+def index(mock_tags):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    index = TagIndex()
+    index.refresh(controller, ['Rock', 'indie', 'unknown'], workers=2)
+    return index
+
+
+#########################################################################
+# TagIndex
+#########################################################################
+
+
+def test_tag_index_refresh(mock_tags):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    index = TagIndex()
+    ##
+    updated = index.refresh(controller, ['Rock', 'rock', 'unknown'])
+    ##
+    assert updated == 1
+    assert 'ROCK' in index
+    assert 'unknown' not in index
+    assert index.similar['rock'] == ['indie']
+    assert index.top(['rock']) == [
+        {'name': 'Artist A', 'weight': 1.0},
+        {'name': 'Artist B', 'weight': 0.5},
+    ]
+    mock_tags.assert_any_call({
+        'method': TAG_GETTOPARTISTS,
+        'tag': 'rock',
+        'limit': TAG_INDEX_AMOUNT,
+        'page': 1,
+    })
+
+
+def test_tag_index_refresh_without_items(mock_tags):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    index = TagIndex()
+    ##
+    updated = index.refresh(controller, ['empty'])
+    ##
+    assert updated == 0
+    assert 'empty' not in index
+    assert index.stale(['empty']) == ['empty']
+
+
+def test_tag_index_refresh_only_stale_tags(index, mock_tags):
+    controller = RequestController('user_agent_test', 'api_key_test')
+    mock_tags.reset_mock()
+    ##
+    updated = index.refresh(controller, ['rock', 'jazz'])
+    ##
+    assert updated == 0
+    assert {call.args[0]['tag'] for call in mock_tags.call_args_list} == {
+        'jazz'
+    }
+    assert index.stale(['rock', 'jazz'], max_age=-1) == ['rock', 'jazz']
+
+
+def test_tag_index_top_union(index):
+    ##
+    response = index.top(['rock', 'indie'], amount=2)
+    ##
+    assert response == [
+        {'name': 'Artist B', 'weight': 1.5},
+        {'name': 'Artist A', 'weight': 1.0},
+    ]
+
+
+def test_tag_index_top_intersection(index):
+    ##
+    response = index.top(['rock', 'indie'], mode='intersection')
+    ##
+    assert response == [{'name': 'Artist B', 'weight': 1.5}]
+
+
+def test_tag_index_top_with_similar_tags(index):
+    ##
+    response = index.top(['rock'], similar_weight=0.5)
+    ##
+    assert [item['name'] for item in response] == [
+        'Artist A',
+        'Artist B',
+        'Artist C',
+        'Artist D',
+        'Artist E',
+    ]
+    assert response[1]['weight'] == pytest.approx(1.0)
+
+
+def test_tag_index_top_tracks(index):
+    ##
+    response = index.top(['rock'], chart='tracks', amount=1)
+    ##
+    assert response == [
+        {'name': 'track 0', 'artist': 'Artist A', 'weight': 1.0}
+    ]
+
+
+def test_tag_index_save_and_load(index, tmp_path):
+    index.save(tmp_path / 'tags.json')
+    ##
+    loaded = TagIndex.load(tmp_path / 'tags.json')
+    ##
+    assert loaded.updated == index.updated
+    assert loaded.top(['rock', 'indie']) == index.top(['rock', 'indie'])
+    assert loaded.top(['rock'], 'albums') == index.top(['rock'], 'albums')
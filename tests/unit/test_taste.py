@@ -0,0 +1,134 @@
+from math import ceil
+
+import numpy as np
+import pytest
+
+from pylastfmapi.constants import TASTE_AMOUNT, USER_GETTOPARTISTS
+from pylastfmapi.exceptions import RequestErrorException
+from pylastfmapi.request import RequestController
+from pylastfmapi.taste import TasteMatrix
+
+
+def _artists(**playcounts):
+    return [
+        {'name': name, 'playcount': str(playcount)}
+        for name, playcount in playcounts.items()
+    ]
+
+
+@pytest.fixture
+def matrix():
+    return TasteMatrix.from_charts([
+        ('user1', _artists(A=3, B=4)),
+        ('user2', _artists(A=6)),
+        ('user3', _artists(B=1, C=1)),
+        ('user4', _artists(D=2)),
+        ('user5', []),
+    ])
+
+
+def test_taste_matrix_from_charts(matrix):
+    ##
+    response = list(matrix.indptr), list(matrix.indices), list(matrix.weights)
+    ##
+    assert response == (
+        [0, 2, 3, 5, 6, 6],
+        [0, 1, 0, 1, 2, 3],
+        [3, 4, 6, 1, 1, 2],
+    )
+    assert matrix.artists.values == ['A', 'B', 'C', 'D']
+    assert len(matrix) == 5  # noqa: PLR2004
+    assert 'user5' in matrix
+    assert 'unknown' not in matrix
+
+
+def test_taste_matrix_similarity(matrix):
+    ##
+    response = matrix.similarity('user1', 'user2')
+    ##
+    assert response == pytest.approx(0.6)
+    assert matrix.similarity('user1', 'user3') == pytest.approx(
+        0.8 / np.sqrt(2)
+    )
+    assert matrix.similarity('user1', 'user1') == pytest.approx(1)
+    assert not matrix.similarity('user1', 'user4')
+    assert not matrix.similarity('user5', 'user1')
+
+
+def test_taste_matrix_blocks(matrix):
+    ##
+    response = list(matrix.blocks(block_size=2))
+    ##
+    assert [start for start, _ in response] == [0, 2, 4]
+    assert [block.shape for _, block in response] == [(2, 5), (2, 5), (1, 5)]
+    scores = np.vstack([block for _, block in response])
+    assert scores.dtype == np.float32
+    assert np.allclose(scores, scores.T)
+    assert np.allclose(np.diag(scores), [1, 1, 1, 1, 0])
+
+
+def test_taste_matrix_most_similar(matrix):
+    ##
+    response = dict(matrix.most_similar(amount=1, block_size=3))
+    ##
+    assert response['user1'] == [('user2', pytest.approx(0.6))]
+    assert response['user3'] == [('user1', pytest.approx(0.8 / np.sqrt(2)))]
+    assert response['user2'] == [('user1', pytest.approx(0.6))]
+    assert response['user4'] == []
+    assert list(response) == ['user1', 'user2', 'user3', 'user4', 'user5']
+
+
+def test_taste_matrix_similar(matrix):
+    ##
+    response = matrix.similar('user1')
+    ##
+    assert response == [
+        ('user2', pytest.approx(0.6)),
+        ('user3', pytest.approx(0.8 / np.sqrt(2))),
+    ]
+    with pytest.raises(KeyError):
+        matrix.similar('unknown')
+
+
+def test_taste_matrix_fetch(mocker):
+    artists = 150
+
+    def _request(payload):
+        if payload['user'] == 'user3':
+            raise RequestErrorException('User not found, error 6')
+        start = (payload['page'] - 1) * payload['limit']
+        response = mocker.Mock()
+        response.json.return_value = {
+            'topartists': {
+                'artist': _artists(**{
+                    f'A{index}': artists - index
+                    for index in range(
+                        start, min(start + payload['limit'], artists)
+                    )
+                }),
+                '@attr': {'totalPages': ceil(artists / payload['limit'])},
+            }
+        }
+        return response
+
+    mock_request = mocker.patch.object(
+        RequestController, 'request', side_effect=_request
+    )
+    controller = RequestController('user_agent_test', 'api_key_test')
+    ##
+    matrix = TasteMatrix.fetch(
+        controller, ['user1', 'user2', 'user3', 'user1'], '7day'
+    )
+    ##
+    assert mock_request.call_count == 3  # noqa: PLR2004
+    mock_request.assert_any_call({
+        'method': USER_GETTOPARTISTS,
+        'user': 'user1',
+        'period': '7day',
+        'limit': TASTE_AMOUNT,
+        'page': 1,
+    })
+    assert matrix.failed == ['user3']
+    assert sorted(matrix.users) == ['user1', 'user2']
+    assert list(matrix.indptr) == [0, TASTE_AMOUNT, 2 * TASTE_AMOUNT]
+    assert matrix.similarity('user1', 'user2') == pytest.approx(1)
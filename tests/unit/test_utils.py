@@ -1,9 +1,21 @@
+import json
 from datetime import datetime
 
 import pytest
 
-from pylastfmapi.exceptions import LastFMException
-from pylastfmapi.utils import get_timestamp
+from pylastfmapi.exceptions import LastFMException, RequestErrorException
+from pylastfmapi.utils import (
+    entity_key,
+    get_timestamp,
+    intern_strings,
+    is_now_playing,
+    iter_concurrently,
+    normalize_name,
+    parse_entity_key,
+    project_fields,
+    scrobble_key,
+    unique_scrobbles,
+)
 
 #########################################################################
 # get_timestamp
@@ -69,3 +81,243 @@ def test_get_timestamp_date_with_format_with_hour(
     assert response[1] == int(
         datetime.strptime(date_to, format_to).timestamp()
     )
+
+
+#########################################################################
+# project_fields
+#########################################################################
+
+
+def test_project_fields():
+    item = {
+        'name': 'Track Name',
+        'mbid': '',
+        'image': [{'#text': 'url', 'size': 'small'}],
+        'date': {'uts': '1700000000', '#text': '14 Nov 2023, 22:13'},
+        'artist': {'name': 'Artist Name', 'mbid': ''},
+    }
+    ##
+    response = project_fields(item, ['name', 'date.uts', 'artist.name'])
+    ##
+    assert response == {
+        'name': 'Track Name',
+        'date': {'uts': '1700000000'},
+        'artist': {'name': 'Artist Name'},
+    }
+
+
+def test_project_fields_with_missing_fields():
+    item = {'name': 'Track Name', '@attr': {'nowplaying': 'true'}}
+    ##
+    response = project_fields(item, ['name', 'date.uts', 'playcount'])
+    ##
+    assert response == {'name': 'Track Name'}
+
+
+def test_project_fields_with_list():
+    items = [{'name': 'item1', 'url': 'url1'}, {'name': 'item2'}]
+    ##
+    response = project_fields(items, ['name'])
+    ##
+    assert response == [{'name': 'item1'}, {'name': 'item2'}]
+
+
+@pytest.mark.parametrize('fields', [None, []])
+def test_project_fields_without_fields(fields):
+    item = {'name': 'item1', 'url': 'url1'}
+    ##
+    response = project_fields(item, fields)
+    ##
+    assert response is item
+
+
+#########################################################################
+# intern_strings
+#########################################################################
+
+
+def test_intern_strings():
+    items = json.loads(
+        '[{"artist": {"name": "Artist Name"}, "album": "Album Name"},'
+        ' {"artist": {"name": "Artist Name"}, "album": "Album Name"}]'
+    )
+    strings = {}
+    ##
+    response = intern_strings(items, strings)
+    ##
+    assert response == items
+    assert response[0]['artist']['name'] is response[1]['artist']['name']
+    assert response[0]['album'] is response[1]['album']
+    assert strings == {
+        'artist': 'artist',
+        'name': 'name',
+        'Artist Name': 'Artist Name',
+        'album': 'album',
+        'Album Name': 'Album Name',
+    }
+
+
+def test_intern_strings_keeps_other_values():
+    item = {'playcount': 10, 'match': 0.5, 'streamable': None}
+    ##
+    response = intern_strings(item, {})
+    ##
+    assert response == item
+
+
+#########################################################################
+# is_now_playing
+#########################################################################
+
+
+@pytest.mark.parametrize(
+    ('item', 'expected'),
+    [
+        ({'name': 'Track', '@attr': {'nowplaying': 'true'}}, True),
+        ({'name': 'Track'}, True),
+        ({'name': 'Track', 'date': {'uts': '1700000000'}}, False),
+    ],
+)
+def test_is_now_playing(item, expected):
+    ##
+    assert is_now_playing(item) is expected
+
+
+#########################################################################
+# scrobble_key
+#########################################################################
+
+
+@pytest.mark.parametrize(
+    'artist', [{'#text': 'Artist Name'}, {'name': 'Artist Name', 'url': ''}]
+)
+def test_scrobble_key(artist):
+    item = {'name': 'Track', 'artist': artist, 'date': {'uts': '1700000000'}}
+    ##
+    response = scrobble_key(item)
+    ##
+    assert response == (1700000000, 'Artist Name', 'Track')
+
+
+#########################################################################
+# entity_key and parse_entity_key
+#########################################################################
+
+
+@pytest.mark.parametrize(
+    ('item', 'expected'),
+    [
+        ({'name': 'Artist Name', 'listeners': '10'}, 'Artist Name'),
+        ({'name': 'Track', 'artist': {'name': 'Artist'}}, 'Artist\tTrack'),
+        ({'name': 'Album', 'artist': 'Artist'}, 'Artist\tAlbum'),
+    ],
+)
+def test_entity_key(item, expected):
+    ##
+    response = entity_key(item)
+    ##
+    assert response == expected
+    assert parse_entity_key(response) == {
+        'name': item['name'],
+        **({'artist': 'Artist'} if 'artist' in item else {}),
+    }
+
+
+#########################################################################
+# normalize_name
+#########################################################################
+
+
+@pytest.mark.parametrize(
+    ('name', 'expected'),
+    [
+        ('Röyksopp', 'royksopp'),
+        ('  AC/DC ', 'ac dc'),
+        ('Beyoncé - Halo!', 'beyonce halo'),
+        ('', ''),
+    ],
+)
+def test_normalize_name(name, expected):
+    assert normalize_name(name) == expected
+
+
+#########################################################################
+# unique_scrobbles
+#########################################################################
+
+
+def _scrobble(name, uts):
+    return {'name': name, 'artist': {'#text': 'Artist'}, 'date': {'uts': uts}}
+
+
+def test_unique_scrobbles():
+    items = [
+        {'name': 'Now Playing', '@attr': {'nowplaying': 'true'}},
+        _scrobble('Track 3', '300'),
+        _scrobble('Track 2', '200'),
+        _scrobble('Track 2', '200'),
+        _scrobble('Track 1', '100'),
+    ]
+    ##
+    response = list(unique_scrobbles(items))
+    ##
+    assert [item['name'] for item in response] == [
+        'Track 3',
+        'Track 2',
+        'Track 1',
+    ]
+
+
+def test_unique_scrobbles_with_window():
+    items = [
+        _scrobble('Track 3', '300'),
+        _scrobble('Track 2', '200'),
+        _scrobble('Track 1', '100'),
+        _scrobble('Track 3', '300'),
+    ]
+    ##
+    response = list(unique_scrobbles(items, window=2))
+    ##
+    assert len(response) == len(items)
+
+
+#########################################################################
+# iter_concurrently
+#########################################################################
+
+
+def test_iter_concurrently():
+    calls = []
+
+    def _square(key):
+        calls.append(key)
+        return key**2
+
+    ##
+    response = dict(iter_concurrently(_square, [1, 2, 3, 2, 1, 4], workers=2))
+    ##
+    assert response == {1: 1, 2: 4, 3: 9, 4: 16}
+    assert sorted(calls) == [1, 2, 3, 4]
+
+
+def test_iter_concurrently_with_errors():
+    error = RequestErrorException('Something wrong')
+
+    def _request(key):
+        if key == 'error':
+            raise error
+        return key
+
+    ##
+    response = dict(iter_concurrently(_request, ['ok', 'error']))
+    ##
+    assert response == {'ok': 'ok', 'error': error}
+
+
+def test_iter_concurrently_raises_other_errors():
+    def _request(key):
+        raise KeyError(key)
+
+    ##
+    with pytest.raises(KeyError):
+        _ = list(iter_concurrently(_request, ['key']))